@@ -17,7 +17,7 @@ python manage.py collectstatic --no-input
 echo "[3/5] Running migrations..."
 python manage.py migrate
 
-# 4. 이벤트 데이터 import (CSV/Excel)
+# 4. 이벤트 데이터 import (CSV/Excel, 바뀐 이벤트만 upsert)
 echo "[4/5] Importing event data..."
 python manage.py import_mokkoji_events
 
@@ -97,6 +97,26 @@ else:
     }
 
 
+# Cache
+# 여러 프로세스/인스턴스로 운영할 때는 REDIS_URL 설정 (알림 스트림 브로커도 같은 Redis 사용)
+# 미설정 시 프로세스별 메모리 캐시 - 캐시 무효화가 다른 워커에 전파되지 않음
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -195,3 +215,41 @@ NAVER_REDIRECT_URI = os.getenv('NAVER_REDIRECT_URI', 'http://localhost:8000/api/
 GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID', '')
 GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET', '')
 GOOGLE_REDIRECT_URI = os.getenv('GOOGLE_REDIRECT_URI', 'http://localhost:8000/api/auth/google/callback/')
+
+
+# 이벤트 좌표 geocoding (임포트 시 좌표가 없는 행)
+# 기본값은 번들 gazetteer(시/군/구 대표 좌표)만 사용하는 로컬 geocoder
+GEOCODER_BACKEND = os.getenv('GEOCODER_BACKEND', 'events.geocoding.GazetteerGeocoder')
+GEOCODER_RATE_LIMIT = float(os.getenv('GEOCODER_RATE_LIMIT', '5'))  # 초당 최대 요청 수
+GEOCODER_BATCH_SIZE = int(os.getenv('GEOCODER_BATCH_SIZE', '50'))
+
+
+# 사업자 대시보드/지원 통계 캐시 (초, 지원서 변경 시 즉시 무효화)
+PARTNER_STATS_CACHE_TIMEOUT = int(os.getenv('PARTNER_STATS_CACHE_TIMEOUT', '300'))
+
+
+# PDF 리포트 한글 폰트 (TTF 경로, 쉼표로 구분, 앞에서부터 처음 등록되는 파일 사용)
+# 비우면 partners.pdf_generator의 기본 경로(Nanum/Noto/맑은 고딕)를 찾고, 없으면 ReportLab 내장 CID 폰트 사용
+PDF_FONT_PATHS = [path.strip() for path in os.getenv('PDF_FONT_PATHS', '').split(',') if path.strip()]
+PDF_BOLD_FONT_PATHS = [path.strip() for path in os.getenv('PDF_BOLD_FONT_PATHS', '').split(',') if path.strip()]
+
+
+# 성과 리포트 전체 다운로드 (/api/partners/analytics/export-all/) 요청당 동시 생성 수
+ANALYTICS_EXPORT_WORKERS = int(os.getenv('ANALYTICS_EXPORT_WORKERS', '2'))
+
+
+# 알림/메시지 실시간 스트림 (/api/partners/notifications/stream/, ASGI로 실행)
+# 기본값은 프로세스당 DB 폴러 하나로 연결된 사용자만 깨움 (REDIS_URL 설정 시 Redis pub/sub)
+NOTIFICATION_STREAM_BACKEND = os.getenv(
+    'NOTIFICATION_STREAM_BACKEND',
+    'partners.streaming.RedisBroker' if REDIS_URL else 'partners.streaming.DatabasePollingBroker'
+)
+NOTIFICATION_STREAM_POLL_INTERVAL = float(os.getenv('NOTIFICATION_STREAM_POLL_INTERVAL', '2'))  # 초
+NOTIFICATION_STREAM_HEARTBEAT = int(os.getenv('NOTIFICATION_STREAM_HEARTBEAT', '15'))  # 초
+NOTIFICATION_STREAM_MAX_DURATION = int(os.getenv('NOTIFICATION_STREAM_MAX_DURATION', '300'))  # 초, 이후 재연결
+NOTIFICATION_STREAM_LONG_POLL_TIMEOUT = int(os.getenv('NOTIFICATION_STREAM_LONG_POLL_TIMEOUT', '25'))  # 초
+NOTIFICATION_STREAM_RETRY_MS = 3000  # 재연결 대기 (EventSource retry)
+# 커서(마지막 id) 아래 다시 조회할 id 범위 (id 순서와 커밋 순서가 다른 행 - 늦게 커밋된 트랜잭션 - 보정)
+NOTIFICATION_STREAM_RESCAN_WINDOW = int(os.getenv('NOTIFICATION_STREAM_RESCAN_WINDOW', '200'))
+# EventSource 연결용 일회용 티켓 유효 시간 (POST /api/partners/notifications/stream-ticket/)
+NOTIFICATION_STREAM_TICKET_TTL = int(os.getenv('NOTIFICATION_STREAM_TICKET_TTL', '60'))  # 초
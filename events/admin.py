@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Event
+from .models import Event, EventMergeCandidate
 
 
 @admin.register(Event)
@@ -9,3 +9,11 @@ class EventAdmin(admin.ModelAdmin):
     search_fields = ['name', 'description', 'location']
     date_hierarchy = 'start_date'
     ordering = ['-start_date']
+
+
+@admin.register(EventMergeCandidate)
+class EventMergeCandidateAdmin(admin.ModelAdmin):
+    list_display = ['primary', 'duplicate_name', 'similarity', 'distance_km', 'status', 'created_at']
+    list_filter = ['status']
+    search_fields = ['primary__name', 'duplicate_name']
+    raw_id_fields = ['primary', 'duplicate']
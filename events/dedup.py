@@ -0,0 +1,162 @@
+"""
+이벤트 유사 중복 탐지 (MinHash + LSH)
+- 이름을 정규화(연도/회차/괄호/공백 제거)해 2글자 shingle 집합으로 변환
+- MinHash 시그니처를 밴드로 나눠 같은 버킷에 들어간 쌍만 비교 -> 카탈로그 크기에 거의 선형
+- 후보 쌍은 이름 Jaccard 유사도, 기간 겹침, 좌표 거리로 최종 판정
+
+Django 설정 없이 import 가능 (events.sources와 동일)
+"""
+
+import math
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+
+import numpy as np
+
+
+NUM_PERM = 64
+BANDS = 16  # 밴드당 4행 -> 유사도 약 0.5부터 후보로 잡힘
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+
+_BRACKETS = re.compile(r'[(\[{<〈《「『【][^)\]}>〉》」』】]*[)\]}>〉》」』】]')
+_YEAR_OR_EDITION = re.compile(r'(?:19|20)\d{2}년?|제?\d+회|\d+(?:st|nd|rd|th)\b')
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]')
+
+
+def normalize_name(name):
+    """
+    비교용 이름 정규화
+
+    예: '2024 서울 빛초롱 축제 (청계천)' -> '서울빛초롱축제'
+    """
+    name = unicodedata.normalize('NFKC', name or '').casefold()
+    stripped = _NON_WORD.sub('', _YEAR_OR_EDITION.sub(' ', _BRACKETS.sub(' ', name)))
+    # 괄호/연도를 빼면 아무것도 안 남는 이름은 그대로 비교
+    return stripped or _NON_WORD.sub('', name)
+
+
+def name_shingles(name, k=2):
+    text = normalize_name(name)
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def jaccard(left, right):
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+class MinHasher:
+    """shingle 집합 -> MinHash 시그니처 (고정 seed라 실행 간 결과 동일)"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles):
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        return ((np.outer(self.a, hashes) + self.b[:, None]) % MERSENNE_PRIME).min(axis=1)
+
+
+def lsh_candidate_pairs(signatures, bands=BANDS):
+    """
+    LSH 밴딩으로 후보 쌍 추출
+
+    Args:
+        signatures: {id: MinHash 시그니처}
+
+    Returns:
+        set: 한 밴드라도 같은 버킷에 들어간 (작은 id, 큰 id) 쌍
+    """
+    pairs = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for item_id, signature in signatures.items():
+            rows = len(signature) // bands
+            buckets[signature[band * rows:(band + 1) * rows].tobytes()].append(item_id)
+        for members in buckets.values():
+            for i, left in enumerate(members):
+                for right in members[i + 1:]:
+                    pairs.add((left, right) if left < right else (right, left))
+    return pairs
+
+
+def dates_overlap(left, right, tolerance_days=3):
+    """두 이벤트 기간이 겹치는지 (tolerance_days 만큼 어긋나도 겹친 것으로 봄)"""
+    slack = timedelta(days=tolerance_days)
+    return (
+        left['start_date'] <= right['end_date'] + slack
+        and right['start_date'] <= left['end_date'] + slack
+    )
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371.0 * math.asin(math.sqrt(h))
+
+
+def find_near_duplicates(records, threshold=0.6, max_distance_km=5.0, tolerance_days=3):
+    """
+    유사 중복 이벤트 쌍 찾기
+
+    Args:
+        records: id, name, start_date, end_date, latitude, longitude 키를 가진 dict iterable
+        threshold: 이름 Jaccard 유사도 하한
+        max_distance_km: 두 이벤트 모두 좌표가 있을 때 허용 거리 (좌표가 없으면 거리 검사 생략)
+        tolerance_days: 기간 겹침 허용 오차 (일)
+
+    Returns:
+        list: {'primary', 'duplicate', 'similarity', 'distance_km'} (primary는 더 오래된 id)
+    """
+    hasher = MinHasher()
+    events = {}
+    shingles = {}
+    signatures = {}
+    for record in records:
+        item_shingles = name_shingles(record['name'])
+        if not item_shingles:
+            continue
+        events[record['id']] = record
+        shingles[record['id']] = item_shingles
+        signatures[record['id']] = hasher.signature(item_shingles)
+
+    matches = []
+    for left_id, right_id in lsh_candidate_pairs(signatures):
+        similarity = jaccard(shingles[left_id], shingles[right_id])
+        if similarity < threshold:
+            continue
+        left, right = events[left_id], events[right_id]
+        if not dates_overlap(left, right, tolerance_days):
+            continue
+
+        distance = None
+        if None not in (left['latitude'], left['longitude'], right['latitude'], right['longitude']):
+            distance = haversine_km(
+                left['latitude'], left['longitude'], right['latitude'], right['longitude']
+            )
+            if distance > max_distance_km:
+                continue
+
+        matches.append({
+            'primary': left_id,
+            'duplicate': right_id,
+            'similarity': round(similarity, 3),
+            'distance_km': round(distance, 2) if distance is not None else None,
+        })
+
+    matches.sort(key=lambda match: (-match['similarity'], match['primary'], match['duplicate']))
+    return matches
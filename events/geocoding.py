@@ -0,0 +1,284 @@
+"""
+이벤트 좌표 geocoding
+- 주소(address) -> 지역명(location) 순으로 좌표 조회
+- 외부 provider 조회 결과(결과 없음 포함)는 GeocodeCache 테이블에 저장 -> 재임포트 시 provider 호출 없음
+- provider는 settings.GEOCODER_BACKEND로 교체 가능 (기본값: 번들 gazetteer만 쓰는 로컬 geocoder)
+- provider도 실패하면 번들 gazetteer의 시/군/구(없으면 시/도) 대표 좌표로 fallback
+
+번들 gazetteer 범위:
+- 시/도 17곳 (시·도청 소재지), 시/군/구는 번들 이벤트 데이터에 나오는 50곳뿐 (이벤트 좌표 평균)
+- 그 밖의 시/군/구는 시/도 대표 좌표로 대체되므로 실제 위치와 수십 km 차이날 수 있음
+  -> fallback 건수는 시/군/구, 시/도 단위로 따로 집계 (EventGeocoder.stats)
+"""
+
+import json
+import os
+import re
+import time
+from functools import lru_cache
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .models import GeocodeCache
+
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.json')
+
+# 시/도 표기 -> gazetteer 키
+SIDO_ALIASES = {
+    '서울특별시': '서울', '서울시': '서울', '서울': '서울',
+    '부산광역시': '부산', '부산시': '부산', '부산': '부산',
+    '대구광역시': '대구', '대구시': '대구', '대구': '대구',
+    '인천광역시': '인천', '인천시': '인천', '인천': '인천',
+    '광주광역시': '광주', '광주시': '광주', '광주': '광주',
+    '대전광역시': '대전', '대전시': '대전', '대전': '대전',
+    '울산광역시': '울산', '울산시': '울산', '울산': '울산',
+    '세종특별자치시': '세종', '세종시': '세종', '세종': '세종',
+    '경기도': '경기', '경기': '경기',
+    '강원특별자치도': '강원', '강원도': '강원', '강원': '강원',
+    '충청북도': '충북', '충북': '충북',
+    '충청남도': '충남', '충남': '충남',
+    '전북특별자치도': '전북', '전라북도': '전북', '전북': '전북',
+    '전라남도': '전남', '전남': '전남',
+    '경상북도': '경북', '경북': '경북',
+    '경상남도': '경남', '경남': '경남',
+    '제주특별자치도': '제주', '제주도': '제주', '제주': '제주',
+}
+
+
+def normalize_query(text):
+    """캐시 키용 주소 정규화 (공백 통일, 괄호 안 부가정보 제거)"""
+    text = re.sub(r'\([^)]*\)', ' ', text or '')
+    return re.sub(r'\s+', ' ', text).strip()[:300]
+
+
+@lru_cache(maxsize=1)
+def load_gazetteer():
+    with open(GAZETTEER_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_region(text):
+    """
+    주소/지역명에서 (시/도, 시/군/구) 추출
+
+    예: '서울특별시 중구 세종대로 110' -> ('서울', '중구')
+        '경기 의정부' -> ('경기', '의정부시')
+    """
+    tokens = normalize_query(text).split()
+    if not tokens or tokens[0] not in SIDO_ALIASES:
+        return None, None
+    sido = SIDO_ALIASES[tokens[0]]
+    if len(tokens) < 2:
+        return sido, None
+
+    sigungu = tokens[1]
+    if not re.search(r'[시군구]$', sigungu):
+        sigungu += '시'
+    return sido, sigungu
+
+
+def match_region(text):
+    """
+    gazetteer 기반 지역 대표 좌표 (시/군/구 -> 시/도 순)
+
+    Returns:
+        ((latitude, longitude), 'sigungu' 또는 'sido') 또는 없으면 (None, None)
+    """
+    sido, sigungu = parse_region(text)
+    if not sido:
+        return None, None
+    gazetteer = load_gazetteer()
+    if sigungu:
+        coords = gazetteer['sigungu'].get(f'{sido} {sigungu}')
+        if coords:
+            return tuple(coords), 'sigungu'
+    coords = gazetteer['sido'].get(sido)
+    return (tuple(coords), 'sido') if coords else (None, None)
+
+
+def region_centroid(text):
+    """gazetteer 기반 지역 대표 좌표 (시/군/구 -> 시/도 순), 없으면 None"""
+    return match_region(text)[0]
+
+
+class BaseGeocoder:
+    """geocoding provider 기본 클래스"""
+
+    name = 'base'
+    # 외부 API 호출 여부 (False면 rate limit/캐시 없이 바로 호출)
+    remote = True
+    # 결과가 gazetteer 지역 대표 좌표뿐인지 (True면 조회 없이 fallback 단계에서 처리)
+    approximate = False
+
+    def geocode(self, query):
+        """
+        Returns:
+            (latitude, longitude) 또는 결과가 없으면 None
+        """
+        raise NotImplementedError
+
+
+class GazetteerGeocoder(BaseGeocoder):
+    """번들 gazetteer만 사용하는 로컬 geocoder (외부 호출 없음)"""
+
+    name = 'gazetteer'
+    remote = False
+    approximate = True
+
+    def geocode(self, query):
+        return region_centroid(query)
+
+
+class KakaoGeocoder(BaseGeocoder):
+    """카카오 로컬 주소 검색 API (KAKAO_CLIENT_ID = REST API 키)"""
+
+    name = 'kakao'
+    API_URL = 'https://dapi.kakao.com/v2/local/search/address.json'
+
+    def __init__(self, api_key=None, timeout=5):
+        self.api_key = api_key or settings.KAKAO_CLIENT_ID
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def geocode(self, query):
+        response = self.session.get(
+            self.API_URL,
+            params={'query': query},
+            headers={'Authorization': f'KakaoAK {self.api_key}'},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        try:
+            documents = response.json().get('documents', [])
+            if not documents:
+                return None
+            return float(documents[0]['y']), float(documents[0]['x'])
+        except (KeyError, ValueError, IndexError, TypeError, AttributeError) as e:
+            # 형식이 깨진 응답 - 일시적인 오류와 같이 처리 (캐시하지 않고 gazetteer 좌표로 대체)
+            raise requests.RequestException(f'카카오 주소 검색 응답 형식 오류: {e!r}') from e
+
+
+class RateLimiter:
+    """초당 최대 요청 수 제한"""
+
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0
+        self._last_call = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        remaining = self._last_call + self.interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._last_call = time.monotonic()
+
+
+class EventGeocoder:
+    """
+    임포트 파이프라인의 geocoding 단계
+
+    좌표가 없는 행들을 받아 캐시 -> provider -> gazetteer 순으로 좌표를 채움
+    """
+
+    def __init__(self, provider=None, rate_limit=None, batch_size=None):
+        self.provider = provider or import_string(settings.GEOCODER_BACKEND)()
+        self.limiter = RateLimiter(
+            settings.GEOCODER_RATE_LIMIT if rate_limit is None else rate_limit
+        )
+        self.batch_size = batch_size or settings.GEOCODER_BATCH_SIZE
+        # fallback: gazetteer 대표 좌표로 대체한 건수 (시/군구 단위, 시/도 단위 - 시/도 단위는 오차가 큼)
+        self.stats = {
+            'cache_hits': 0, 'provider_calls': 0,
+            'sigungu_fallbacks': 0, 'sido_fallbacks': 0, 'unresolved': 0,
+        }
+
+    def lookup(self, queries):
+        """
+        주소 목록 좌표 조회 (캐시에 없는 것만 provider 호출 후 캐시에 저장)
+
+        Returns:
+            dict: {query: (latitude, longitude) 또는 None}
+        """
+        queries = list(dict.fromkeys(q for q in queries if q))
+        results = {}
+        for start in range(0, len(queries), self.batch_size):
+            batch = queries[start:start + self.batch_size]
+            cached = GeocodeCache.objects.filter(query__in=batch)
+            for entry in cached:
+                coords = None
+                if entry.latitude is not None and entry.longitude is not None:
+                    coords = (entry.latitude, entry.longitude)
+                results[entry.query] = coords
+                self.stats['cache_hits'] += 1
+
+            new_entries = []
+            for query in batch:
+                if query in results:
+                    continue
+                if self.provider.remote:
+                    self.limiter.wait()
+                self.stats['provider_calls'] += 1
+                try:
+                    coords = self.provider.geocode(query)
+                except requests.RequestException:
+                    # 일시적인 오류는 캐시하지 않음 (다음 임포트에서 재시도)
+                    results[query] = None
+                    continue
+                results[query] = coords
+                if not self.provider.remote:
+                    continue  # 로컬 provider 결과는 캐시하지 않음 (provider 교체 시 오염 방지)
+                new_entries.append(GeocodeCache(
+                    query=query,
+                    latitude=coords[0] if coords else None,
+                    longitude=coords[1] if coords else None,
+                    provider=self.provider.name,
+                ))
+            GeocodeCache.objects.bulk_create(new_entries, ignore_conflicts=True)
+        return results
+
+    def fill_coordinates(self, rows):
+        """
+        좌표가 없는 행(Event 필드 dict)에 좌표 채우기 (in-place)
+
+        Returns:
+            int: 좌표를 채운 행 수
+        """
+        missing = [
+            fields for fields in rows
+            if fields.get('latitude') is None or fields.get('longitude') is None
+        ]
+        if not missing:
+            return 0
+
+        # 주소로 먼저 조회하고, 실패한 행만 지역명으로 다시 조회
+        results = {}
+        if not self.provider.approximate:
+            results = self.lookup(normalize_query(fields.get('address')) for fields in missing)
+            retry = [
+                normalize_query(fields.get('location')) for fields in missing
+                if not results.get(normalize_query(fields.get('address')))
+            ]
+            results.update(self.lookup(q for q in retry if q not in results))
+
+        filled = 0
+        for fields in missing:
+            coords = (
+                results.get(normalize_query(fields.get('address')))
+                or results.get(normalize_query(fields.get('location')))
+            )
+            if not coords:
+                coords, level = match_region(fields.get('address'))
+                if not coords:
+                    coords, level = match_region(fields.get('location'))
+                if coords:
+                    self.stats[f'{level}_fallbacks'] += 1
+            if not coords:
+                self.stats['unresolved'] += 1
+                continue
+            fields['latitude'], fields['longitude'] = coords
+            filled += 1
+        return filled
@@ -0,0 +1,338 @@
+"""
+이벤트 임포트 공통 로직
+- 해시가 바뀐 행만 갱신하는 upsert
+- 자연키가 없는 기존 이벤트 보정
+- PostgreSQL COPY + INSERT ... ON CONFLICT 기반 bulk upsert
+- 유사 중복으로 병합된 이벤트의 자연키는 다시 생성하지 않음 (merge_events 참고)
+
+소스 파일 파싱/정규화는 events.sources 참고
+"""
+
+import io
+from datetime import date
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Event, EventMergeCandidate
+from .sources import EVENT_FIELDS, content_hash, natural_key
+
+
+class UpsertReport:
+    """
+    upsert 결과 (diff 리포트)
+    - 건수는 항상 집계, 행별 상세는 collect_details=True일 때만 보관
+    """
+
+    def __init__(self, collect_details=True):
+        self.collect_details = collect_details
+        self.counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'retired': 0, 'duplicates': 0}
+        self.details = {'created': [], 'updated': [], 'retired': []}
+
+    def record(self, kind, **detail):
+        self.counts[kind] += 1
+        if self.collect_details and kind in self.details:
+            self.details[kind].append(detail)
+
+    @property
+    def created(self):
+        return self.counts['created']
+
+    @property
+    def updated(self):
+        return self.counts['updated']
+
+    @property
+    def unchanged(self):
+        return self.counts['unchanged']
+
+    @property
+    def retired(self):
+        return self.counts['retired']
+
+    @property
+    def duplicates(self):
+        return self.counts['duplicates']
+
+    def as_dict(self):
+        return {'summary': dict(self.counts), **self.details}
+
+
+class EventUpserter:
+    """
+    정규화된 이벤트 행을 모아 배치 단위로 upsert
+
+    - 자연키가 DB에 없으면 생성, 콘텐츠 해시가 다르면 갱신, 같으면 건너뜀
+    - 기존 Event id가 유지되므로 북마크/리뷰/지원서가 그대로 남음
+    - 행마다 소스 파일 이름(source_file)을 기록해, retire_missing은 이번에 읽은 소스의 이벤트만 삭제
+    """
+
+    UPDATE_FIELDS = EVENT_FIELDS + ['content_hash', 'source_file', 'updated_at']
+
+    def __init__(self, batch_size=500, dry_run=False, collect_details=True, geocoder=None):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        # 좌표가 없는 행을 채울 EventGeocoder (None이면 geocoding 생략)
+        self.geocoder = geocoder
+        self.report = UpsertReport(collect_details=collect_details)
+        # 청크를 넘나드는 중복 제거용 (행 데이터 없이 키만 보관)
+        self.seen_keys = set()
+        # 병합된 중복 행이 가리키는 대표 이벤트 자연키 (retire_missing에서 유지)
+        self.merged_into = set()
+        self._pending = []
+
+    def add(self, fields, key=None, digest=None, source=''):
+        """
+        행 추가 (같은 자연키가 이미 들어왔으면 중복으로 처리)
+        - key/digest를 워커에서 미리 계산했다면 그대로 사용
+        - source: 행을 읽은 소스 파일 이름 (Event.source_file)
+        """
+        if key is None:
+            key = natural_key(fields)
+        if key in self.seen_keys:
+            self.report.record('duplicates')
+            return
+        self.seen_keys.add(key)
+        if digest is None:
+            digest = content_hash(fields)
+        self._pending.append((key, digest, source, fields))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """대기 중인 행을 DB에 반영"""
+        if not self._pending:
+            return
+
+        keys = [key for key, _, _, _ in self._pending]
+
+        # 다른 이벤트로 병합된 자연키는 대표 이벤트가 받은 것으로 처리
+        merged = merged_key_aliases(keys)
+        if merged:
+            self.merged_into.update(merged.values())
+            for key, _, _, _ in self._pending:
+                if key in merged:
+                    self.report.record('duplicates')
+            self._pending = [row for row in self._pending if row[0] not in merged]
+            keys = [key for key in keys if key not in merged]
+
+        existing = {
+            key: (pk, digest, source)
+            for pk, key, digest, source in Event.objects.filter(
+                source_key__in=keys
+            ).values_list('id', 'source_key', 'content_hash', 'source_file')
+        }
+
+        # 새로 쓰이는 행만 geocoding (변경 없는 행은 건너뜀)
+        if self.geocoder is not None:
+            self.geocoder.fill_coordinates([
+                fields for key, digest, _, fields in self._pending
+                if key not in existing or existing[key][1] != digest
+            ])
+
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        # 내용은 같지만 다른 소스 파일로 옮겨간 행 (source_file만 갱신)
+        moved = {}
+        for key, digest, source, fields in self._pending:
+            if key not in existing:
+                to_create.append(Event(source_key=key, content_hash=digest, source_file=source, **fields))
+                self.report.record('created', key=key, name=fields['name'])
+            elif existing[key][1] != digest:
+                pk = existing[key][0]
+                to_update.append(Event(
+                    id=pk, source_key=key, content_hash=digest, source_file=source, updated_at=now, **fields
+                ))
+                self.report.record('updated', id=pk, key=key, name=fields['name'])
+            else:
+                if existing[key][2] != source:
+                    moved.setdefault(source, []).append(existing[key][0])
+                self.report.record('unchanged')
+
+        if not self.dry_run:
+            with transaction.atomic():
+                Event.objects.bulk_create(to_create, batch_size=self.batch_size)
+                Event.objects.bulk_update(to_update, self.UPDATE_FIELDS, batch_size=self.batch_size)
+                for source, ids in moved.items():
+                    Event.objects.filter(id__in=ids).update(source_file=source)
+
+        self._pending = []
+
+    def retire_missing(self, sources):
+        """
+        이번 임포트에 없는(소스에서 사라진) 임포트 이벤트 삭제
+
+        Args:
+            sources: 끝까지 읽은 소스 파일 이름 목록
+                (이 소스에서 들어온 이벤트만 대상 - 읽지 못한 파일/fixture 보정 이벤트는 유지)
+        """
+        sources = [source for source in sources if source]
+        if not sources:
+            return
+
+        ids = []
+        for pk, key, name in Event.objects.filter(
+            source_key__isnull=False, source_file__in=sources
+        ).values_list('id', 'source_key', 'name').iterator():
+            if key not in self.seen_keys and key not in self.merged_into:
+                ids.append(pk)
+                self.report.record('retired', id=pk, key=key, name=name)
+
+        if ids and not self.dry_run:
+            for start in range(0, len(ids), self.batch_size):
+                Event.objects.filter(id__in=ids[start:start + self.batch_size]).delete()
+
+    def finish(self, retire_missing=False, sources=()):
+        self.flush()
+        if retire_missing:
+            self.retire_missing(sources)
+        return self.report
+
+
+def merged_key_aliases(keys=None):
+    """
+    병합된 중복 이벤트의 자연키 -> 대표 이벤트 자연키
+
+    Args:
+        keys: 조회할 자연키 목록 (None이면 전체)
+    """
+    merged = EventMergeCandidate.objects.filter(
+        status='merged', primary__source_key__isnull=False
+    ).exclude(duplicate_key='')
+    if keys is not None:
+        merged = merged.filter(duplicate_key__in=keys)
+    return dict(merged.values_list('duplicate_key', 'primary__source_key'))
+
+
+def backfill_source_keys(batch_size=500):
+    """
+    자연키가 없는 기존 이벤트(loaddata 등으로 생성)에 자연키/해시 채우기
+    - 같은 자연키가 이미 있으면 중복 행으로 보고 건너뜀
+
+    Returns:
+        int: 채운 이벤트 수
+    """
+    legacy_ids = list(
+        Event.objects.filter(source_key__isnull=True).values_list('id', flat=True)
+    )
+    filled = 0
+    for start in range(0, len(legacy_ids), batch_size):
+        batch = {}
+        for event in Event.objects.filter(id__in=legacy_ids[start:start + batch_size]):
+            fields = {name: getattr(event, name) for name in EVENT_FIELDS}
+            event.source_key = natural_key(fields)
+            event.content_hash = content_hash(fields)
+            batch.setdefault(event.source_key, event)
+
+        taken = set(
+            Event.objects.filter(source_key__in=batch.keys()).values_list('source_key', flat=True)
+        )
+        events = [event for key, event in batch.items() if key not in taken]
+        Event.objects.bulk_update(events, ['source_key', 'content_hash'])
+        filled += len(events)
+    return filled
+
+
+def _copy_value(value):
+    """COPY text 포맷 값 (NULL은 \\N, 구분자/개행 이스케이프)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return repr(value)
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def copy_upsert_events(rows, source='', chunk_size=5000):
+    """
+    PostgreSQL 전용 bulk upsert
+    - COPY로 임시 staging 테이블에 적재한 뒤 INSERT ... ON CONFLICT 한 번으로 반영
+    - 콘텐츠 해시가 같은 행은 건드리지 않음 (Event id 유지)
+    - 내용은 같지만 다른 소스 파일에서 온 행은 source_file만 갱신 (EventUpserter와 동일)
+
+    Args:
+        rows: (자연키, 콘텐츠 해시, 정규화된 필드 dict) iterable
+        source: 행을 읽은 소스 파일 이름 (Event.source_file)
+
+    Returns:
+        UpsertReport: 건수만 집계 (행별 상세 없음)
+    """
+    report = UpsertReport(collect_details=False)
+    merged_keys = set(merged_key_aliases())
+    quote = connection.ops.quote_name
+    table = quote(Event._meta.db_table)
+    staging = quote('event_seed_staging')
+    columns = ['source_key', 'content_hash', 'source_file'] + EVENT_FIELDS
+    column_sql = ', '.join(quote(column) for column in columns)
+    update_sql = ', '.join(
+        f'{quote(column)} = EXCLUDED.{quote(column)}'
+        for column in columns[1:] + ['updated_at']
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TEMP TABLE {staging} ON COMMIT DROP AS '
+            f'SELECT {column_sql} FROM {table} WITH NO DATA'
+        )
+
+        def copy_chunk(buffer):
+            buffer.seek(0)
+            cursor.copy_expert(f'COPY {staging} ({column_sql}) FROM STDIN', buffer)
+
+        seen_keys = set()
+        buffer = io.StringIO()
+        buffered = 0
+        for key, digest, fields in rows:
+            # 같은 키가 두 번 들어가면 ON CONFLICT가 실패하므로 미리 제거
+            if key in seen_keys or key in merged_keys:
+                report.record('duplicates')
+                continue
+            seen_keys.add(key)
+            values = [key, digest, source] + [fields[name] for name in EVENT_FIELDS]
+            buffer.write('\t'.join(_copy_value(value) for value in values) + '\n')
+            buffered += 1
+            if buffered >= chunk_size:
+                copy_chunk(buffer)
+                buffer = io.StringIO()
+                buffered = 0
+        if buffered:
+            copy_chunk(buffer)
+
+        # 내용은 같지만 소스 파일이 바뀐 행 (ON CONFLICT 갱신 대상이 아니므로 따로 반영)
+        cursor.execute(f'''
+            UPDATE {table} SET {quote('source_file')} = staged.{quote('source_file')}
+            FROM {staging} AS staged
+            WHERE {table}.{quote('source_key')} = staged.{quote('source_key')}
+              AND {table}.{quote('content_hash')} = staged.{quote('content_hash')}
+              AND {table}.{quote('source_file')} IS DISTINCT FROM staged.{quote('source_file')}
+        ''')
+
+        cursor.execute(f'''
+            WITH upserted AS (
+                INSERT INTO {table} ({column_sql}, created_at, updated_at)
+                SELECT {column_sql}, now(), now() FROM {staging}
+                ON CONFLICT (source_key) DO UPDATE SET {update_sql}
+                WHERE {table}.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                RETURNING (xmax = 0) AS inserted
+            )
+            SELECT
+                COUNT(*) FILTER (WHERE inserted),
+                COUNT(*) FILTER (WHERE NOT inserted)
+            FROM upserted
+        ''')
+        created, updated = cursor.fetchone()
+        # ON COMMIT DROP은 바깥 트랜잭션이 끝나야 지워지므로, 같은 트랜잭션에서 다시 호출할 수 있게 바로 삭제
+        cursor.execute(f'DROP TABLE {staging}')
+
+    report.counts['created'] = created
+    report.counts['updated'] = updated
+    report.counts['unchanged'] = len(seen_keys) - created - updated
+    return report
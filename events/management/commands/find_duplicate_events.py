@@ -0,0 +1,95 @@
+"""
+유사 중복 이벤트 탐지 명령어
+- 전체 카탈로그 이름을 MinHash/LSH로 묶고 기간 겹침/좌표 거리로 걸러 병합 후보 생성
+- 이미 검토한 후보(병합/중복 아님)는 다시 만들지 않음
+- 병합 적용은 merge_events 명령어 사용
+
+사용법:
+    python manage.py find_duplicate_events
+    python manage.py find_duplicate_events --threshold 0.7 --max-distance 3 --dry-run
+"""
+
+import time
+from django.core.management.base import BaseCommand
+from events.dedup import find_near_duplicates
+from events.models import Event, EventMergeCandidate
+
+
+class Command(BaseCommand):
+    help = '이름/기간/좌표가 비슷한 중복 이벤트를 찾아 병합 후보로 저장합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.6,
+            help='이름 유사도 하한 0~1 (기본값: 0.6)'
+        )
+        parser.add_argument(
+            '--max-distance',
+            type=float,
+            default=5.0,
+            help='두 이벤트 좌표 간 최대 거리 km (기본값: 5)'
+        )
+        parser.add_argument(
+            '--date-tolerance',
+            type=int,
+            default=3,
+            help='기간 겹침 허용 오차 일수 (기본값: 3)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='후보를 저장하지 않고 출력만 합니다'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        records = Event.objects.values(
+            'id', 'name', 'start_date', 'end_date', 'latitude', 'longitude'
+        ).iterator()
+        matches = find_near_duplicates(
+            records,
+            threshold=options['threshold'],
+            max_distance_km=options['max_distance'],
+            tolerance_days=options['date_tolerance'],
+        )
+
+        names = dict(
+            Event.objects.filter(
+                id__in={m['primary'] for m in matches} | {m['duplicate'] for m in matches}
+            ).values_list('id', 'name')
+        )
+        for match in matches:
+            distance = f"{match['distance_km']}km" if match['distance_km'] is not None else '좌표 없음'
+            self.stdout.write(
+                f"  [{match['similarity']:.2f}] #{match['primary']} {names[match['primary']]} "
+                f"⇐ #{match['duplicate']} {names[match['duplicate']]} ({distance})"
+            )
+
+        created = 0
+        if not options['dry_run']:
+            candidates = [
+                EventMergeCandidate(
+                    primary_id=match['primary'],
+                    duplicate_id=match['duplicate'],
+                    duplicate_name=names[match['duplicate']],
+                    similarity=match['similarity'],
+                    distance_km=match['distance_km'],
+                )
+                for match in matches
+            ]
+            before = EventMergeCandidate.objects.count()
+            EventMergeCandidate.objects.bulk_create(candidates, ignore_conflicts=True)
+            created = EventMergeCandidate.objects.count() - before
+
+        elapsed = time.monotonic() - started
+        self.stdout.write('\n' + '='*50)
+        self.stdout.write(f'유사 중복 쌍: {len(matches)}개 ({elapsed:.2f}초)')
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('[DRY RUN] 후보를 저장하지 않았습니다.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ 새 병합 후보: {created}개'))
+            pending = EventMergeCandidate.objects.filter(status='pending').count()
+            self.stdout.write(f'검토 대기 중인 후보: {pending}개 (적용: python manage.py merge_events)')
+        self.stdout.write('='*50)
@@ -0,0 +1,79 @@
+"""
+좌표가 없는 기존 이벤트에 좌표 채우기
+- geocoding 캐시 -> provider(settings.GEOCODER_BACKEND) -> 지역 대표 좌표 순
+- 지도(EventViewSet.map)에서 누락된 이벤트 복구용
+- 번들 gazetteer는 시/도 17곳 + 시/군/구 50곳뿐 - 그 밖의 시/군/구는 시/도 대표 좌표(수십 km 오차)로 대체되며
+  대체 건수를 시/군/구, 시/도 단위로 따로 출력
+
+사용법:
+    python manage.py geocode_events
+    python manage.py geocode_events --dry-run  # 저장하지 않고 결과만 확인
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from events.geocoding import EventGeocoder
+from events.models import Event
+
+
+class Command(BaseCommand):
+    help = (
+        '좌표가 없는 이벤트를 geocoding 합니다 '
+        '(provider 실패 시 번들 gazetteer 대표 좌표 사용 - 시/군/구는 50곳만 있고 '
+        '나머지는 시/도 중심 좌표로 대체되어 수십 km 오차가 날 수 있음)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 처리할 이벤트 수 (기본값: 200)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='DB에 저장하지 않고 결과만 출력합니다'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        geocoder = EventGeocoder()
+
+        event_ids = list(
+            Event.objects.filter(
+                Q(latitude__isnull=True) | Q(longitude__isnull=True)
+            ).values_list('id', flat=True)
+        )
+        self.stdout.write(f'좌표가 없는 이벤트: {len(event_ids)}개')
+
+        filled = 0
+        for start in range(0, len(event_ids), batch_size):
+            events = list(Event.objects.filter(id__in=event_ids[start:start + batch_size]))
+            rows = [
+                {'address': e.address, 'location': e.location,
+                 'latitude': e.latitude, 'longitude': e.longitude}
+                for e in events
+            ]
+            geocoder.fill_coordinates(rows)
+
+            resolved = []
+            for event, fields in zip(events, rows):
+                if fields['latitude'] is not None and fields['longitude'] is not None:
+                    event.latitude = fields['latitude']
+                    event.longitude = fields['longitude']
+                    resolved.append(event)
+            if resolved and not options['dry_run']:
+                Event.objects.bulk_update(resolved, ['latitude', 'longitude'])
+            filled += len(resolved)
+
+        stats = geocoder.stats
+        self.stdout.write(self.style.SUCCESS(
+            f'[OK] 좌표 채움: {filled}개'
+            + (' (dry-run, 저장 안 함)' if options['dry_run'] else '')
+        ))
+        self.stdout.write(
+            f'캐시 {stats["cache_hits"]}건, provider 호출 {stats["provider_calls"]}건, '
+            f'지역 좌표 대체 - 시/군/구 {stats["sigungu_fallbacks"]}건, 시/도 {stats["sido_fallbacks"]}건, '
+            f'미해결 {stats["unresolved"]}건'
+        )
@@ -1,20 +1,33 @@
 """
 CSV 파일에서 이벤트 데이터를 가져와 DB에 저장하는 명령어
+- 배치 단위 bulk insert (전체 임포트를 하나의 트랜잭션으로 처리)
+- 검증 실패 행은 사유와 함께 에러 리포트 CSV로 저장
+- 행별 출력 대신 진행률 표시 및 처리 속도 요약
 
 사용법:
     python manage.py import_events events.csv
     python manage.py import_events events.csv --clear  # 기존 데이터 삭제 후 임포트
+    python manage.py import_events events.csv --dry-run  # DB 반영 없이 검증만
+    python manage.py import_events events.csv --batch-size 1000 --errors rejected.csv
 """
 
 import csv
+import os
+import time
 from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, transaction
 from events.models import Event
 
 
 class Command(BaseCommand):
     help = 'CSV 파일에서 이벤트 데이터를 가져옵니다'
 
+    REQUIRED_COLUMNS = ['name', 'description', 'category', 'location', 'address',
+                        'start_date', 'end_date', 'poster_image']
+    VALID_CATEGORIES = ['festival', 'concert', 'exhibition', 'popup']
+    PROGRESS_WIDTH = 30
+
     def add_arguments(self, parser):
         parser.add_argument('csv_file', type=str, help='CSV 파일 경로')
         parser.add_argument(
@@ -22,105 +35,211 @@ class Command(BaseCommand):
             action='store_true',
             help='기존 이벤트 데이터를 모두 삭제하고 시작합니다'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 저장할 행 수 (기본값: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='DB에 저장하지 않고 검증만 수행합니다'
+        )
+        parser.add_argument(
+            '--errors',
+            type=str,
+            default=None,
+            help='거부된 행을 저장할 CSV 경로 (기본값: <csv_file>.errors.csv)'
+        )
+
+    def build_event(self, row):
+        """
+        CSV 행을 검증해 저장 전 Event 객체로 변환
+
+        Returns:
+            (Event, None) 또는 검증 실패 시 (None, 사유)
+        """
+        missing = [column for column in self.REQUIRED_COLUMNS if row.get(column) is None]
+        if missing:
+            return None, f'필수 컬럼 누락 - {", ".join(missing)}'
+
+        # 카테고리 검증
+        category = row['category'].strip()
+        if category not in self.VALID_CATEGORIES:
+            return None, (
+                f'잘못된 카테고리 "{category}". '
+                f'가능한 값: {", ".join(self.VALID_CATEGORIES)}'
+            )
+
+        try:
+            # 날짜 파싱
+            start_date = datetime.strptime(row['start_date'].strip(), '%Y-%m-%d').date()
+            end_date = datetime.strptime(row['end_date'].strip(), '%Y-%m-%d').date()
+
+            # 좌표 파싱 (선택사항)
+            latitude = None
+            longitude = None
+            if row.get('latitude') and row['latitude'].strip():
+                latitude = float(row['latitude'].strip())
+            if row.get('longitude') and row['longitude'].strip():
+                longitude = float(row['longitude'].strip())
+        except ValueError as e:
+            return None, f'데이터 형식 오류 - {e}'
+
+        name = row['name'].strip()
+        if not name:
+            return None, '이름이 비어 있습니다'
+
+        event = Event(
+            name=name,
+            description=row['description'].strip(),
+            category=category,
+            location=row['location'].strip(),
+            address=row['address'].strip(),
+            latitude=latitude,
+            longitude=longitude,
+            start_date=start_date,
+            end_date=end_date,
+            poster_image=row['poster_image'].strip(),
+            website_url=(row.get('website_url') or '').strip(),
+        )
+        return event, None
+
+    def save_batch(self, batch):
+        """
+        배치 저장 (savepoint 안에서 bulk insert)
+        - 배치가 실패하면 행 단위로 다시 저장해 문제 행만 거부
+
+        Returns:
+            (저장된 행 수, [(행 번호, 원본 행, 사유), ...])
+        """
+        try:
+            with transaction.atomic():
+                Event.objects.bulk_create([event for _, _, event in batch])
+            return len(batch), []
+        except DatabaseError:
+            pass
+
+        saved = 0
+        rejected = []
+        for row_num, row, event in batch:
+            try:
+                with transaction.atomic():
+                    event.save()
+                saved += 1
+            except DatabaseError as e:
+                rejected.append((row_num, row, f'DB 저장 실패 - {e}'))
+        return saved, rejected
+
+    def count_rows(self, csv_file):
+        """진행률 표시용 전체 행 수"""
+        with open(csv_file, 'r', encoding='utf-8-sig', newline='') as file:
+            return max(sum(1 for _ in csv.reader(file)) - 1, 0)
+
+    def show_progress(self, done, total, started):
+        elapsed = max(time.monotonic() - started, 1e-6)
+        ratio = done / total if total else 1
+        filled = int(self.PROGRESS_WIDTH * ratio)
+        bar = '#' * filled + '-' * (self.PROGRESS_WIDTH - filled)
+        self.stdout.write(
+            f'\r[{bar}] {ratio * 100:5.1f}% ({done}/{total}) {done / elapsed:,.0f} 행/초',
+            ending=''
+        )
+        self.stdout.flush()
+
+    def write_error_report(self, path, fieldnames, rejected):
+        with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+            writer = csv.DictWriter(
+                file,
+                fieldnames=['row', 'error'] + list(fieldnames or []),
+                extrasaction='ignore'
+            )
+            writer.writeheader()
+            for row_num, row, reason in rejected:
+                writer.writerow({**row, 'row': row_num, 'error': reason})
 
     def handle(self, *args, **options):
         csv_file = options['csv_file']
         clear = options['clear']
+        dry_run = options['dry_run']
+        batch_size = max(options['batch_size'], 1)
+        errors_path = options['errors'] or f'{os.path.splitext(csv_file)[0]}.errors.csv'
 
-        # 기존 데이터 삭제
-        if clear:
-            count = Event.objects.count()
-            Event.objects.all().delete()
-            self.stdout.write(
-                self.style.WARNING(f'기존 이벤트 {count}개를 삭제했습니다.')
-            )
+        try:
+            total = self.count_rows(csv_file)
+        except FileNotFoundError:
+            raise CommandError(f'파일을 찾을 수 없습니다: {csv_file}')
+
+        started = time.monotonic()
+        success_count = 0
+        rejected = []
 
         # CSV 읽기
         try:
-            with open(csv_file, 'r', encoding='utf-8') as file:
+            with open(csv_file, 'r', encoding='utf-8-sig', newline='') as file, \
+                    transaction.atomic():
                 reader = csv.DictReader(file)
 
-                success_count = 0
-                error_count = 0
+                # 기존 데이터 삭제 (임포트와 같은 트랜잭션 - 실패 시 함께 롤백)
+                if clear and not dry_run:
+                    count, _ = Event.objects.all().delete()
+                    self.stdout.write(
+                        self.style.WARNING(f'기존 이벤트 {count}개를 삭제했습니다.')
+                    )
 
+                batch = []
+                processed = 0
                 for row_num, row in enumerate(reader, start=2):
-                    try:
-                        # 카테고리 검증
-                        category = row['category'].strip()
-                        valid_categories = ['festival', 'concert', 'exhibition', 'popup']
-                        if category not in valid_categories:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f'행 {row_num}: 잘못된 카테고리 "{category}". '
-                                    f'가능한 값: {", ".join(valid_categories)}'
-                                )
-                            )
-                            error_count += 1
-                            continue
-
-                        # 날짜 파싱
-                        start_date = datetime.strptime(row['start_date'].strip(), '%Y-%m-%d').date()
-                        end_date = datetime.strptime(row['end_date'].strip(), '%Y-%m-%d').date()
-
-                        # 좌표 파싱 (선택사항)
-                        latitude = None
-                        longitude = None
-                        if row.get('latitude') and row['latitude'].strip():
-                            latitude = float(row['latitude'].strip())
-                        if row.get('longitude') and row['longitude'].strip():
-                            longitude = float(row['longitude'].strip())
-
-                        # 이벤트 생성
-                        event = Event.objects.create(
-                            name=row['name'].strip(),
-                            description=row['description'].strip(),
-                            category=category,
-                            location=row['location'].strip(),
-                            address=row['address'].strip(),
-                            latitude=latitude,
-                            longitude=longitude,
-                            start_date=start_date,
-                            end_date=end_date,
-                            poster_image=row['poster_image'].strip(),
-                            website_url=row.get('website_url', '').strip(),
-                        )
-
-                        self.stdout.write(
-                            self.style.SUCCESS(f'✓ {event.name} (행 {row_num})')
-                        )
-                        success_count += 1
-
-                    except KeyError as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f'행 {row_num}: 필수 컬럼 누락 - {e}'
-                            )
-                        )
-                        error_count += 1
-                    except ValueError as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f'행 {row_num}: 데이터 형식 오류 - {e}'
-                            )
-                        )
-                        error_count += 1
-                    except Exception as e:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f'행 {row_num}: {row.get("name", "알 수 없음")} - {e}'
-                            )
-                        )
-                        error_count += 1
-
-                # 결과 요약
-                self.stdout.write('\n' + '='*50)
-                self.stdout.write(self.style.SUCCESS(f'✓ 성공: {success_count}개'))
-                if error_count > 0:
-                    self.stdout.write(self.style.ERROR(f'✗ 실패: {error_count}개'))
-                self.stdout.write(self.style.SUCCESS(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.'))
-                self.stdout.write('='*50)
+                    processed += 1
+                    event, reason = self.build_event(row)
+                    if event is None:
+                        rejected.append((row_num, row, reason))
+                    else:
+                        batch.append((row_num, row, event))
+
+                    if len(batch) >= batch_size:
+                        if dry_run:
+                            success_count += len(batch)
+                        else:
+                            saved, failed = self.save_batch(batch)
+                            success_count += saved
+                            rejected.extend(failed)
+                        batch = []
+                        self.show_progress(processed, total, started)
+
+                if batch:
+                    if dry_run:
+                        success_count += len(batch)
+                    else:
+                        saved, failed = self.save_batch(batch)
+                        success_count += saved
+                        rejected.extend(failed)
+                self.show_progress(processed, total, started)
+                self.stdout.write('')
+
+                fieldnames = reader.fieldnames
 
-        except FileNotFoundError:
-            raise CommandError(f'파일을 찾을 수 없습니다: {csv_file}')
         except Exception as e:
             raise CommandError(f'CSV 파일 읽기 실패: {e}')
+
+        if rejected:
+            rejected.sort(key=lambda item: item[0])
+            self.write_error_report(errors_path, fieldnames, rejected)
+
+        elapsed = time.monotonic() - started
+
+        # 결과 요약
+        self.stdout.write('\n' + '='*50)
+        if dry_run:
+            self.stdout.write(self.style.WARNING('[DRY RUN] DB에 저장하지 않았습니다.'))
+            self.stdout.write(self.style.SUCCESS(f'✓ 유효: {success_count}개'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ 성공: {success_count}개'))
+        if rejected:
+            self.stdout.write(self.style.ERROR(f'✗ 실패: {len(rejected)}개 (사유: {errors_path})'))
+        self.stdout.write(
+            f'처리 시간: {elapsed:.2f}초 ({(success_count + len(rejected)) / max(elapsed, 1e-6):,.0f} 행/초)'
+        )
+        self.stdout.write(self.style.SUCCESS(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.'))
+        self.stdout.write('='*50)
@@ -4,24 +4,47 @@ CSV/Excel 파일에서 이벤트 데이터를 가져와 DB에 저장하는 명
 - title -> name 자동 변환
 - Excel 날짜 형식 자동 변환
 - 중복 데이터 체크 및 제거
+- 자연키/콘텐츠 해시 기반 upsert (바뀐 행만 갱신, Event id 유지)
+- 청크 단위 스트리밍 읽기 (CSV chunksize, XLSX read_only) - 파일 크기와 무관한 메모리 사용
+- 여러 파일/glob 지원, 프로세스 풀에서 병렬 파싱 (청크 결과를 바로 전달) 후 단일 writer가 중복 제거 및 반영
+- 좌표가 없는 행은 geocoding 캐시/provider/지역 대표 좌표로 채움 (events.geocoding)
 
 사용법:
     python manage.py import_mokkoji_events
+    python manage.py import_mokkoji_events "data/*.csv" data/extra.xlsx  # 파일/glob 지정
+    python manage.py import_mokkoji_events --workers 4  # 병렬 파싱 프로세스 수 (기본: CPU 코어 수)
     python manage.py import_mokkoji_events --clear  # 기존 데이터 삭제 후 임포트
+    python manage.py import_mokkoji_events --retire-missing  # 소스에서 사라진 이벤트 삭제 (읽지 못한 파일이 있으면 건너뜀)
+    python manage.py import_mokkoji_events --report import_report.json  # diff 리포트 저장
 """
 
-import pandas as pd
-from datetime import datetime, timedelta
+import glob
+import json
+import multiprocessing
+import queue
+from concurrent.futures import ProcessPoolExecutor
 from django.core.management.base import BaseCommand
+from django.db import connections
 from events.models import Event
-from django.db import IntegrityError
+from events.geocoding import EventGeocoder
+from events.importing import EventUpserter, backfill_source_keys
+from events.sources import EVENT_FIELDS, iter_source_chunks, normalize_row, parse_source_file
 import os
 
 
+# 워커마다 부모가 아직 꺼내지 않은 청크 결과를 최대 몇 개까지 쌓아 둘지
+QUEUED_CHUNKS = 2
+
+
 class Command(BaseCommand):
     help = 'CSV/Excel 파일에서 이벤트 데이터를 가져옵니다 (중복 제거, 날짜 변환 포함)'
 
     def add_arguments(self, parser):
+        parser.add_argument(
+            'files',
+            nargs='*',
+            help='CSV/Excel 파일 경로 또는 glob 패턴 (생략 시 --csv, 12월 CSV, --excel 파일)'
+        )
         parser.add_argument(
             '--clear',
             action='store_true',
@@ -39,70 +62,168 @@ class Command(BaseCommand):
             default='scripts/Mokkoji_events_2.xlsx',
             help='Excel 파일 경로 (기본값: scripts/Mokkoji_events_2.xlsx)'
         )
+        parser.add_argument(
+            '--retire-missing',
+            action='store_true',
+            help='이번에 읽은 소스 파일에서 사라진 (이전에 임포트된) 이벤트를 삭제합니다'
+        )
+        parser.add_argument(
+            '--report',
+            type=str,
+            default=None,
+            help='생성/갱신/삭제된 이벤트 diff 리포트를 저장할 JSON 경로'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='DB 반영 배치 크기 (기본값: 500)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='파일을 한 번에 읽을 행 수 (기본값: 1000)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='병렬 파싱 프로세스 수 (기본값: CPU 코어 수, 1이면 부모 프로세스에서 순차 처리)'
+        )
+        parser.add_argument(
+            '--no-geocode',
+            action='store_true',
+            help='좌표가 없는 행을 geocoding 하지 않습니다'
+        )
 
-    def convert_excel_date(self, value):
-        """Excel 날짜 직렬화 숫자를 날짜로 변환"""
-        if pd.isna(value):
-            return None
-
-        # 이미 날짜 형식인 경우
-        if isinstance(value, (datetime, pd.Timestamp)):
-            return value.date()
-
-        # 문자열인 경우
-        if isinstance(value, str):
-            try:
-                return datetime.strptime(value, '%Y-%m-%d').date()
-            except:
-                pass
-
-        # Excel 숫자 형식인 경우 (1900-01-01 기준)
-        try:
-            excel_epoch = datetime(1899, 12, 30)
-            return (excel_epoch + timedelta(days=float(value))).date()
-        except:
-            return None
-
-    def clean_text(self, value):
-        """텍스트 정리 (앞뒤 공백 제거, None 처리)"""
-        if pd.isna(value):
-            return ''
-        return str(value).strip()
-
-    def process_file(self, file_path, file_type='csv'):
-        """파일을 읽고 DataFrame으로 반환"""
+    def resolve_files(self, patterns):
+        """파일 경로/glob 패턴을 실제 파일 목록으로 변환 (순서 유지, 중복 제거)"""
+        files = []
+        for pattern in patterns:
+            if glob.has_magic(pattern):
+                matches = sorted(glob.glob(pattern))
+                if not matches:
+                    self.stdout.write(
+                        self.style.WARNING(f'패턴과 일치하는 파일이 없습니다: {pattern}')
+                    )
+                files.extend(matches)
+            else:
+                files.append(pattern)
+        return list(dict.fromkeys(files))
+
+    @staticmethod
+    def source_name(file_path):
+        """Event.source_file에 기록할 소스 이름 (실행 위치와 무관하도록 파일 이름만 사용)"""
+        return os.path.basename(file_path)
+
+    def process_file(self, file_path, upserter, chunk_size):
+        """
+        파일을 청크 단위로 읽어 upserter에 전달
+
+        Returns:
+            (읽은 행 수, 필수 데이터 누락으로 건너뛴 행 수) 또는 실패 시 None
+        """
         if not os.path.exists(file_path):
             self.stdout.write(
                 self.style.WARNING(f'파일을 찾을 수 없습니다: {file_path}')
             )
             return None
 
+        source = self.source_name(file_path)
+        row_count = 0
+        skip_count = 0
         try:
-            if file_type == 'csv':
-                df = pd.read_csv(file_path, encoding='utf-8')
-            else:  # excel
-                df = pd.read_excel(file_path)
-
-            self.stdout.write(
-                self.style.SUCCESS(f'[OK] {file_path} 파일 읽기 성공: {len(df)}개 행')
-            )
-            return df
+            for chunk in iter_source_chunks(file_path, chunk_size=chunk_size):
+                for row in chunk:
+                    row_count += 1
+                    fields, _reason = normalize_row(row)
+                    if fields is None:
+                        skip_count += 1
+                        continue
+                    upserter.add(fields, source=source)
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'파일 읽기 실패 ({file_path}): {e}')
             )
             return None
 
-    def normalize_dataframe(self, df):
-        """DataFrame 정규화 (컬럼명 변환 등)"""
-        # title -> name 변환
-        if 'title' in df.columns:
-            df = df.rename(columns={'title': 'name'})
-
-        # BOM 제거 (CSV 파일에서 발생할 수 있음)
-        df.columns = df.columns.str.replace('\ufeff', '')
+        self.stdout.write(
+            self.style.SUCCESS(f'[OK] {file_path} 파일 읽기 성공: {row_count}개 행')
+        )
+        return row_count, skip_count
+
+    def process_files_parallel(self, file_paths, upserter, chunk_size, workers):
+        """
+        프로세스 풀에서 파일별로 파싱/정규화하고, 청크 결과를 파일 순서대로 upserter에 전달
+        (DB 쓰기는 부모 프로세스 하나에서만 수행)
+        - 워커는 청크마다 결과를 파일별 큐에 넣고, 큐가 가득 차면 기다림
+          -> 메모리에 있는 행은 최대 workers x (QUEUED_CHUNKS + 1)개 청크
+
+        Yields:
+            (파일 경로, (읽은 행 수, 건너뛴 행 수) 또는 실패 시 None)
+        """
+        # fork된 워커가 DB 커넥션을 물려받지 않도록 정리
+        connections.close_all()
+
+        with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=workers) as executor:
+            # 작업은 파일 순서대로 워커에 배정되므로, 앞 파일을 다 꺼내면 다음 파일은 이미 처리 중
+            tasks = []
+            for file_path in file_paths:
+                batches = manager.Queue(maxsize=QUEUED_CHUNKS)
+                future = executor.submit(parse_source_file, file_path, chunk_size, batches)
+                tasks.append((file_path, batches, future))
+
+            for file_path, batches, future in tasks:
+                source = self.source_name(file_path)
+                row_count = 0
+                skip_count = 0
+                error = None
+                for kind, payload, chunk_rows, chunk_skips in self.iter_batches(batches, future):
+                    if kind == 'error':
+                        error = payload
+                        break
+                    if kind == 'done':
+                        break
+                    for key, digest, values in payload:
+                        upserter.add(dict(zip(EVENT_FIELDS, values)), key=key, digest=digest, source=source)
+                    row_count += chunk_rows
+                    skip_count += chunk_skips
+
+                if error is not None:
+                    self.stdout.write(
+                        self.style.ERROR(f'파일 읽기 실패 ({file_path}): {error}')
+                    )
+                    yield file_path, None
+                    continue
 
-        return df
+                self.stdout.write(
+                    self.style.SUCCESS(f'[OK] {file_path} 파일 읽기 성공: {row_count}개 행')
+                )
+                yield file_path, (row_count, skip_count)
+
+    @staticmethod
+    def iter_batches(batches, future, poll_interval=1):
+        """
+        워커가 넣은 큐 항목 읽기
+        (워커가 종료 항목 없이 끝나면 - 프로세스 비정상 종료 등 - 오류 항목으로 변환)
+        """
+        while True:
+            try:
+                yield batches.get(timeout=poll_interval)
+                continue
+            except queue.Empty:
+                if not future.done():
+                    continue
+            if not batches.empty():
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                yield ('error', str(e) or e.__class__.__name__, 0, 0)
+            else:
+                yield ('error', '워커가 결과 없이 종료되었습니다', 0, 0)
+            return
 
     def handle(self, *args, **options):
         clear = options['clear']
@@ -117,133 +238,95 @@ class Command(BaseCommand):
                 self.style.WARNING(f'기존 이벤트 {count}개를 삭제했습니다.')
             )
 
-        # 데이터 로드
-        dfs = []
-
-        # CSV 파일 처리 (여러 CSV 파일 지원)
-        csv_files = [
-            csv_file,
-            'scripts/Mokkoji_events_dec.csv',  # 12월 이벤트
-        ]
-        for csv_path in csv_files:
-            df_csv = self.process_file(csv_path, 'csv')
-            if df_csv is not None:
-                dfs.append(df_csv)
-
-        # Excel 파일 처리
-        df_excel = self.process_file(excel_file, 'excel')
-        if df_excel is not None:
-            dfs.append(df_excel)
-
-        if not dfs:
+        # 자연키가 없는 기존 이벤트 (fixtures 등) 보정
+        backfilled = backfill_source_keys(batch_size=options['batch_size'])
+        if backfilled:
+            self.stdout.write(f'기존 이벤트 {backfilled}개에 자연키를 채웠습니다.')
+
+        # 지정한 파일/glob, 없으면 기본 CSV 파일 (여러 CSV 파일 지원) + Excel 파일
+        source_files = self.resolve_files(options['files'])
+        if not options['files']:
+            source_files = [
+                csv_file,
+                'scripts/Mokkoji_events_dec.csv',  # 12월 이벤트
+                excel_file,
+            ]
+
+        workers = min(options['workers'] or os.cpu_count() or 1, len(source_files))
+
+        # 이벤트 upsert (청크마다 정규화 -> 중복 제거 -> 배치 반영)
+        geocoder = None if options['no_geocode'] else EventGeocoder()
+        upserter = EventUpserter(
+            batch_size=options['batch_size'],
+            collect_details=bool(options['report']),
+            geocoder=geocoder,
+        )
+        total_rows = 0
+        skip_count = 0
+        read_sources = []
+        failed_files = []
+
+        if workers > 1 and len(source_files) > 1:
+            results = self.process_files_parallel(
+                source_files, upserter, options['chunk_size'], workers
+            )
+        else:
+            results = (
+                (file_path, self.process_file(file_path, upserter, options['chunk_size']))
+                for file_path in source_files
+            )
+
+        for file_path, result in results:
+            if result is None:
+                failed_files.append(file_path)
+                continue
+            read_sources.append(self.source_name(file_path))
+            total_rows += result[0]
+            skip_count += result[1]
+
+        if not read_sources:
             self.stdout.write(
                 self.style.ERROR('읽을 수 있는 파일이 없습니다.')
             )
             return
 
-        # 데이터 합치기
-        df_combined = pd.concat(dfs, ignore_index=True)
         self.stdout.write(
-            self.style.SUCCESS(f'총 {len(df_combined)}개의 행을 로드했습니다.')
+            self.style.SUCCESS(f'총 {total_rows}개의 행을 로드했습니다.')
         )
 
-        # DataFrame 정규화
-        df_combined = self.normalize_dataframe(df_combined)
+        # 읽지 못한 파일이 있으면 그 파일의 이벤트가 모두 사라진 것으로 보이므로 삭제하지 않음
+        retire_missing = options['retire_missing'] and not failed_files
+        if options['retire_missing'] and failed_files:
+            self.stdout.write(self.style.WARNING(
+                f'읽지 못한 파일이 있어 삭제를 건너뜁니다: {", ".join(failed_files)}'
+            ))
 
-        # 중복 제거 (name, location, start_date 기준)
-        before_dedup = len(df_combined)
-        df_combined = df_combined.drop_duplicates(
-            subset=['name', 'location', 'start_date'],
-            keep='first'
-        )
-        after_dedup = len(df_combined)
-        removed = before_dedup - after_dedup
+        report = upserter.finish(retire_missing=retire_missing, sources=read_sources)
 
-        if removed > 0:
+        if report.duplicates > 0:
             self.stdout.write(
-                self.style.WARNING(f'중복 데이터 {removed}개를 제거했습니다.')
+                self.style.WARNING(f'중복 데이터 {report.duplicates}개를 제거했습니다.')
             )
 
-        # 이벤트 생성
-        success_count = 0
-        error_count = 0
-        skip_count = 0
-
-        for idx, row in df_combined.iterrows():
-            try:
-                # 필수 필드 검증
-                name = self.clean_text(row.get('name'))
-                if not name:
-                    skip_count += 1
-                    continue
-
-                # 카테고리 검증
-                category = self.clean_text(row.get('category', 'festival')).lower()
-                valid_categories = ['festival', 'concert', 'exhibition', 'popup']
-                if category not in valid_categories:
-                    category = 'festival'  # 기본값
-
-                # 날짜 변환
-                start_date = self.convert_excel_date(row.get('start_date'))
-                end_date = self.convert_excel_date(row.get('end_date'))
-
-                if not start_date or not end_date:
-                    skip_count += 1
-                    continue
-
-                # 좌표 변환
-                latitude = None
-                longitude = None
-                try:
-                    lat_val = row.get('latitude')
-                    lon_val = row.get('longitude')
-                    if not pd.isna(lat_val):
-                        latitude = float(lat_val)
-                    if not pd.isna(lon_val):
-                        longitude = float(lon_val)
-                except:
-                    pass
-
-                # 중복 체크 (DB에 이미 있는지)
-                existing = Event.objects.filter(
-                    name=name,
-                    location=self.clean_text(row.get('location')),
-                    start_date=start_date
-                ).first()
-
-                if existing:
-                    skip_count += 1
-                    continue
-
-                # 이벤트 생성
-                event = Event.objects.create(
-                    name=name,
-                    description=self.clean_text(row.get('description', '')),
-                    category=category,
-                    location=self.clean_text(row.get('location', '')),
-                    address=self.clean_text(row.get('address', '')),
-                    latitude=latitude,
-                    longitude=longitude,
-                    start_date=start_date,
-                    end_date=end_date,
-                    poster_image=self.clean_text(row.get('poster_image', '')),
-                    website_url=self.clean_text(row.get('website_url', '')),
-                )
-
-                # 성공 카운트만 증가 (출력 제거 - 인코딩 에러 방지)
-                success_count += 1
-
-            except IntegrityError as e:
-                skip_count += 1
-            except Exception as e:
-                error_count += 1
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as f:
+                json.dump(report.as_dict(), f, ensure_ascii=False, indent=2)
 
         # 결과 요약
         self.stdout.write('\n' + '='*60)
-        self.stdout.write(self.style.SUCCESS(f'[OK] 성공: {success_count}개'))
+        self.stdout.write(self.style.SUCCESS(f'[OK] 생성: {report.created}개'))
+        self.stdout.write(self.style.SUCCESS(f'[OK] 갱신: {report.updated}개'))
+        self.stdout.write(f'[--] 변경 없음: {report.unchanged}개')
+        if report.retired:
+            self.stdout.write(self.style.WARNING(f'[DEL] 삭제: {report.retired}개 (소스에서 사라짐)'))
         if skip_count > 0:
-            self.stdout.write(self.style.WARNING(f'[SKIP] 건너뜀: {skip_count}개 (중복 또는 필수 데이터 누락)'))
-        if error_count > 0:
-            self.stdout.write(self.style.ERROR(f'[ERR] 실패: {error_count}개'))
+            self.stdout.write(self.style.WARNING(f'[SKIP] 건너뜀: {skip_count}개 (필수 데이터 누락)'))
+        if geocoder and any(geocoder.stats.values()):
+            stats = geocoder.stats
+            self.stdout.write(
+                f'[GEO] 캐시 {stats["cache_hits"]}건, provider 호출 {stats["provider_calls"]}건, '
+                f'지역 좌표 대체 - 시/군/구 {stats["sigungu_fallbacks"]}건, 시/도 {stats["sido_fallbacks"]}건, '
+                f'미해결 {stats["unresolved"]}건'
+            )
         self.stdout.write(self.style.SUCCESS(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.'))
         self.stdout.write('='*60)
@@ -0,0 +1,77 @@
+"""
+이벤트 fixture 스트리밍 로더 (loaddata 대체)
+- JSON 배열/NDJSON fixture를 객체 단위로 읽어 배치로 저장 (파일 크기와 무관한 메모리 사용)
+- 자연키 기준 upsert: 새 이벤트는 생성, 바뀐 이벤트만 갱신 (Event id 유지)
+
+사용법:
+    python manage.py load_events fixtures/mokkoji_events.json
+    python manage.py load_events fixtures/events.ndjson --batch-size 2000
+"""
+
+import os
+import time
+from django.core.management.base import BaseCommand, CommandError
+from events.models import Event
+from events.geocoding import EventGeocoder
+from events.importing import EventUpserter, backfill_source_keys
+from events.sources import iter_fixture_rows
+
+
+class Command(BaseCommand):
+    help = '이벤트 fixture(JSON/NDJSON)를 스트리밍으로 읽어 배치 저장합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixture', type=str, help='fixture 파일 경로 (.json 또는 .ndjson)')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 저장할 행 수 (기본값: 1000)'
+        )
+        parser.add_argument(
+            '--retire-missing',
+            action='store_true',
+            help='fixture에 없는 (이전에 임포트된) 이벤트를 삭제합니다'
+        )
+        parser.add_argument(
+            '--no-geocode',
+            action='store_true',
+            help='좌표가 없는 행을 geocoding 하지 않습니다'
+        )
+
+    def handle(self, *args, **options):
+        fixture = options['fixture']
+        if not os.path.exists(fixture):
+            raise CommandError(f'파일을 찾을 수 없습니다: {fixture}')
+
+        started = time.monotonic()
+        backfill_source_keys(batch_size=options['batch_size'])
+
+        source = os.path.basename(fixture)
+        upserter = EventUpserter(
+            batch_size=options['batch_size'],
+            collect_details=False,
+            geocoder=None if options['no_geocode'] else EventGeocoder(),
+        )
+        try:
+            for key, digest, fields in iter_fixture_rows(fixture):
+                upserter.add(fields, key=key, digest=digest, source=source)
+        except ValueError as e:
+            raise CommandError(f'fixture 파싱 실패 ({fixture}): {e}')
+        report = upserter.finish(retire_missing=options['retire_missing'], sources=[source])
+
+        elapsed = time.monotonic() - started
+        processed = report.created + report.updated + report.unchanged + report.duplicates
+
+        # 결과 요약
+        self.stdout.write('\n' + '='*50)
+        self.stdout.write(self.style.SUCCESS(f'✓ 생성: {report.created}개'))
+        self.stdout.write(self.style.SUCCESS(f'✓ 갱신: {report.updated}개'))
+        self.stdout.write(f'- 변경 없음: {report.unchanged}개')
+        if report.duplicates:
+            self.stdout.write(self.style.WARNING(f'- 중복: {report.duplicates}개'))
+        if report.retired:
+            self.stdout.write(self.style.WARNING(f'✗ 삭제: {report.retired}개 (fixture에서 사라짐)'))
+        self.stdout.write(f'처리 시간: {elapsed:.2f}초 ({processed / max(elapsed, 1e-6):,.0f} 행/초)')
+        self.stdout.write(self.style.SUCCESS(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.'))
+        self.stdout.write('='*50)
@@ -0,0 +1,201 @@
+"""
+병합 후보 적용 명령어
+- 중복 이벤트에 연결된 북마크/리뷰/지원서/성과 데이터 등을 대표 이벤트로 옮긴 뒤 삭제
+- 대표 이벤트에 이미 같은 (사용자, 이벤트) 북마크/리뷰가 있으면 중복 쪽 행은 삭제
+- 같은 (사업자, 이벤트) 지원서/성과 데이터 등이 겹치면 병합하지 않고 후보를 검토 대기로 남김
+- 연결 데이터는 save()로 옮김 (사업자 통계 캐시/대시보드/성과 요약 signal 실행)
+- 병합된 자연키는 기록해 두어 재임포트 시 다시 생성되지 않음
+
+사용법:
+    python manage.py merge_events                        # 검토 대기 후보 전체
+    python manage.py merge_events --ids 3 7 --dry-run    # 특정 후보만 미리보기
+    python manage.py merge_events --min-similarity 0.8
+    python manage.py merge_events --dismiss 5            # 중복 아님으로 표시
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import UniqueConstraint
+from django.utils import timezone
+from events.models import Event, EventMergeCandidate
+
+
+class MergeConflict(Exception):
+    """병합하면 사업자 데이터가 사라지는 후보 (검토 대기로 남김)"""
+
+
+class Command(BaseCommand):
+    help = '유사 중복 병합 후보를 적용합니다'
+
+    # 대표 이벤트에 값이 없으면 중복 이벤트 값으로 채울 필드
+    FILL_FIELDS = ['latitude', 'longitude', 'website_url', 'poster_image', 'description']
+
+    def add_arguments(self, parser):
+        parser.add_argument('--ids', type=int, nargs='+', help='적용할 후보 id (기본값: 검토 대기 전체)')
+        parser.add_argument(
+            '--min-similarity',
+            type=float,
+            default=0.0,
+            help='이 유사도 이상인 후보만 적용합니다'
+        )
+        parser.add_argument('--dismiss', type=int, nargs='+', help='중복 아님으로 표시할 후보 id')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='DB를 바꾸지 않고 적용 대상만 출력합니다'
+        )
+
+    @staticmethod
+    def unique_field_sets(model, field):
+        """이벤트 FK(field)를 포함하는 유일성 조건 (unique_together, UniqueConstraint, unique 필드)"""
+        field_sets = [tuple(fields) for fields in model._meta.unique_together]
+        field_sets += [
+            tuple(constraint.fields) for constraint in model._meta.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.fields
+        ]
+        if model._meta.get_field(field).unique:
+            field_sets.append((field,))
+        return [fields for fields in field_sets if field in fields]
+
+    def find_conflicts(self, model, field, primary, duplicate):
+        """대표 이벤트 쪽에 이미 같은 값이 있어 옮길 수 없는 중복 이벤트 행의 pk"""
+        conflict_ids = set()
+        rows = model._default_manager.filter(**{field: duplicate})
+        for unique_fields in self.unique_field_sets(model, field):
+            others = [name for name in unique_fields if name != field]
+            if not others:
+                if model._default_manager.filter(**{field: primary}).exists():
+                    conflict_ids.update(rows.values_list('pk', flat=True))
+                continue
+            taken = set(
+                model._default_manager.filter(**{field: primary}).values_list(*others)
+            )
+            conflict_ids.update(
+                pk for pk, *values in rows.values_list('pk', *others)
+                if tuple(values) in taken
+            )
+        return conflict_ids
+
+    def move_related(self, primary, duplicate):
+        """
+        중복 이벤트를 참조하는 행을 대표 이벤트로 이동
+        - 사업자 소유 행(지원서/성과 데이터 등)이 겹치면 병합하지 않음 (MergeConflict)
+        - 겹치는 사용자 행(북마크/리뷰)은 중복 쪽을 삭제
+        - 행마다 save()로 옮겨 signal(통계 캐시/대시보드/성과 요약 갱신)이 실행되도록 함
+
+        Returns:
+            (이동한 행 수, 충돌로 삭제한 행 수)
+        """
+        relations = []
+        for relation in Event._meta.related_objects:
+            model = relation.related_model
+            if model is EventMergeCandidate:
+                continue
+            field = relation.field.name
+            conflict_ids = self.find_conflicts(model, field, primary, duplicate)
+            if conflict_ids and any(f.name == 'partner' for f in model._meta.get_fields()):
+                raise MergeConflict(
+                    f'대표 이벤트에 같은 사업자의 {model._meta.verbose_name} 데이터가 이미 있습니다 '
+                    f'({len(conflict_ids)}개)'
+                )
+            relations.append((model, field, conflict_ids))
+
+        moved = 0
+        dropped = 0
+        for model, field, conflict_ids in relations:
+            if conflict_ids:
+                dropped += len(conflict_ids)
+                model._default_manager.filter(pk__in=conflict_ids).delete()
+
+            # auto_now 필드(updated_at)도 함께 갱신 (리포트 키 등이 바뀌도록)
+            update_fields = [field] + [
+                f.name for f in model._meta.concrete_fields if getattr(f, 'auto_now', False)
+            ]
+            for row in model._default_manager.filter(**{field: duplicate}).iterator():
+                setattr(row, field, primary)
+                row.save(update_fields=update_fields)
+                moved += 1
+        return moved, dropped
+
+    @transaction.atomic
+    def merge(self, candidate):
+        primary = Event.objects.select_for_update().get(pk=candidate.primary_id)
+        duplicate = Event.objects.select_for_update().get(pk=candidate.duplicate_id)
+
+        changed = []
+        for name in self.FILL_FIELDS:
+            if getattr(primary, name) in (None, '') and getattr(duplicate, name) not in (None, ''):
+                setattr(primary, name, getattr(duplicate, name))
+                changed.append(name)
+        if changed:
+            primary.save(update_fields=changed + ['updated_at'])
+
+        moved, dropped = self.move_related(primary, duplicate)
+
+        candidate.duplicate_key = duplicate.source_key or ''
+        candidate.duplicate_name = duplicate.name
+        candidate.status = 'merged'
+        candidate.merged_at = timezone.now()
+        candidate.save(update_fields=['duplicate_key', 'duplicate_name', 'status', 'merged_at'])
+        duplicate.delete()
+        return moved, dropped
+
+    def handle(self, *args, **options):
+        if options['dismiss']:
+            dismissed = EventMergeCandidate.objects.filter(
+                id__in=options['dismiss'], status='pending'
+            )
+            count = len(dismissed) if options['dry_run'] else dismissed.update(status='dismissed')
+            self.stdout.write(self.style.SUCCESS(f'✓ 중복 아님으로 표시: {count}개'))
+            if not options['ids']:
+                return
+
+        candidates = EventMergeCandidate.objects.filter(
+            status='pending',
+            duplicate__isnull=False,
+            similarity__gte=options['min_similarity'],
+        ).select_related('primary', 'duplicate')
+        if options['ids']:
+            candidates = candidates.filter(id__in=options['ids'])
+
+        merged = 0
+        conflicts = 0
+        moved_total = 0
+        dropped_total = 0
+        for candidate in list(candidates):
+            # 앞선 병합으로 한쪽이 이미 삭제된 후보는 건너뜀 (find_duplicate_events 재실행으로 다시 잡힘)
+            if Event.objects.filter(id__in=[candidate.primary_id, candidate.duplicate_id]).count() < 2:
+                continue
+            self.stdout.write(
+                f'  #{candidate.id} {candidate.primary.name} ⇐ {candidate.duplicate.name} '
+                f'({candidate.similarity:.2f})'
+            )
+            if options['dry_run']:
+                merged += 1
+                continue
+            try:
+                moved, dropped = self.merge(candidate)
+            except MergeConflict as e:
+                conflicts += 1
+                self.stdout.write(self.style.WARNING(f'    병합하지 않음: {e}'))
+                continue
+            merged += 1
+            moved_total += moved
+            dropped_total += dropped
+
+        self.stdout.write('\n' + '='*50)
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'[DRY RUN] 병합 대상: {merged}개'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ 병합: {merged}개'))
+            self.stdout.write(f'이동한 연결 데이터: {moved_total}개')
+            if dropped_total:
+                self.stdout.write(self.style.WARNING(
+                    f'대표 이벤트와 겹쳐 삭제한 연결 데이터: {dropped_total}개'
+                ))
+            if conflicts:
+                self.stdout.write(self.style.WARNING(
+                    f'사업자 데이터가 겹쳐 검토 대기로 남긴 후보: {conflicts}개'
+                ))
+        self.stdout.write(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.')
+        self.stdout.write('='*50)
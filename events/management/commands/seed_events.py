@@ -0,0 +1,102 @@
+"""
+부팅 시 이벤트 카탈로그 시딩 명령어 (delete + loaddata 대체)
+- fixture 체크섬이 마지막 적용값과 같으면 아무것도 하지 않음
+- 바뀐 경우 자연키 기준 upsert (Event id 유지 - 북마크/리뷰 보존)
+- PostgreSQL: COPY로 staging 테이블 적재 후 INSERT ... ON CONFLICT
+- 여러 인스턴스가 동시에 부팅해도 한 곳에서만 적용 (advisory lock / 행 잠금)
+
+사용법:
+    python manage.py seed_events
+    python manage.py seed_events fixtures/mokkoji_events.json --force  # 체크섬과 무관하게 적용
+"""
+
+import os
+import zlib
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from events.models import CatalogSeed, Event
+from events.importing import EventUpserter, backfill_source_keys, copy_upsert_events
+from events.sources import file_checksum, iter_fixture_rows
+
+
+# 레플리카 간 동시 시딩 방지용 PostgreSQL advisory lock 키
+SEED_LOCK_ID = zlib.crc32(b'events.seed_events')
+
+
+class Command(BaseCommand):
+    help = 'fixture가 바뀐 경우에만 이벤트 카탈로그를 upsert 합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'fixture',
+            nargs='?',
+            default='fixtures/mokkoji_events.json',
+            help='이벤트 fixture 경로 (기본값: fixtures/mokkoji_events.json)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='체크섬이 같아도 다시 적용합니다'
+        )
+        parser.add_argument(
+            '--retire-missing',
+            action='store_true',
+            help='fixture에 없는 (이전에 임포트된) 이벤트를 삭제합니다'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='DB 반영 배치 크기 (기본값: 500)'
+        )
+
+    def acquire_lock(self):
+        """다른 인스턴스의 시딩이 끝날 때까지 대기 (트랜잭션 종료 시 자동 해제)"""
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(%s)', [SEED_LOCK_ID])
+
+    def handle(self, *args, **options):
+        fixture = os.path.normpath(options['fixture'])
+        if not os.path.exists(fixture):
+            raise CommandError(f'파일을 찾을 수 없습니다: {fixture}')
+
+        checksum = file_checksum(fixture)
+
+        with transaction.atomic():
+            self.acquire_lock()
+            state = CatalogSeed.objects.select_for_update().filter(source=fixture).first()
+
+            if state and state.checksum == checksum and not options['force']:
+                self.stdout.write(
+                    self.style.SUCCESS(f'[SKIP] {fixture} 변경 없음 - 시딩을 건너뜁니다.')
+                )
+                return
+
+            # 자연키가 없는 기존 이벤트 (예전 loaddata 등) 보정
+            backfill_source_keys(batch_size=options['batch_size'])
+
+            rows = iter_fixture_rows(fixture)
+            source = os.path.basename(fixture)
+            if connection.vendor == 'postgresql' and not options['retire_missing']:
+                report = copy_upsert_events(rows, source=source)
+            else:
+                upserter = EventUpserter(batch_size=options['batch_size'], collect_details=False)
+                for key, digest, fields in rows:
+                    upserter.add(fields, key=key, digest=digest, source=source)
+                report = upserter.finish(retire_missing=options['retire_missing'], sources=[source])
+
+            CatalogSeed.objects.update_or_create(
+                source=fixture,
+                defaults={
+                    'checksum': checksum,
+                    'row_count': report.created + report.updated + report.unchanged,
+                }
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f'[OK] {fixture} 적용 완료 - 생성 {report.created}개, 갱신 {report.updated}개, '
+            f'변경 없음 {report.unchanged}개'
+            + (f', 삭제 {report.retired}개' if report.retired else '')
+        ))
+        self.stdout.write(f'총 {Event.objects.count()}개의 이벤트가 DB에 있습니다.')
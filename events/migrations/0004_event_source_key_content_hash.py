@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_increase_url_field_length'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='소스 행 콘텐츠 해시 (변경 감지용)', max_length=40),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='source_key',
+            field=models.CharField(blank=True, help_text='(name, location, start_date) 기반 자연키', max_length=40, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_source_key_content_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogSeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(help_text='fixture 경로', max_length=255, unique=True)),
+                ('checksum', models.CharField(help_text='fixture 파일 SHA-256', max_length=64)),
+                ('row_count', models.IntegerField(default=0)),
+                ('applied_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
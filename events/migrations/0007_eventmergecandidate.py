@@ -0,0 +1,33 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_geocodecache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventMergeCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('duplicate_key', models.CharField(blank=True, db_index=True, help_text='병합된 이벤트의 자연키 (재임포트 시 다시 생성되지 않도록 유지)', max_length=40)),
+                ('duplicate_name', models.CharField(max_length=200)),
+                ('similarity', models.FloatField(help_text='이름 유사도 (Jaccard)')),
+                ('distance_km', models.FloatField(blank=True, help_text='좌표 거리 (km)', null=True)),
+                ('status', models.CharField(choices=[('pending', '검토 대기'), ('merged', '병합됨'), ('dismissed', '중복 아님')], db_index=True, default='pending', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('merged_at', models.DateTimeField(blank=True, null=True)),
+                ('duplicate', models.ForeignKey(blank=True, help_text='병합 후 삭제될 이벤트', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='events.event')),
+                ('primary', models.ForeignKey(help_text='남길 이벤트', on_delete=django.db.models.deletion.CASCADE, related_name='merge_candidates', to='events.event')),
+            ],
+            options={
+                'ordering': ['-similarity', 'id'],
+                'unique_together': {('primary', 'duplicate')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_eventmergecandidate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='source_file',
+            field=models.CharField(blank=True, help_text='이벤트를 마지막으로 반영한 소스 파일 이름 (retire_missing 범위 제한용)', max_length=255),
+        ),
+    ]
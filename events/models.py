@@ -22,6 +22,26 @@ class Event(models.Model):
     end_date = models.DateField()
     poster_image = models.URLField(max_length=500)
     website_url = models.URLField(max_length=500, blank=True)
+
+    # 임포트 추적 (import_mokkoji_events upsert용)
+    source_key = models.CharField(
+        max_length=40,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text='(name, location, start_date) 기반 자연키'
+    )
+    content_hash = models.CharField(
+        max_length=40,
+        blank=True,
+        help_text='소스 행 콘텐츠 해시 (변경 감지용)'
+    )
+    source_file = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text='이벤트를 마지막으로 반영한 소스 파일 이름 (retire_missing 범위 제한용)'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -94,3 +114,71 @@ class Review(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.event.name} ({self.rating}★)"
+
+
+class CatalogSeed(models.Model):
+    """부팅 시 카탈로그 시딩 상태 - 마지막으로 적용한 fixture 체크섬 기록"""
+    source = models.CharField(max_length=255, unique=True, help_text='fixture 경로')
+    checksum = models.CharField(max_length=64, help_text='fixture 파일 SHA-256')
+    row_count = models.IntegerField(default=0)
+    applied_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.source} ({self.checksum[:12]})"
+
+
+class GeocodeCache(models.Model):
+    """주소/지역명 geocoding 결과 캐시 - 재임포트 시 외부 provider 호출 방지"""
+    query = models.CharField(max_length=300, unique=True, help_text='정규화된 주소/지역명')
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    provider = models.CharField(max_length=50, help_text='결과를 제공한 geocoder')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        if self.latitude is None:
+            return f"{self.query} (결과 없음)"
+        return f"{self.query} ({self.latitude}, {self.longitude})"
+
+
+class EventMergeCandidate(models.Model):
+    """유사 중복 이벤트 병합 후보 (find_duplicate_events가 생성, merge_events가 적용)"""
+    STATUS_CHOICES = [
+        ('pending', '검토 대기'),
+        ('merged', '병합됨'),
+        ('dismissed', '중복 아님'),
+    ]
+
+    primary = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='merge_candidates',
+        help_text='남길 이벤트'
+    )
+    duplicate = models.ForeignKey(
+        Event,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='병합 후 삭제될 이벤트'
+    )
+    duplicate_key = models.CharField(
+        max_length=40,
+        blank=True,
+        db_index=True,
+        help_text='병합된 이벤트의 자연키 (재임포트 시 다시 생성되지 않도록 유지)'
+    )
+    duplicate_name = models.CharField(max_length=200)
+    similarity = models.FloatField(help_text='이름 유사도 (Jaccard)')
+    distance_km = models.FloatField(null=True, blank=True, help_text='좌표 거리 (km)')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    merged_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ['primary', 'duplicate']
+        ordering = ['-similarity', 'id']
+
+    def __str__(self):
+        return f"{self.primary.name} ⇐ {self.duplicate_name} ({self.similarity:.2f}, {self.get_status_display()})"
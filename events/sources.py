@@ -0,0 +1,328 @@
+"""
+이벤트 소스 파일 파싱 및 정규화
+- CSV/XLSX 청크 단위 스트리밍 읽기 (파일 크기와 무관한 메모리 사용)
+- 소스 행 정규화 (title -> name, Excel 날짜, 좌표)
+- 자연키(natural key)와 콘텐츠 해시 계산
+
+Django 설정 없이 import 가능해야 함 (임포트 워커 프로세스에서 사용)
+"""
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from openpyxl import load_workbook
+
+
+# 콘텐츠 해시에 포함되는 필드 (순서 고정)
+EVENT_FIELDS = [
+    'name', 'description', 'category', 'location', 'address',
+    'latitude', 'longitude', 'start_date', 'end_date',
+    'poster_image', 'website_url',
+]
+
+VALID_CATEGORIES = ['festival', 'concert', 'exhibition', 'popup']
+
+# 소스 컬럼명 -> Event 필드명
+COLUMN_ALIASES = {
+    'title': 'name',
+}
+
+
+def normalize_columns(columns):
+    """컬럼명 정리 (BOM 제거, title -> name 변환)"""
+    normalized = []
+    for column in columns:
+        column = '' if column is None else str(column).replace('\ufeff', '').strip()
+        normalized.append(COLUMN_ALIASES.get(column, column))
+    return normalized
+
+
+def _iter_csv_chunks(file_path, chunk_size):
+    for df in pd.read_csv(file_path, encoding='utf-8-sig', chunksize=chunk_size):
+        df.columns = normalize_columns(df.columns)
+        yield df.to_dict('records')
+
+
+def _iter_xlsx_chunks(file_path, chunk_size):
+    # read_only 모드: 시트 전체를 메모리에 올리지 않고 행 단위로 읽음
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = normalize_columns(header)
+
+        chunk = []
+        for values in rows:
+            if not values or all(value is None for value in values):
+                continue
+            chunk.append(dict(zip(columns, values)))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def _iter_xls_chunks(file_path, chunk_size):
+    # 구형 .xls는 openpyxl이 읽지 못하므로 pandas로 읽은 뒤 청크로 나눔
+    df = pd.read_excel(file_path)
+    df.columns = normalize_columns(df.columns)
+    for start in range(0, len(df), chunk_size):
+        yield df.iloc[start:start + chunk_size].to_dict('records')
+
+
+def iter_source_chunks(file_path, chunk_size=1000):
+    """
+    CSV/Excel 파일을 청크 단위로 읽기
+
+    Yields:
+        list[dict]: 컬럼명이 정규화된 행 목록 (최대 chunk_size개)
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext in ('.xlsx', '.xlsm'):
+        return _iter_xlsx_chunks(file_path, chunk_size)
+    if ext == '.xls':
+        return _iter_xls_chunks(file_path, chunk_size)
+    return _iter_csv_chunks(file_path, chunk_size)
+
+
+def convert_excel_date(value):
+    """Excel 날짜 직렬화 숫자를 날짜로 변환"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+
+    # 이미 날짜 형식인 경우
+    if isinstance(value, (datetime, pd.Timestamp)):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    # 문자열인 경우
+    if isinstance(value, str):
+        value = value.strip()
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            pass
+
+    # Excel 숫자 형식인 경우 (1900-01-01 기준)
+    try:
+        excel_epoch = datetime(1899, 12, 30)
+        return (excel_epoch + timedelta(days=float(value))).date()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def clean_text(value):
+    """텍스트 정리 (앞뒤 공백 제거, None 처리)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    return str(value).strip()
+
+
+def clean_float(value):
+    """좌표 변환 (비어 있거나 잘못된 값은 None)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_row(row):
+    """
+    소스 행(dict 또는 pandas Series)을 Event 필드 dict로 변환
+
+    Returns:
+        (fields, None) 또는 필수 데이터가 없으면 (None, 사유)
+    """
+    name = clean_text(row.get('name', row.get('title')))
+    if not name:
+        return None, '이름 누락'
+
+    # 카테고리 검증
+    category = clean_text(row.get('category', 'festival')).lower()
+    if category not in VALID_CATEGORIES:
+        category = 'festival'  # 기본값
+
+    # 날짜 변환
+    start_date = convert_excel_date(row.get('start_date'))
+    end_date = convert_excel_date(row.get('end_date'))
+    if not start_date or not end_date:
+        return None, '날짜 누락 또는 형식 오류'
+
+    fields = {
+        'name': name,
+        'description': clean_text(row.get('description', '')),
+        'category': category,
+        'location': clean_text(row.get('location', '')),
+        'address': clean_text(row.get('address', '')),
+        'latitude': clean_float(row.get('latitude')),
+        'longitude': clean_float(row.get('longitude')),
+        'start_date': start_date,
+        'end_date': end_date,
+        'poster_image': clean_text(row.get('poster_image', '')),
+        'website_url': clean_text(row.get('website_url', '')),
+    }
+    return fields, None
+
+
+def _canonical_text(value):
+    """자연키 비교용 문자열 (유니코드 정규화, 공백 통일, 대소문자 무시)"""
+    value = unicodedata.normalize('NFC', value or '')
+    return re.sub(r'\s+', ' ', value).strip().casefold()
+
+
+def natural_key(fields):
+    """(name, location, start_date) 기준 안정적인 자연키"""
+    start_date = fields['start_date']
+    if isinstance(start_date, date):
+        start_date = start_date.isoformat()
+    raw = '\x1f'.join([
+        _canonical_text(fields['name']),
+        _canonical_text(fields['location']),
+        str(start_date),
+    ])
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _hashable(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float):
+        return round(value, 7)
+    return value
+
+
+def content_hash(fields):
+    """정규화된 필드 전체에 대한 해시 (변경 감지용)"""
+    payload = json.dumps(
+        [_hashable(fields[name]) for name in EVENT_FIELDS],
+        ensure_ascii=False,
+        separators=(',', ':'),
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def parse_chunk(rows):
+    """
+    원본 행 청크를 정규화해 압축된 형태로 반환
+
+    Returns:
+        (rows, skip_count): [(자연키, 콘텐츠 해시, EVENT_FIELDS 순서의 값 튜플), ...],
+        필수 데이터 누락으로 건너뛴 행 수
+    """
+    parsed = []
+    skip_count = 0
+    for row in rows:
+        fields, _reason = normalize_row(row)
+        if fields is None:
+            skip_count += 1
+            continue
+        parsed.append((
+            natural_key(fields),
+            content_hash(fields),
+            tuple(fields[name] for name in EVENT_FIELDS),
+        ))
+    return parsed, skip_count
+
+
+def parse_source_file(file_path, chunk_size, batches):
+    """
+    파일 하나를 청크 단위로 읽어 정규화 결과를 batches 큐에 넣음 (프로세스 풀 작업 단위)
+    - 파일 전체 행을 모아 두지 않음: 큐가 가득 차면 부모가 꺼낼 때까지 기다림
+
+    큐 항목:
+        ('rows', [(자연키, 콘텐츠 해시, 값 튜플), ...], 읽은 행 수, 건너뛴 행 수)
+        ('done', None, 0, 0) 또는 실패 시 ('error', 오류 메시지, 0, 0)
+    """
+    if not os.path.exists(file_path):
+        batches.put(('error', '파일을 찾을 수 없습니다', 0, 0))
+        return
+
+    try:
+        for chunk in iter_source_chunks(file_path, chunk_size=chunk_size):
+            parsed, skip_count = parse_chunk(chunk)
+            batches.put(('rows', parsed, len(chunk), skip_count))
+    except Exception as e:
+        batches.put(('error', str(e), 0, 0))
+        return
+    batches.put(('done', None, 0, 0))
+
+
+def file_checksum(file_path, block_size=1024 * 1024):
+    """파일 SHA-256 (블록 단위로 읽어 메모리 사용 일정)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_json_objects(file_path, block_size=64 * 1024):
+    """
+    JSON 배열 또는 NDJSON 파일에서 객체를 하나씩 읽기
+    - 파일 전체를 파싱하지 않고 블록 단위로 읽으므로 메모리 사용이 일정함
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        buffer = ''
+        eof = False
+        started = False
+
+        while True:
+            # 구분자(공백, 쉼표)와 배열 괄호 건너뛰기
+            buffer = buffer.lstrip(' \t\r\n,')
+            if not started and buffer.startswith('['):
+                buffer = buffer[1:]
+                started = True
+                continue
+            if buffer.startswith(']'):
+                return
+
+            if buffer:
+                started = True
+                try:
+                    obj, end = decoder.raw_decode(buffer)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    yield obj
+                    buffer = buffer[end:]
+                    continue
+            elif eof:
+                return
+
+            block = f.read(block_size)
+            if not block:
+                eof = True
+            buffer += block
+
+
+def iter_fixture_rows(file_path, model='events.event'):
+    """
+    Django fixture(JSON 배열 또는 NDJSON)에서 Event 행을 정규화해 반환
+    - 객체 단위 스트리밍 (fixture 크기와 무관한 메모리 사용)
+    - fixture의 pk는 무시 (자연키로 기존 이벤트와 매칭)
+
+    Yields:
+        (자연키, 콘텐츠 해시, 정규화된 필드 dict)
+    """
+    for obj in iter_json_objects(file_path):
+        if obj.get('model', '').lower() != model:
+            continue
+        fields, _reason = normalize_row(obj.get('fields', {}))
+        if fields is None:
+            continue
+        yield natural_key(fields), content_hash(fields), fields
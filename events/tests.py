@@ -0,0 +1,522 @@
+import csv
+import io
+import json
+import os
+import queue
+import shutil
+import tempfile
+from concurrent.futures import Future
+from datetime import date
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from openpyxl import Workbook
+from partners.tests import make_application, make_partner
+from requests import RequestException
+
+from .management.commands import import_mokkoji_events
+from .dedup import find_near_duplicates, normalize_name
+from .geocoding import BaseGeocoder, EventGeocoder, GazetteerGeocoder, match_region, parse_region
+from .importing import EventUpserter, copy_upsert_events
+from .models import Bookmark, CatalogSeed, Event, EventMergeCandidate, GeocodeCache
+from .sources import content_hash, iter_json_objects, iter_source_chunks, natural_key, parse_source_file
+
+
+def event_fields(name, **overrides):
+    fields = {
+        'name': name,
+        'description': f'{name} 설명',
+        'category': 'festival',
+        'location': '서울 중구',
+        'address': '서울특별시 중구 세종대로 110',
+        'latitude': 37.5665,
+        'longitude': 126.978,
+        'start_date': date(2026, 5, 1),
+        'end_date': date(2026, 5, 3),
+        'poster_image': 'https://example.com/poster.jpg',
+        'website_url': '',
+    }
+    fields.update(overrides)
+    return fields
+
+
+def upsert(rows, retire_missing=False, sources=()):
+    upserter = EventUpserter(batch_size=2)
+    for fields, source in rows:
+        upserter.add(dict(fields), source=source)
+    return upserter.finish(retire_missing=retire_missing, sources=sources)
+
+
+class EventUpserterTests(TestCase):
+    """자연키/콘텐츠 해시 기반 upsert (import_mokkoji_events)"""
+
+    def test_creates_updates_and_skips_unchanged_rows(self):
+        report = upsert([(event_fields('봄 축제'), 'a.csv'), (event_fields('여름 축제'), 'a.csv')])
+        self.assertEqual((report.created, report.updated, report.unchanged), (2, 0, 0))
+        event_id = Event.objects.get(name='봄 축제').id
+
+        report = upsert([
+            (event_fields('봄 축제', description='바뀐 설명'), 'a.csv'),
+            (event_fields('여름 축제'), 'a.csv'),
+        ])
+        self.assertEqual((report.created, report.updated, report.unchanged), (0, 1, 1))
+        event = Event.objects.get(name='봄 축제')
+        self.assertEqual(event.id, event_id)  # id 유지 (북마크/리뷰 보존)
+        self.assertEqual(event.description, '바뀐 설명')
+
+    def test_duplicate_keys_in_one_run_are_counted_once(self):
+        report = upsert([(event_fields('봄 축제'), 'a.csv'), (event_fields('봄  축제'), 'b.csv')])
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.duplicates, 1)
+
+    def test_retire_missing_only_touches_sources_that_were_read(self):
+        upsert([
+            (event_fields('A 파일 유지'), 'a.csv'),
+            (event_fields('A 파일 삭제'), 'a.csv'),
+            (event_fields('B 파일'), 'b.csv'),
+        ])
+        # fixture로 들어온 (소스 파일이 없는) 이벤트
+        legacy = event_fields('기존 이벤트')
+        Event.objects.create(
+            source_key=natural_key(legacy), content_hash=content_hash(legacy), source_file='', **legacy
+        )
+
+        report = upsert([(event_fields('A 파일 유지'), 'a.csv')], retire_missing=True, sources=['a.csv'])
+
+        self.assertEqual(report.retired, 1)
+        self.assertEqual(
+            set(Event.objects.values_list('name', flat=True)),
+            {'A 파일 유지', 'B 파일', '기존 이벤트'},
+        )
+
+    def test_unchanged_row_moved_to_another_source_updates_source_file(self):
+        upsert([(event_fields('봄 축제'), 'a.csv')])
+        report = upsert([(event_fields('봄 축제'), 'b.csv')])
+        self.assertEqual(report.unchanged, 1)
+        self.assertEqual(Event.objects.get().source_file, 'b.csv')
+
+
+class SeedEventsTests(TestCase):
+    """부팅 시 카탈로그 시딩 (seed_events)"""
+
+    def write_fixture(self, names):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        self.addCleanup(os.remove, path)
+        fixture = [
+            {'model': 'events.event', 'pk': pk, 'fields': {
+                **event_fields(name), 'start_date': '2026-05-01', 'end_date': '2026-05-03',
+            }}
+            for pk, name in enumerate(names, start=1)
+        ]
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(fixture, f, ensure_ascii=False)
+        return path
+
+    def test_seeds_once_and_skips_unchanged_fixture(self):
+        fixture = self.write_fixture(['봄 축제', '여름 축제'])
+
+        call_command('seed_events', fixture, stdout=io.StringIO())
+        self.assertEqual(Event.objects.count(), 2)
+        self.assertEqual(
+            set(Event.objects.values_list('source_file', flat=True)), {os.path.basename(fixture)}
+        )
+        seeded_ids = set(Event.objects.values_list('id', flat=True))
+
+        call_command('seed_events', fixture, stdout=io.StringIO())
+        self.assertEqual(set(Event.objects.values_list('id', flat=True)), seeded_ids)
+        self.assertEqual(CatalogSeed.objects.get().row_count, 2)
+
+
+@skipUnless(connection.vendor == 'postgresql', 'COPY upsert는 PostgreSQL 전용')
+class CopyUpsertTests(TestCase):
+    """PostgreSQL COPY + INSERT ... ON CONFLICT upsert (seed_events 기본 경로)"""
+
+    def rows(self, *fields_list):
+        return [(natural_key(fields), content_hash(fields), fields) for fields in fields_list]
+
+    def test_inserts_updates_and_records_source_file(self):
+        report = copy_upsert_events(
+            self.rows(event_fields('봄 축제'), event_fields('여름 축제')), source='events.json'
+        )
+        self.assertEqual((report.created, report.updated, report.unchanged), (2, 0, 0))
+        self.assertEqual(set(Event.objects.values_list('source_file', flat=True)), {'events.json'})
+        event_id = Event.objects.get(name='봄 축제').id
+
+        report = copy_upsert_events(
+            self.rows(event_fields('봄 축제', description='바뀐 설명'), event_fields('여름 축제')),
+            source='events-v2.json',
+        )
+        self.assertEqual((report.created, report.updated, report.unchanged), (0, 1, 1))
+        spring = Event.objects.get(name='봄 축제')
+        self.assertEqual(spring.id, event_id)
+        self.assertEqual(spring.description, '바뀐 설명')
+        # 내용이 같은 행도 새 소스로 옮겨짐 (retire_missing 범위)
+        self.assertEqual(set(Event.objects.values_list('source_file', flat=True)), {'events-v2.json'})
+
+    def test_duplicate_keys_are_dropped_before_copy(self):
+        report = copy_upsert_events(
+            self.rows(event_fields('봄 축제'), event_fields('봄 축제')), source='events.json'
+        )
+        self.assertEqual(report.created, 1)
+        self.assertEqual(report.duplicates, 1)
+
+
+class SourceFileMixin:
+    """임시 CSV/XLSX 소스 파일"""
+
+    HEADER = ['title', 'description', 'category', 'location', 'address', 'start_date', 'end_date']
+
+    def rows(self, count, prefix='축제'):
+        return [
+            [f'{prefix} {i}', '설명', 'festival', '서울 중구', '서울특별시 중구', '2026-05-01', '2026-05-03']
+            for i in range(count)
+        ]
+
+    def write_csv(self, rows):
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.HEADER)
+            writer.writerows(rows)
+        return path
+
+    def write_xlsx(self, rows):
+        fd, path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(self.HEADER)
+        for row in rows:
+            sheet.append(row)
+        sheet.append([None] * len(self.HEADER))  # 빈 행은 건너뜀
+        workbook.save(path)
+        return path
+
+
+class SourceChunkTests(SourceFileMixin, TestCase):
+    """CSV/XLSX 청크 단위 스트리밍 읽기 (import_mokkoji_events)"""
+
+    def test_csv_is_read_in_chunks_with_normalized_columns(self):
+        chunks = list(iter_source_chunks(self.write_csv(self.rows(5)), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(chunks[0][0]['name'], '축제 0')  # BOM 제거 + title -> name
+
+    def test_xlsx_is_read_in_chunks(self):
+        chunks = list(iter_source_chunks(self.write_xlsx(self.rows(3)), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[1][0]['name'], '축제 2')
+
+    def test_sequential_import_upserts_every_chunk(self):
+        path = self.write_csv(self.rows(5) + [['', '이름 없음', 'festival', '', '', '2026-05-01', '2026-05-03']])
+        out = io.StringIO()
+        call_command(
+            'import_mokkoji_events', path, workers=1, chunk_size=2, no_geocode=True, stdout=out
+        )
+        self.assertEqual(Event.objects.count(), 5)
+        self.assertEqual(set(Event.objects.values_list('source_file', flat=True)), {os.path.basename(path)})
+        self.assertIn('건너뜀: 1개', out.getvalue())
+
+
+class ParallelImportTests(SourceFileMixin, TransactionTestCase):
+    """프로세스 풀 병렬 파싱 (import_mokkoji_events --workers)"""
+
+    def test_worker_streams_chunks_then_done(self):
+        batches = queue.Queue()
+        rows = self.rows(2) + [['', '이름 없음', 'festival', '', '', '2026-05-01', '2026-05-03']]
+        parse_source_file(self.write_csv(rows), 2, batches)
+
+        items = [batches.get_nowait() for _ in range(batches.qsize())]
+        self.assertEqual([(kind, rows, skips) for kind, _, rows, skips in items], [
+            ('rows', 2, 0), ('rows', 1, 1), ('done', 0, 0),
+        ])
+        key, digest, values = items[0][1][0]
+        self.assertEqual(values[0], '축제 0')
+
+    def test_missing_file_reports_error(self):
+        batches = queue.Queue()
+        parse_source_file('/nonexistent/events.csv', 2, batches)
+        self.assertEqual(batches.get_nowait()[0], 'error')
+
+    def test_worker_exit_without_done_becomes_error(self):
+        future = Future()
+        future.set_exception(RuntimeError('killed'))
+        items = list(import_mokkoji_events.Command.iter_batches(queue.Queue(), future, poll_interval=0.01))
+        self.assertEqual(items, [('error', 'killed', 0, 0)])
+
+    def test_parallel_import_matches_sequential(self):
+        paths = [self.write_csv(self.rows(3, '봄 축제')), self.write_csv(self.rows(4, '가을 축제'))]
+        call_command('import_mokkoji_events', *paths, workers=2, chunk_size=2, no_geocode=True, stdout=io.StringIO())
+        parallel = set(Event.objects.values_list('source_key', 'content_hash', 'source_file'))
+        self.assertEqual(len(parallel), 7)
+
+        Event.objects.all().delete()
+        call_command('import_mokkoji_events', *paths, workers=1, chunk_size=2, no_geocode=True, stdout=io.StringIO())
+        self.assertEqual(set(Event.objects.values_list('source_key', 'content_hash', 'source_file')), parallel)
+
+
+class ImportEventsTests(TestCase):
+    """배치 저장과 거부된 행 리포트 (import_events)"""
+
+    COLUMNS = ['name', 'description', 'category', 'location', 'address', 'start_date', 'end_date', 'poster_image']
+
+    def write_csv(self, rows):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'events.csv')
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            writer.writerows(rows)
+        return path
+
+    def row(self, name, category='festival', start_date='2026-05-01'):
+        return [name, '설명', category, '서울', '서울특별시 중구', start_date, '2026-05-03', 'https://example.com/p.jpg']
+
+    def rejected_rows(self, path):
+        with open(f'{os.path.splitext(path)[0]}.errors.csv', encoding='utf-8-sig', newline='') as f:
+            return [(row['row'], row['name'], row['error']) for row in csv.DictReader(f)]
+
+    def test_valid_rows_are_saved_and_invalid_rows_reported(self):
+        path = self.write_csv([
+            self.row('봄 축제'),
+            self.row('잘못된 카테고리', category='party'),
+            self.row('여름 축제'),
+            self.row('잘못된 날짜', start_date='05/01/2026'),
+            self.row('가을 축제'),
+        ])
+        call_command('import_events', path, batch_size=2, stdout=io.StringIO())
+
+        self.assertEqual(set(Event.objects.values_list('name', flat=True)), {'봄 축제', '여름 축제', '가을 축제'})
+        rejected = self.rejected_rows(path)
+        self.assertEqual([(row, name) for row, name, _ in rejected], [('3', '잘못된 카테고리'), ('5', '잘못된 날짜')])
+        self.assertIn('잘못된 카테고리', rejected[0][2])
+        self.assertIn('데이터 형식 오류', rejected[1][2])
+
+    def test_dry_run_saves_nothing(self):
+        path = self.write_csv([self.row('봄 축제'), self.row('여름 축제')])
+        out = io.StringIO()
+        call_command('import_events', path, dry_run=True, stdout=out)
+        self.assertFalse(Event.objects.exists())
+        self.assertIn('유효: 2개', out.getvalue())
+
+    @skipUnless(connection.vendor == 'postgresql', 'SQLite는 길이 제한을 검사하지 않음')
+    def test_failed_batch_is_retried_row_by_row(self):
+        path = self.write_csv([self.row('봄 축제'), self.row('긴 이름' * 100), self.row('여름 축제')])
+        call_command('import_events', path, batch_size=10, stdout=io.StringIO())
+
+        self.assertEqual(set(Event.objects.values_list('name', flat=True)), {'봄 축제', '여름 축제'})
+        rejected = self.rejected_rows(path)
+        self.assertEqual(len(rejected), 1)
+        self.assertEqual(rejected[0][0], '3')
+        self.assertIn('DB 저장 실패', rejected[0][2])
+
+
+class FixtureStreamTests(TestCase):
+    """JSON 배열/NDJSON fixture 스트리밍 읽기 (iter_json_objects, load_events)"""
+
+    def write(self, content, suffix='.json'):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def objects(self, count):
+        return [{'model': 'events.event', 'pk': pk, 'fields': {'name': f'축제 {pk}', 'tags': ['a, b', '}']}}
+                for pk in range(1, count + 1)]
+
+    def test_reads_json_array_across_small_blocks(self):
+        objects = self.objects(5)
+        path = self.write(json.dumps(objects, ensure_ascii=False, indent=2))
+        self.assertEqual(list(iter_json_objects(path, block_size=7)), objects)
+
+    def test_reads_ndjson(self):
+        objects = self.objects(3)
+        path = self.write(''.join(json.dumps(obj, ensure_ascii=False) + '\n' for obj in objects), '.ndjson')
+        self.assertEqual(list(iter_json_objects(path, block_size=16)), objects)
+
+    def test_empty_array_and_truncated_file(self):
+        self.assertEqual(list(iter_json_objects(self.write('[ ]'))), [])
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_objects(self.write('[{"model": "events.event", "fields": {'), block_size=8))
+
+    def test_load_events_upserts_ndjson_fixture(self):
+        dates = {'start_date': '2026-05-01', 'end_date': '2026-05-03'}
+        rows = [
+            {'model': 'events.event', 'pk': 1, 'fields': {**event_fields('봄 축제'), **dates}},
+            {'model': 'events.review', 'pk': 1, 'fields': {}},  # 다른 모델은 건너뜀
+            {'model': 'events.event', 'pk': 2, 'fields': {**event_fields('여름 축제'), **dates}},
+        ]
+        path = self.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows), '.ndjson')
+
+        call_command('load_events', path, batch_size=1, no_geocode=True, stdout=io.StringIO())
+        ids = dict(Event.objects.values_list('name', 'id'))
+        self.assertEqual(set(ids), {'봄 축제', '여름 축제'})
+
+        call_command('load_events', path, batch_size=1, no_geocode=True, stdout=io.StringIO())
+        self.assertEqual(dict(Event.objects.values_list('name', 'id')), ids)
+
+
+class FakeGeocoder(BaseGeocoder):
+    """호출 기록을 남기는 외부 provider 대역"""
+
+    name = 'fake'
+
+    def __init__(self, results, failing=()):
+        self.results = results
+        self.failing = set(failing)
+        self.calls = []
+
+    def geocode(self, query):
+        self.calls.append(query)
+        if query in self.failing:
+            raise RequestException('timeout')
+        return self.results.get(query)
+
+
+class GeocodingTests(TestCase):
+    """geocoding 캐시 / gazetteer fallback (EventGeocoder)"""
+
+    def row(self, address, location=''):
+        return {'address': address, 'location': location, 'latitude': None, 'longitude': None}
+
+    def test_parse_and_match_region(self):
+        self.assertEqual(parse_region('서울특별시 중구 세종대로 110'), ('서울', '중구'))
+        self.assertEqual(parse_region('경기 의정부'), ('경기', '의정부시'))
+        self.assertEqual(match_region('경기 의정부')[1], 'sigungu')
+        self.assertEqual(match_region('경기도 없는군 어딘가')[1], 'sido')
+        self.assertEqual(match_region('어딘가 123'), (None, None))
+
+    def test_provider_results_are_cached_including_misses(self):
+        provider = FakeGeocoder({'서울 중구 세종대로 110': (37.56, 126.97)})
+        rows = [self.row('서울 중구 세종대로 110'), self.row('없는 주소 1', '없는 곳')]
+        EventGeocoder(provider, rate_limit=0).fill_coordinates(rows)
+
+        self.assertEqual(provider.calls, ['서울 중구 세종대로 110', '없는 주소 1', '없는 곳'])
+        self.assertEqual((rows[0]['latitude'], rows[0]['longitude']), (37.56, 126.97))
+        self.assertIsNone(rows[1]['latitude'])
+        self.assertEqual(GeocodeCache.objects.count(), 3)
+
+        again = FakeGeocoder({})
+        geocoder = EventGeocoder(again, rate_limit=0)
+        rows = [self.row('서울 중구 세종대로 110'), self.row('없는 주소 1', '없는 곳')]
+        self.assertEqual(geocoder.fill_coordinates(rows), 1)
+        self.assertEqual(again.calls, [])
+        self.assertEqual(geocoder.stats['cache_hits'], 3)
+        self.assertEqual(geocoder.stats['unresolved'], 1)
+
+    def test_transient_errors_are_not_cached_and_fall_back_to_gazetteer(self):
+        provider = FakeGeocoder({}, failing={'서울특별시 중구 세종대로 110', '서울 중구'})
+        geocoder = EventGeocoder(provider, rate_limit=0)
+        rows = [self.row('서울특별시 중구 세종대로 110', '서울 중구')]
+
+        self.assertEqual(geocoder.fill_coordinates(rows), 1)
+        self.assertFalse(GeocodeCache.objects.exists())
+        self.assertEqual(geocoder.stats['sigungu_fallbacks'], 1)
+        self.assertEqual((rows[0]['latitude'], rows[0]['longitude']), match_region('서울 중구')[0])
+
+    def test_gazetteer_provider_skips_lookup(self):
+        geocoder = EventGeocoder(GazetteerGeocoder(), rate_limit=0)
+        rows = [
+            self.row('경기 의정부 어딘가'), self.row('경기도 없는군 어딘가'), self.row('어딘가'),
+            {**self.row('서울 중구'), 'latitude': 1.0, 'longitude': 2.0},
+        ]
+        self.assertEqual(geocoder.fill_coordinates(rows), 2)
+        self.assertEqual(geocoder.stats['provider_calls'], 0)
+        self.assertEqual(
+            {key: geocoder.stats[key] for key in ('sigungu_fallbacks', 'sido_fallbacks', 'unresolved')},
+            {'sigungu_fallbacks': 1, 'sido_fallbacks': 1, 'unresolved': 1},
+        )
+        self.assertEqual(rows[3]['latitude'], 1.0)
+        self.assertFalse(GeocodeCache.objects.exists())
+
+
+class NearDuplicateTests(TestCase):
+    """유사 중복 탐지(find_near_duplicates)와 병합(merge_events)"""
+
+    def record(self, event_id, name, start=date(2026, 5, 1), latitude=37.5665, longitude=126.978):
+        return {
+            'id': event_id, 'name': name, 'start_date': start, 'end_date': start,
+            'latitude': latitude, 'longitude': longitude,
+        }
+
+    def test_normalize_name_drops_years_and_brackets(self):
+        self.assertEqual(normalize_name('2024 서울 빛초롱 축제 (청계천)'), '서울빛초롱축제')
+        self.assertEqual(normalize_name('(2024)'), '2024')
+
+    def test_matches_similar_names_near_in_time_and_space(self):
+        matches = find_near_duplicates([
+            self.record(7, '2025 서울빛초롱축제 (청계천)'),
+            self.record(3, '2024 서울 빛초롱 축제'),
+            self.record(4, '서울 빛초롱 축제', start=date(2026, 9, 1)),         # 기간이 다름
+            self.record(5, '서울 빛초롱 축제', latitude=35.1, longitude=129.0),  # 부산
+            self.record(6, '진해 군항제'),
+        ])
+        self.assertEqual(
+            [(m['primary'], m['duplicate'], m['similarity']) for m in matches],
+            [(3, 7, 1.0)],
+        )
+
+    def test_missing_coordinates_skip_distance_check(self):
+        matches = find_near_duplicates([
+            self.record(1, '서울 빛초롱 축제', latitude=None, longitude=None),
+            self.record(2, '서울 빛초롱 축제', latitude=35.1, longitude=129.0),
+        ])
+        self.assertEqual(len(matches), 1)
+        self.assertIsNone(matches[0]['distance_km'])
+
+    def create_pair(self):
+        upsert([
+            (event_fields('2025 서울 빛초롱 축제', website_url=''), 'a.csv'),
+            (event_fields('서울빛초롱축제 (청계천)', website_url='https://example.com'), 'a.csv'),
+        ])
+        primary = Event.objects.get(name='2025 서울 빛초롱 축제')
+        duplicate = Event.objects.get(name='서울빛초롱축제 (청계천)')
+        return primary, duplicate
+
+    def test_find_and_merge_moves_related_rows(self):
+        primary, duplicate = self.create_pair()
+        users = get_user_model()
+        both = users.objects.create_user(username='both', email='both@example.com', password='pass1234')
+        only = users.objects.create_user(username='only', email='only@example.com', password='pass1234')
+        Bookmark.objects.create(user=both, event=primary)
+        Bookmark.objects.create(user=both, event=duplicate)
+        Bookmark.objects.create(user=only, event=duplicate)
+
+        call_command('find_duplicate_events', stdout=io.StringIO())
+        candidate = EventMergeCandidate.objects.get()
+        self.assertEqual((candidate.primary_id, candidate.duplicate_id), (primary.id, duplicate.id))
+        call_command('merge_events', stdout=io.StringIO())
+
+        self.assertFalse(Event.objects.filter(id=duplicate.id).exists())
+        self.assertEqual(Bookmark.objects.filter(event=primary).count(), 2)
+        primary.refresh_from_db()
+        self.assertEqual(primary.website_url, 'https://example.com')
+        candidate.refresh_from_db()
+        self.assertEqual(candidate.status, 'merged')
+        self.assertEqual(candidate.duplicate_key, duplicate.source_key)
+
+        # 재임포트해도 병합된 이벤트가 다시 생기지 않음
+        report = upsert([(event_fields('서울빛초롱축제 (청계천)', website_url='https://example.com'), 'a.csv')])
+        self.assertEqual(report.created, 0)
+        self.assertEqual(Event.objects.count(), 1)
+
+    def test_partner_conflict_leaves_candidate_pending(self):
+        primary, duplicate = self.create_pair()
+        partner = make_partner()
+        make_application(partner, primary)
+        make_application(partner, duplicate)
+
+        call_command('find_duplicate_events', stdout=io.StringIO())
+        out = io.StringIO()
+        call_command('merge_events', stdout=out)
+
+        self.assertIn('병합하지 않음', out.getvalue())
+        self.assertEqual(EventMergeCandidate.objects.get().status, 'pending')
+        self.assertEqual(Event.objects.count(), 2)
+        self.assertEqual(partner.applications.count(), 2)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Partner, Application, Message, AnalyticsData, ImageUpload, Notification, ApplicationDraft, FestivalBookmark
+from .models import Partner, Application, Message, Announcement, AnalyticsData, AnalyticsReport, ImageUpload, Notification, ApplicationDraft, FestivalBookmark, NotificationOutbox
 
 
 @admin.register(Partner)
@@ -103,6 +103,19 @@ class MessageAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(Announcement)
+class AnnouncementAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'event', 'audience', 'sender', 'created_at']
+    list_filter = ['audience', 'created_at']
+    search_fields = ['subject', 'content', 'event__name']
+    readonly_fields = ['created_at']
+
+    def save_model(self, request, obj, form, change):
+        if not obj.sender_id:
+            obj.sender = request.user
+        super().save_model(request, obj, form, change)
+
+
 @admin.register(AnalyticsData)
 class AnalyticsDataAdmin(admin.ModelAdmin):
     list_display = ['partner', 'event', 'visitor_count', 'estimated_sales', 'average_rating', 'review_count', 'generated_at']
@@ -232,3 +245,17 @@ class FestivalBookmarkAdmin(admin.ModelAdmin):
             'fields': ('created_at',)
         }),
     )
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(admin.ModelAdmin):
+    list_display = ['id', 'event_type', 'status', 'attempts', 'available_at', 'created_at']
+    list_filter = ['event_type', 'status']
+    readonly_fields = ['created_at']
+
+
+@admin.register(AnalyticsReport)
+class AnalyticsReportAdmin(admin.ModelAdmin):
+    list_display = ['id', 'analytics', 'template_version', 'status', 'attempts', 'file_size', 'requested_at', 'generated_at']
+    list_filter = ['status', 'template_version']
+    readonly_fields = ['etag', 'requested_at', 'generated_at', 'claimed_at']
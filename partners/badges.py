@@ -0,0 +1,79 @@
+"""
+읽지 않은 메시지/알림 배지
+- 폴링 요청은 사용자별 UnreadCounter 행 한 건만 읽음 (COUNT 없음, 행이 없으면 모두 0)
+- 카운터는 메시지 signals / 알림 워커 / 공지 fan-out / 읽음 처리 경로에서 원자적으로 증감
+  (행은 처음 증가할 때 UPSERT로 생성 - 조회 시 COUNT로 만들지 않음)
+- 축제 공지는 수신자별 행이 없으므로 공지 생성/삭제와 지원서 상태 변경(대상 변경) 시 카운터만 증감
+- 어긋난 값은 reconcile_unread_counters 명령어로 주기적으로 보정
+"""
+
+from django.db.models import Count
+
+from .models import Announcement, AnnouncementReceipt, Application, Message, Notification, UnreadCounter
+
+
+def count_unread(user_ids):
+    """
+    사용자별 실제 읽지 않은 메시지/알림/공지 수 (사용자 목록 전체를 집계, 공지는 대상별 쿼리)
+
+    Returns:
+        dict: {user_id: {'messages': n, 'notifications': n, 'announcements': n}}
+    """
+    counts = {user_id: dict.fromkeys(UnreadCounter.COUNTER_FIELDS, 0) for user_id in user_ids}
+    for field, queryset, user_field in (
+        ('messages', Message.objects.filter(receiver_id__in=user_ids), 'receiver_id'),
+        ('notifications', Notification.objects.filter(user_id__in=user_ids), 'user_id'),
+    ):
+        rows = queryset.filter(read=False).values(user_field).annotate(count=Count('id'))
+        for row in rows.values_list(user_field, 'count'):
+            counts[row[0]][field] = row[1]
+
+    # 공지: (사용자, 받는 공지) 쌍에서 읽은 공지를 뺌 (지원서는 사용자/축제당 하나라 중복 없음)
+    read = set(AnnouncementReceipt.objects.filter(user_id__in=user_ids).values_list('user_id', 'announcement_id'))
+    for audience, statuses in Announcement.AUDIENCE_STATUSES.items():
+        received = Application.objects.filter(
+            partner__user_id__in=user_ids,
+            status__in=statuses,
+            event__announcements__audience=audience,
+        ).values_list('partner__user_id', 'event__announcements__id')
+        for pair in received:
+            if pair not in read:
+                counts[pair[0]]['announcements'] += 1
+    return counts
+
+
+def _unread_announcements(user_id, event_id, audiences):
+    """사용자가 읽지 않은 축제 공지 (대상 목록 중)"""
+    return Announcement.objects.filter(event_id=event_id, audience__in=audiences).unread_by(user_id)
+
+
+def audience_changed(user_id, event_id, old_status, new_status):
+    """
+    지원서 생성/상태 변경/삭제로 받는 공지가 바뀌면 읽지 않은 공지 카운터 증감
+    (공지를 받는 대상이 바뀌는 경우에만 조회)
+    """
+    old_audiences = Announcement.audiences_for(old_status)
+    new_audiences = Announcement.audiences_for(new_status)
+    delta = 0
+    if new_audiences - old_audiences:
+        delta += _unread_announcements(user_id, event_id, new_audiences - old_audiences).count()
+    if old_audiences - new_audiences:
+        delta -= _unread_announcements(user_id, event_id, old_audiences - new_audiences).count()
+    if delta:
+        UnreadCounter.bump(user_id, announcements=delta)
+
+
+def unread_badges(user_id):
+    """
+    사용자의 읽지 않은 메시지/알림 수 (카운터 행 한 건 조회)
+
+    Returns:
+        dict: messages (1:1 메시지 + 공지), notifications
+    """
+    badges = UnreadCounter.objects.filter(user_id=user_id).values(*UnreadCounter.COUNTER_FIELDS).first()
+    if badges is None:
+        badges = dict.fromkeys(UnreadCounter.COUNTER_FIELDS, 0)
+    return {
+        'messages': badges['messages'] + badges['announcements'],
+        'notifications': badges['notifications'],
+    }
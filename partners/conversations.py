@@ -0,0 +1,76 @@
+"""
+대화 스레드 비정규화 필드 관리
+- 새 1:1 메시지는 (보낸 사람, 받는 사람, 지원서) 스레드에 배정 (없으면 생성)
+- 마지막 메시지/참여자별 읽지 않은 수는 원자적 UPDATE로 갱신 (signals에서 호출)
+- 스레드는 메시지 생성 시점에 정해짐 (이후 받는 사람을 바꿔도 옮기지 않음)
+"""
+
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .dashboard import mark_dashboard_stale
+from .models import Conversation, Message, UnreadCounter
+
+
+def unread_field(message, user_id):
+    """메시지 스레드에서 user_id 쪽 읽지 않은 수 필드 (참여자는 보낸 사람과 user_id)"""
+    return 'low_unread' if user_id <= message.sender_id else 'high_unread'
+
+
+def conversation_for(sender_id, receiver_id, application_id=None):
+    low_id, high_id = Conversation.participants(sender_id, receiver_id)
+    conversation, _ = Conversation.objects.get_or_create(
+        participant_low_id=low_id,
+        participant_high_id=high_id,
+        application_id=application_id,
+    )
+    return conversation
+
+
+def record_message(message):
+    """새 메시지를 마지막 메시지로 반영하고 받는 사람의 읽지 않은 수 증가 (UPDATE 한 번)"""
+    updates = {'last_message_id': message.id, 'last_message_at': message.created_at}
+    if not message.read:
+        field = unread_field(message, message.receiver_id)
+        updates[field] = F(field) + 1
+    Conversation.objects.filter(pk=message.conversation_id).update(**updates)
+
+
+def adjust_unread(message, user_id, delta):
+    """읽음 상태 변경 시 스레드의 읽지 않은 수 증감 (0 아래로는 내려가지 않음)"""
+    if message.conversation_id is None or user_id is None:
+        return
+    field = unread_field(message, user_id)
+    Conversation.objects.filter(pk=message.conversation_id).update(
+        **{field: Greatest(F(field) + delta, Value(0))}
+    )
+
+
+def refresh_last_message(conversation_id):
+    """마지막 메시지가 삭제된 스레드의 마지막 메시지 다시 지정"""
+    latest = Message.objects.filter(
+        conversation_id=conversation_id
+    ).order_by('-id').values('id', 'created_at').first()
+    Conversation.objects.filter(pk=conversation_id, last_message__isnull=True).update(
+        last_message_id=latest['id'] if latest else None,
+        last_message_at=latest['created_at'] if latest else None,
+    )
+
+
+def mark_conversation_read(conversation, user_id):
+    """
+    스레드에서 user_id가 받은 메시지 모두 읽음 처리 (UPDATE 한 번, signals 없이 카운터 직접 갱신)
+
+    Returns:
+        int: 읽음 처리한 메시지 수
+    """
+    count = conversation.messages.filter(receiver_id=user_id, read=False).update(
+        read=True, read_at=timezone.now()
+    )
+    if count:
+        field = Conversation.unread_field(conversation.participant_low_id, user_id)
+        Conversation.objects.filter(pk=conversation.pk).update(**{field: 0})
+        UnreadCounter.bump(user_id, messages=-count)
+        mark_dashboard_stale(partner__user_id=user_id)
+    return count
@@ -0,0 +1,128 @@
+"""
+사업자 대시보드 스냅샷
+- 통계/최근 알림/다가오는 일정을 JSON 문서 하나로 미리 계산해 DashboardSnapshot에 저장
+- 지원서/메시지/알림 변경 시 signals에서 stale 표시 후 커밋되면 다시 계산
+- 날짜가 바뀌면 D-day가 달라지므로 refresh_dashboards 명령어로 매일 갱신
+- 대시보드 조회는 사용자 id로 스냅샷 한 건만 읽음
+"""
+
+from datetime import date
+
+from django.db import transaction
+
+from .models import DashboardSnapshot, Message, Partner
+from .stats import application_stats, application_timeline
+
+
+def build_dashboard(partner_id, user_id, today=None):
+    """DashboardView 응답 데이터 계산"""
+    today = today or date.today()
+
+    # 통계 / 지원서 기반 패널
+    counts = application_stats(partner_id)
+    stats = {key: counts[key] for key in ('pending', 'approved', 'completed', 'total')}
+    timeline = application_timeline(partner_id, today)
+
+    # 최근 알림
+    notifications = []
+    recent_messages = Message.objects.filter(
+        receiver_id=user_id,
+        read=False
+    ).order_by('-created_at').values('id', 'subject', 'created_at')[:5]
+
+    for msg in recent_messages:
+        notifications.append({
+            'id': msg['id'],
+            'type': 'message',
+            'message': msg['subject'],
+            'created_at': msg['created_at'],
+        })
+
+    # 최근 승인/거절된 지원서
+    for app in timeline['recent_reviewed']:
+        approved = app['status'] == 'approved'
+        notifications.append({
+            'id': app['id'],
+            'type': 'approval' if approved else 'rejection',
+            'message': f"{app['event_name']} 지원이 {'승인' if approved else '거절'}되었습니다.",
+            'created_at': app['reviewed_at'],
+        })
+
+    # 다가오는 일정
+    upcoming_events = [
+        {
+            'id': event['event_id'],
+            'name': event['name'],
+            'date': event['date'],
+            'd_day': (event['date'] - today).days,
+            'location': event['location'],
+            'status': event['status'],
+        }
+        for event in timeline['upcoming']
+    ]
+
+    return {
+        'stats': stats,
+        'notifications': sorted(
+            notifications,
+            key=lambda x: x['created_at'].timestamp() if x['created_at'] else 0,
+            reverse=True
+        )[:5],
+        'upcoming_events': upcoming_events,
+    }
+
+
+def refresh_dashboard_snapshot(partner_id, user_id=None, today=None):
+    """스냅샷 다시 계산 후 저장"""
+    today = today or date.today()
+    if user_id is None:
+        user_id = Partner.objects.values_list('user_id', flat=True).get(pk=partner_id)
+    data = build_dashboard(partner_id, user_id, today)
+    DashboardSnapshot.objects.update_or_create(
+        partner_id=partner_id,
+        defaults={'data': data, 'snapshot_date': today, 'stale': False},
+    )
+    return data
+
+
+def get_dashboard(user):
+    """
+    사용자의 대시보드 데이터 (스냅샷이 없거나 오래됐으면 다시 계산)
+
+    Returns:
+        dict 또는 사업자 프로필이 없으면 None
+    """
+    today = date.today()
+    snapshot = DashboardSnapshot.objects.filter(
+        partner__user_id=user.id
+    ).values('partner_id', 'data', 'snapshot_date', 'stale').first()
+    if snapshot and not snapshot['stale'] and snapshot['snapshot_date'] == today:
+        return snapshot['data']
+
+    if snapshot:
+        partner_id = snapshot['partner_id']
+    else:
+        partner_id = Partner.objects.filter(user_id=user.id).values_list('id', flat=True).first()
+        if partner_id is None:
+            return None
+    return refresh_dashboard_snapshot(partner_id, user.id, today)
+
+
+def refresh_stale_dashboards(**lookup):
+    """stale 표시된 스냅샷만 다시 계산 (같은 트랜잭션의 중복 요청은 한 번만 반영)"""
+    for partner_id, user_id in DashboardSnapshot.objects.filter(
+        stale=True, **lookup
+    ).values_list('partner_id', 'partner__user_id'):
+        refresh_dashboard_snapshot(partner_id, user_id)
+
+
+def mark_dashboard_stale(**lookup):
+    """
+    스냅샷을 stale로 표시하고 커밋 후 다시 계산 예약
+    - 트랜잭션이 롤백되면 stale 표시와 재계산 모두 취소됨
+
+    Args:
+        lookup: DashboardSnapshot 필터 (partner_id=... 또는 partner__user_id=...)
+    """
+    if DashboardSnapshot.objects.filter(stale=False, **lookup).update(stale=True):
+        transaction.on_commit(lambda: refresh_stale_dashboards(**lookup))
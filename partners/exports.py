@@ -0,0 +1,171 @@
+"""
+지원서 목록 내보내기 (엑셀 / CSV)
+- 행은 values_list().iterator()로 조금씩 읽음 (모델 객체/전체 목록을 메모리에 올리지 않음)
+- 엑셀: openpyxl write_only 워크북 -> 임시 파일에 저장 후 청크 단위로 전달
+  (행은 쓰는 즉시 임시 파일로 내려가고, 스타일은 셀마다 만들지 않고 이름 있는 스타일 하나를 공유)
+- CSV: 읽은 행을 바로 응답으로 내보냄 (첫 바이트가 즉시 나감, 엑셀에서 한글이 깨지지 않도록 BOM 포함)
+- 응답 스트림은 async iterator (ASGI에서 Django가 전체를 모아 두지 않도록)
+"""
+
+import csv
+import io
+import tempfile
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+from rest_framework.renderers import BaseRenderer
+
+from .models import Application
+
+
+HEADERS = [
+    'ID', 'Event Name', 'Status', 'Booth Type', 'Booth Size',
+    'Products', 'Price Range', 'Applied Date', 'Reviewed Date',
+    'Participation Fee', 'Payment Status', 'Booth Location'
+]
+FIELDS = [
+    'id', 'event__name', 'status', 'booth_type', 'booth_size',
+    'products', 'price_range', 'applied_at', 'reviewed_at',
+    'participation_fee', 'payment_status', 'booth_location'
+]
+COLUMN_WIDTH = 15
+HEADER_STYLE = 'export_header'
+
+ITERATOR_CHUNK_SIZE = 2000  # DB에서 한 번에 가져오는 행 수
+CSV_BATCH_ROWS = 500  # CSV 응답 청크 하나에 담는 행 수
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    ?format=csv 허용용 renderer (DRF는 format 파라미터에 맞는 renderer가 없으면 404)
+    CSV 응답은 StreamingHttpResponse로 직접 만들고, 오류 응답만 이 renderer를 거침
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, dict):
+            return '\n'.join(f'{key},{value}' for key, value in data.items()).encode(self.charset)
+        return str(data).encode(self.charset)
+
+
+def _display(field_name):
+    return dict(Application._meta.get_field(field_name).flatchoices)
+
+
+def application_rows(queryset):
+    """지원서 queryset -> 내보내기 행 (HEADERS 순서, iterator로 조금씩 조회)"""
+    statuses = _display('status')
+    booth_types = _display('booth_type')
+    booth_sizes = _display('booth_size')
+    payment_statuses = _display('payment_status')
+
+    rows = queryset.values_list(*FIELDS).iterator(chunk_size=ITERATOR_CHUNK_SIZE)
+    for (app_id, event_name, status, booth_type, booth_size, products, price_range,
+         applied_at, reviewed_at, participation_fee, payment_status, booth_location) in rows:
+        yield [
+            app_id,
+            event_name,
+            statuses.get(status, status),
+            booth_types.get(booth_type, booth_type),
+            booth_sizes.get(booth_size, booth_size),
+            products,
+            price_range,
+            applied_at.strftime('%Y-%m-%d'),
+            reviewed_at.strftime('%Y-%m-%d') if reviewed_at else '',
+            float(participation_fee),
+            payment_statuses.get(payment_status, payment_status),
+            booth_location,
+        ]
+
+
+def _header_style():
+    # NamedStyle은 워크북에 묶이므로 워크북마다 새로 만듦
+    return NamedStyle(
+        name=HEADER_STYLE,
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color="4CAF50", end_color="4CAF50", fill_type="solid"),
+        alignment=Alignment(horizontal="center", vertical="center"),
+    )
+
+
+def write_applications_xlsx(queryset, output):
+    """지원서 목록을 write_only 워크북으로 output(파일 객체)에 저장"""
+    wb = Workbook(write_only=True)
+    wb.add_named_style(_header_style())
+    ws = wb.create_sheet("Applications")
+
+    # 열 너비는 행을 쓰기 전에 지정해야 함 (write_only)
+    for col_num in range(1, len(HEADERS) + 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = COLUMN_WIDTH
+
+    header_cells = []
+    for header in HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = HEADER_STYLE
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in application_rows(queryset):
+        ws.append(row)
+    wb.save(output)
+
+
+def applications_xlsx_file(queryset):
+    """
+    엑셀 파일을 임시 파일로 생성
+
+    Returns:
+        file: 처음 위치로 되돌린 임시 파일 (닫으면 삭제)
+    """
+    output = tempfile.TemporaryFile()
+    try:
+        write_applications_xlsx(queryset, output)
+    except Exception:
+        output.close()
+        raise
+    output.seek(0)
+    return output
+
+
+async def stream_file(file, chunk_size=FILE_CHUNK_SIZE):
+    """파일을 청크 단위로 읽어 보내고 닫음 (StreamingHttpResponse용 async generator)"""
+    read = sync_to_async(file.read, thread_sensitive=False)
+    try:
+        while chunk := await read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
+
+
+async def stream_applications_csv(queryset):
+    """
+    지원서 CSV 스트림 (StreamingHttpResponse용 async generator)
+
+    헤더를 먼저 보내고, 이후 CSV_BATCH_ROWS행씩 읽는 대로 전달
+    (iterator는 요청 스레드에서만 진행 -> 같은 DB 연결 사용)
+    """
+    rows = application_rows(queryset)
+    next_batch = sync_to_async(lambda: list(islice(rows, CSV_BATCH_ROWS)))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    buffer.write('\ufeff')  # UTF-8 BOM
+    writer.writerow(HEADERS)
+    yield buffer.getvalue().encode('utf-8')
+
+    try:
+        while batch := await next_batch():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(batch)
+            yield buffer.getvalue().encode('utf-8')
+    finally:
+        # 중간에 끊기면 열린 DB 커서 정리
+        await sync_to_async(rows.close)()
@@ -0,0 +1,68 @@
+"""
+PDF 리포트 폰트 점검 Management Command
+등록된 한글 폰트를 확인하고 한글 샘플 문서를 만들어
+포함된 TTF가 모두 subset인지 (폰트 전체가 들어가지 않는지), 파일 크기가 한도 이내인지 확인
+(배포 환경에서 PDF_FONT_PATHS를 바꾼 뒤 실행)
+
+사용법:
+    python manage.py check_pdf_fonts
+    python manage.py check_pdf_fonts --max-size 200
+"""
+import re
+from io import BytesIO
+from django.core.management.base import BaseCommand, CommandError
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+from partners.pdf_generator import get_fonts, get_korean_style
+
+SAMPLE_TEXT = '축제 성과 리포트 - 방문객 1,234명, 평균 평점 4.5'
+
+# subset으로 포함된 폰트 이름은 'ABCDEF+폰트명' 형식
+SUBSET_FONT_NAME = re.compile(rb'^[A-Z]{6}\+')
+BASE_FONT = re.compile(rb'/BaseFont\s*/([^\s/<>\[\]]+)')
+STANDARD_FONTS = {b'Helvetica', b'Helvetica-Bold'}
+
+
+class Command(BaseCommand):
+    help = 'PDF 리포트 한글 폰트 등록과 subset 포함 여부를 점검합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-size',
+            type=int,
+            default=150,
+            help='샘플 문서 최대 크기(KB) (기본값: 150)'
+        )
+
+    def handle(self, *args, **options):
+        fonts = get_fonts()
+        styles = get_korean_style()
+        if fonts['embedded']:
+            self.stdout.write(f'폰트: {fonts["path"]} (bold: {fonts["bold"]})')
+        else:
+            self.stdout.write(self.style.WARNING(
+                f'한글 TTF를 찾지 못해 내장 CID 폰트({fonts["regular"]})를 사용합니다 (PDF에 폰트 미포함)'
+            ))
+
+        buffer = BytesIO()
+        SimpleDocTemplate(buffer, pagesize=A4).build([
+            Paragraph(SAMPLE_TEXT, styles['title']),
+            Paragraph(SAMPLE_TEXT, styles['body']),
+            Table([['항목', '값'], ['방문객', '1,234']], style=styles['kpi_table']),
+        ])
+        pdf = buffer.getvalue()
+
+        base_fonts = set(BASE_FONT.findall(pdf)) - STANDARD_FONTS
+        self.stdout.write(f'문서 폰트: {", ".join(sorted(name.decode() for name in base_fonts))}')
+        if fonts['embedded']:
+            full_fonts = [name for name in base_fonts if not SUBSET_FONT_NAME.match(name)]
+            if full_fonts:
+                raise CommandError(f'subset이 아닌 폰트가 포함되었습니다: {full_fonts}')
+
+        size_kb = len(pdf) / 1024
+        if size_kb > options['max_size']:
+            raise CommandError(f'샘플 문서가 {size_kb:.1f}KB로 한도({options["max_size"]}KB)를 넘었습니다.')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ 샘플 문서 {size_kb:.1f}KB' + (', 폰트 subset 확인 완료' if fonts['embedded'] else '')
+        ))
@@ -4,6 +4,7 @@ Usage: python manage.py generate_sample_data
 """
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta, date
 import random
@@ -195,6 +196,7 @@ class Command(BaseCommand):
 
         return partners
 
+    @transaction.atomic
     def create_applications(self, partners, events):
         """지원서 30개 생성 (다양한 상태)"""
         applications = []
@@ -248,16 +250,18 @@ class Command(BaseCommand):
                     app.booth_location = f'{random.choice(["A", "B", "C"])}-{random.randint(1, 30)}'
                     app.save()
 
-                # Partner 통계 업데이트
-                partner.total_applications += 1
-                if status_choice in ['approved', 'completed']:
-                    partner.total_approvals += 1
-                partner.save()
+                # Partner 통계 업데이트 (원자적 UPDATE, 다른 컬럼은 다시 쓰지 않음)
+                Partner.bump_counters(
+                    partner.id,
+                    applications=1,
+                    approvals=1 if status_choice in Application.APPROVED_STATUSES else 0,
+                )
 
                 applications.append(app)
 
         return applications
 
+    @transaction.atomic
     def create_messages(self, applications):
         """메시지 20개 생성"""
         messages = []
@@ -315,6 +319,7 @@ class Command(BaseCommand):
 
         return messages
 
+    @transaction.atomic
     def create_analytics(self, applications):
         """성과 데이터 15개 생성 - 현실적인 수치"""
         analytics_list = []
@@ -0,0 +1,93 @@
+"""
+알림 발송 워커 Management Command
+NotificationOutbox에 쌓인 이벤트를 배치로 읽어 Notification을 bulk_create
+(실패한 이벤트는 backoff 후 재시도, 한도 초과 시 failed로 보관)
+
+사용법:
+    python manage.py process_notification_outbox              # 계속 실행 (대기열 polling)
+    python manage.py process_notification_outbox --once       # 쌓인 이벤트만 처리하고 종료
+    python manage.py process_notification_outbox --retry-failed  # failed 이벤트를 다시 대기열로
+"""
+import time
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+from partners.models import NotificationOutbox
+from partners.notifications import process_outbox_batch
+
+
+class Command(BaseCommand):
+    help = '알림 발송 대기열(outbox)을 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='한 번에 처리할 이벤트 수 (기본값: 200)'
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=5,
+            help='이벤트별 최대 시도 횟수 (기본값: 5)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='대기열이 비었을 때 다시 확인하기까지 대기 시간(초) (기본값: 2)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='현재 처리 가능한 이벤트를 모두 처리하고 종료합니다'
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='재시도 한도를 넘은 이벤트를 다시 대기열에 넣고 종료합니다'
+        )
+
+    def handle(self, *args, **options):
+        if options['retry_failed']:
+            count = NotificationOutbox.objects.filter(status='failed').update(
+                status='pending', attempts=0
+            )
+            self.stdout.write(self.style.SUCCESS(f'실패한 이벤트 {count}개를 다시 대기열에 넣었습니다.'))
+            return
+
+        totals = {'events': 0, 'notifications': 0, 'failed': 0}
+        while True:
+            try:
+                events, notifications, failed = process_outbox_batch(
+                    batch_size=options['batch_size'],
+                    max_attempts=options['max_attempts'],
+                )
+            except DatabaseError as e:
+                # DB 연결 끊김 등 - 연결을 정리하고 다음 주기에 다시 시도
+                if options['once']:
+                    raise
+                self.stderr.write(self.style.ERROR(f'대기열 처리 실패: {e}'))
+                close_old_connections()
+                time.sleep(options['poll_interval'])
+                continue
+
+            totals['events'] += events
+            totals['notifications'] += notifications
+            totals['failed'] += failed
+            if events:
+                self.stdout.write(
+                    f'이벤트 {events}개 처리 - 알림 {notifications}개 생성'
+                    + (f', 재시도 대기 {failed}개' if failed else '')
+                )
+                continue
+
+            if options['once']:
+                break
+            close_old_connections()
+            time.sleep(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ 이벤트 {totals["events"]}개 처리, 알림 {totals["notifications"]}개 생성'
+            + (f', 실패 {totals["failed"]}개' if totals['failed'] else '')
+        ))
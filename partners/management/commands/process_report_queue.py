@@ -0,0 +1,62 @@
+"""
+성과 리포트 생성 워커 Management Command
+export-pdf 요청으로 대기열에 들어간 AnalyticsReport를 하나씩 PDF로 생성해 파일로 저장
+(실패한 리포트는 backoff 후 재시도, 한도 초과 시 failed로 보관 - 다음 다운로드 요청 때 다시 대기열로)
+
+사용법:
+    python manage.py process_report_queue          # 계속 실행 (대기열 polling)
+    python manage.py process_report_queue --once   # 쌓인 리포트만 생성하고 종료
+"""
+import time
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+from partners.reports import process_next_report
+
+
+class Command(BaseCommand):
+    help = '성과 리포트(PDF) 생성 대기열을 처리합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=3,
+            help='리포트별 최대 시도 횟수 (기본값: 3)'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='대기열이 비었을 때 다시 확인하기까지 대기 시간(초) (기본값: 2)'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='현재 대기 중인 리포트를 모두 생성하고 종료합니다'
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+        while True:
+            try:
+                report = process_next_report(max_attempts=options['max_attempts'])
+            except DatabaseError as e:
+                # DB 연결 끊김 등 - 연결을 정리하고 다음 주기에 다시 시도
+                if options['once']:
+                    raise
+                self.stderr.write(self.style.ERROR(f'대기열 처리 실패: {e}'))
+                close_old_connections()
+                time.sleep(options['poll_interval'])
+                continue
+
+            if report is not None:
+                processed += 1
+                self.stdout.write(f'리포트 {report.id} 처리 (성과 데이터 {report.analytics_id})')
+                continue
+
+            if options['once']:
+                break
+            close_old_connections()
+            time.sleep(options['poll_interval'])
+
+        self.stdout.write(self.style.SUCCESS(f'✓ 리포트 {processed}개 처리'))
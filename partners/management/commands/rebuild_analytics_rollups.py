@@ -0,0 +1,37 @@
+"""
+사업자 성과 요약 재계산 Management Command
+AnalyticsRollup을 성과 데이터 기준으로 다시 계산 (배포 후 기존 데이터 채우기, 직접 수정한 데이터 보정)
+
+사용법:
+    python manage.py rebuild_analytics_rollups
+    python manage.py rebuild_analytics_rollups --partner 12
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from partners.models import AnalyticsData, AnalyticsRollup, Partner
+from partners.rollups import rebuild_rollup
+
+
+class Command(BaseCommand):
+    help = '사업자별 성과 요약을 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--partner',
+            type=int,
+            action='append',
+            help='특정 사업자 id만 계산 (여러 번 지정 가능)'
+        )
+
+    def handle(self, *args, **options):
+        partner_ids = options['partner'] or sorted(
+            set(AnalyticsData.objects.values_list('partner_id', flat=True).distinct())
+            | set(AnalyticsRollup.objects.values_list('partner_id', flat=True))
+        )
+        partner_ids = list(Partner.objects.filter(id__in=partner_ids).values_list('id', flat=True))
+
+        for partner_id in partner_ids:
+            with transaction.atomic():
+                rebuild_rollup(partner_id)
+
+        self.stdout.write(self.style.SUCCESS(f'✓ 사업자 {len(partner_ids)}명의 성과 요약을 다시 계산했습니다.'))
@@ -0,0 +1,82 @@
+"""
+사업자 통계 카운터 재계산 Management Command
+Partner.total_applications / total_approvals를 Application 행 기준으로 다시 맞춤
+(이전 버전의 경쟁 조건이나 직접 수정한 데이터로 어긋난 값 보정)
+
+사용법:
+    python manage.py reconcile_partner_counters
+    python manage.py reconcile_partner_counters --dry-run
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
+from partners.models import Application, Partner
+
+
+class Command(BaseCommand):
+    help = '사업자 지원/승인 카운터를 지원서 데이터 기준으로 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='DB를 바꾸지 않고 어긋난 사업자만 출력합니다'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 갱신할 사업자 수 (기본값: 500)'
+        )
+
+    def handle(self, *args, **options):
+        partners = Partner.objects.annotate(
+            application_count=Count('applications'),
+            approval_count=Count(
+                'applications',
+                filter=Q(applications__status__in=Application.APPROVED_STATUSES)
+            ),
+        ).only('id', 'brand_name', 'total_applications', 'total_approvals')
+
+        drifted = []
+        for partner in partners.iterator():
+            if (partner.total_applications, partner.total_approvals) == (
+                partner.application_count, partner.approval_count
+            ):
+                continue
+            self.stdout.write(
+                f'  {partner.brand_name}: 지원 {partner.total_applications} → {partner.application_count}, '
+                f'승인 {partner.total_approvals} → {partner.approval_count}'
+            )
+            drifted.append(partner)
+
+        if drifted and not options['dry_run']:
+            with transaction.atomic():
+                for start in range(0, len(drifted), options['batch_size']):
+                    batch = drifted[start:start + options['batch_size']]
+                    # 조회 이후 들어온 증감분이 덮어써지지 않도록 행을 잠그고 다시 집계
+                    locked = Partner.objects.select_for_update().filter(
+                        id__in=[partner.id for partner in batch]
+                    ).values_list('id', flat=True)
+                    list(locked)
+                    counts = {
+                        row['partner_id']: row
+                        for row in Application.objects.filter(
+                            partner_id__in=[partner.id for partner in batch]
+                        ).values('partner_id').annotate(
+                            application_count=Count('id'),
+                            approval_count=Count(
+                                'id', filter=Q(status__in=Application.APPROVED_STATUSES)
+                            ),
+                        )
+                    }
+                    for partner in batch:
+                        row = counts.get(partner.id, {})
+                        partner.total_applications = row.get('application_count', 0)
+                        partner.total_approvals = row.get('approval_count', 0)
+                    Partner.objects.bulk_update(batch, ['total_applications', 'total_approvals'])
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'[DRY RUN] 어긋난 사업자: {len(drifted)}명'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ 카운터를 보정한 사업자: {len(drifted)}명'))
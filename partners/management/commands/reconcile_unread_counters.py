@@ -0,0 +1,83 @@
+"""
+읽지 않은 메시지/알림 카운터 재계산 Management Command
+UnreadCounter를 Message/Notification/Announcement 행 기준으로 다시 맞춤
+(스냅샷 없이 저장된 메시지, 지원서 삭제로 함께 지워진 알림 등으로 어긋난 값 보정)
+카운터 행이 없는 사용자도 읽지 않은 항목이 있으면 행을 만듦 (카운터 도입 전 데이터)
+주기적으로 (예: 매시간) 실행
+
+사용법:
+    python manage.py reconcile_unread_counters
+    python manage.py reconcile_unread_counters --dry-run
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from partners.badges import count_unread
+from partners.models import UnreadCounter
+
+
+class Command(BaseCommand):
+    help = '읽지 않은 메시지/알림/공지 카운터를 실제 데이터 기준으로 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='DB를 바꾸지 않고 어긋난 사용자만 출력합니다'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 집계할 사용자 수 (기본값: 500)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        user_ids = list(get_user_model().objects.order_by('id').values_list('id', flat=True))
+        fields = UnreadCounter.COUNTER_FIELDS
+
+        drifted = 0
+        for start in range(0, len(user_ids), batch_size):
+            batch_ids = user_ids[start:start + batch_size]
+            with transaction.atomic():
+                # 집계하는 동안 들어온 증감분이 덮어써지지 않도록 카운터 행을 잠그고 집계
+                counters = {
+                    counter.user_id: counter
+                    for counter in UnreadCounter.objects.select_for_update().filter(user_id__in=batch_ids)
+                }
+                counts = count_unread(batch_ids)
+
+                changed, created = [], []
+                for user_id in batch_ids:
+                    actual = counts[user_id]
+                    counter = counters.get(user_id)
+                    if counter is None:
+                        if not any(actual.values()):
+                            continue  # 행이 없으면 모두 0으로 읽힘
+                        counter = UnreadCounter(user_id=user_id)
+                        created.append(counter)
+                    elif all(getattr(counter, field) == actual[field] for field in fields):
+                        continue
+                    else:
+                        changed.append(counter)
+                    self.stdout.write(f'  사용자 {user_id}: ' + ', '.join(
+                        f'{field} {getattr(counter, field)} → {actual[field]}' for field in fields
+                    ))
+                    for field in fields:
+                        setattr(counter, field, actual[field])
+                    counter.updated_at = timezone.now()
+
+                drifted += len(changed) + len(created)
+                if not options['dry_run']:
+                    if changed:
+                        UnreadCounter.objects.bulk_update(changed, [*fields, 'updated_at'])
+                    if created:
+                        # 집계 중에 다른 요청이 만든 행은 그쪽 증감이 이미 반영됨 (다음 실행에서 보정)
+                        UnreadCounter.objects.bulk_create(created, ignore_conflicts=True)
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'[DRY RUN] 어긋난 사용자: {drifted}명'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'✓ 카운터를 보정한 사용자: {drifted}명'))
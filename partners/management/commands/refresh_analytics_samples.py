@@ -0,0 +1,32 @@
+"""
+샘플 성과 데이터 풀 갱신 Management Command
+자기 데이터가 없는 사업자에게 보여줄 샘플 풀을 다시 추출 (주기적으로, 예: 매일)
+
+사용법:
+    python manage.py refresh_analytics_samples
+    python manage.py refresh_analytics_samples --size 500
+"""
+from django.core.management.base import BaseCommand
+from partners.samples import SAMPLE_POOL_SIZE, refresh_sample_pool
+
+
+class Command(BaseCommand):
+    help = '샘플 성과 데이터 풀을 다시 추출합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size',
+            type=int,
+            default=SAMPLE_POOL_SIZE,
+            help=f'풀 크기 (기본값: {SAMPLE_POOL_SIZE})'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=None,
+            help='무작위 추출 seed (재현용)'
+        )
+
+    def handle(self, *args, **options):
+        size = refresh_sample_pool(size=options['size'], seed=options['seed'])
+        self.stdout.write(self.style.SUCCESS(f'✓ 샘플 풀 {size}개를 추출했습니다.'))
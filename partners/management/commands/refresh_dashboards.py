@@ -0,0 +1,40 @@
+"""
+사업자 대시보드 스냅샷 일괄 갱신 Management Command
+날짜가 바뀌면 D-day/다가오는 일정이 달라지므로 매일 자정 직후 실행 (cron 등)
+
+사용법:
+    python manage.py refresh_dashboards          # 기준일이 지났거나 stale인 스냅샷만
+    python manage.py refresh_dashboards --all    # 모든 사업자 (스냅샷이 없는 사업자 포함)
+"""
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from partners.dashboard import refresh_dashboard_snapshot
+from partners.models import DashboardSnapshot, Partner
+
+
+class Command(BaseCommand):
+    help = '사업자 대시보드 스냅샷을 다시 계산합니다 (D-day 갱신)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='스냅샷이 없는 사업자를 포함해 모두 다시 계산합니다'
+        )
+
+    def handle(self, *args, **options):
+        today = date.today()
+        if options['all']:
+            targets = Partner.objects.values_list('id', 'user_id')
+        else:
+            targets = DashboardSnapshot.objects.filter(
+                Q(snapshot_date__lt=today) | Q(stale=True)
+            ).values_list('partner_id', 'partner__user_id')
+
+        refreshed = 0
+        for partner_id, user_id in targets.iterator():
+            refresh_dashboard_snapshot(partner_id, user_id, today)
+            refreshed += 1
+
+        self.stdout.write(self.style.SUCCESS(f'대시보드 스냅샷 {refreshed}개를 갱신했습니다. (기준일: {today})'))
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+import rest_framework.utils.encoders
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0004_festivalbookmark_applicationdraft'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('data', models.JSONField(default=dict, encoder=rest_framework.utils.encoders.JSONEncoder, verbose_name='대시보드 데이터')),
+                ('snapshot_date', models.DateField(verbose_name='D-day 기준일')),
+                ('stale', models.BooleanField(default=False, verbose_name='갱신 필요')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('partner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_snapshot', to='partners.partner', verbose_name='사업자')),
+            ],
+            options={
+                'verbose_name': '대시보드 스냅샷',
+                'verbose_name_plural': '대시보드 스냅샷 목록',
+            },
+        ),
+    ]
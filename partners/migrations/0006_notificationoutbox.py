@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:41
+
+from django.db import migrations, models
+import django.utils.timezone
+import rest_framework.utils.encoders
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0005_dashboardsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('application_status', '지원서 제출/상태 변경'), ('message_received', '새 메시지'), ('analytics_ready', '성과 데이터 생성')], max_length=30)),
+                ('payload', models.JSONField(default=dict, encoder=rest_framework.utils.encoders.JSONEncoder, help_text='알림 생성에 필요한 값')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('failed', '실패 (재시도 초과)')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='이 시각 이후 처리 (재시도 backoff)')),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '알림 발송 대기열',
+                'verbose_name_plural': '알림 발송 대기열',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='partners_no_status_3b5ddb_idx')],
+            },
+        ),
+    ]
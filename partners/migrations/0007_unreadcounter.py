@@ -0,0 +1,29 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:46
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_options_user_social_id_and_more'),
+        ('partners', '0006_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='unread_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('messages', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 메시지')),
+                ('notifications', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 알림')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '읽지 않음 카운터',
+                'verbose_name_plural': '읽지 않음 카운터 목록',
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:50
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_eventmergecandidate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('partners', '0007_unreadcounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Announcement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audience', models.CharField(choices=[('approved', '승인된 사업자'), ('applicants', '지원한 모든 사업자')], default='approved', max_length=20, verbose_name='대상')),
+                ('subject', models.CharField(max_length=200, verbose_name='제목')),
+                ('content', models.TextField(verbose_name='내용')),
+                ('attachments', models.JSONField(blank=True, default=list, help_text='파일 URL 리스트')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='announcements', to='events.event', verbose_name='축제')),
+                ('sender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sent_announcements', to=settings.AUTH_USER_MODEL, verbose_name='보낸 사람')),
+            ],
+            options={
+                'verbose_name': '공지',
+                'verbose_name_plural': '공지 목록',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AnnouncementReceipt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('read_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('announcement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='receipts', to='partners.announcement')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='announcement_receipts', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '공지 읽음 기록',
+                'verbose_name_plural': '공지 읽음 기록 목록',
+                'unique_together': {('announcement', 'user')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='announcement',
+            index=models.Index(fields=['event', 'audience', '-created_at'], name='partners_an_event_i_b61970_idx'),
+        ),
+    ]
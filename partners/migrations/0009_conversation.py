@@ -0,0 +1,109 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:52
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_conversations(apps, schema_editor):
+    """기존 1:1 메시지를 (참여자 쌍, 지원서) 스레드로 묶고 비정규화 필드 계산"""
+    Conversation = apps.get_model('partners', 'Conversation')
+    Message = apps.get_model('partners', 'Message')
+
+    threads = {}
+    for message_id, sender_id, receiver_id, application_id, read, created_at in Message.objects.filter(
+        receiver__isnull=False
+    ).order_by('id').values_list(
+        'id', 'sender_id', 'receiver_id', 'application_id', 'read', 'created_at'
+    ).iterator():
+        low_id, high_id = sorted((sender_id, receiver_id))
+        thread = threads.setdefault((low_id, high_id, application_id), {
+            'message_ids': [], 'low_unread': 0, 'high_unread': 0,
+        })
+        thread['message_ids'].append(message_id)
+        thread['last'] = (message_id, created_at)
+        if not read:
+            thread['low_unread' if receiver_id == low_id else 'high_unread'] += 1
+
+    for (low_id, high_id, application_id), thread in threads.items():
+        conversation = Conversation.objects.create(
+            participant_low_id=low_id,
+            participant_high_id=high_id,
+            application_id=application_id,
+            last_message_id=thread['last'][0],
+            last_message_at=thread['last'][1],
+            low_unread=thread['low_unread'],
+            high_unread=thread['high_unread'],
+        )
+        Message.objects.filter(id__in=thread['message_ids']).update(conversation=conversation)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('partners', '0008_announcement'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_at', models.DateTimeField(blank=True, null=True, verbose_name='마지막 메시지 시각')),
+                ('low_unread', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 수 (작은 id)')),
+                ('high_unread', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 수 (큰 id)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '대화',
+                'verbose_name_plural': '대화 목록',
+            },
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='application',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='conversations', to='partners.application', verbose_name='관련 지원서'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='last_message',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='partners.message', verbose_name='마지막 메시지'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='participant_high',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='참여자 (큰 id)'),
+        ),
+        migrations.AddField(
+            model_name='conversation',
+            name='participant_low',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='참여자 (작은 id)'),
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='conversation',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='partners.conversation'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['conversation', '-id'], name='partners_me_convers_e3b401_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['participant_low', '-last_message_at', '-id'], name='partners_co_partici_0e697f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='conversation',
+            index=models.Index(fields=['participant_high', '-last_message_at', '-id'], name='partners_co_partici_0306b8_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(fields=('participant_low', 'participant_high', 'application'), name='unique_conversation_per_application'),
+        ),
+        migrations.AddConstraint(
+            model_name='conversation',
+            constraint=models.UniqueConstraint(condition=models.Q(('application__isnull', True)), fields=('participant_low', 'participant_high'), name='unique_conversation_without_application'),
+        ),
+        migrations.RunPython(backfill_conversations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0009_conversation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsSample',
+            fields=[
+                ('position', models.PositiveIntegerField(primary_key=True, serialize=False, verbose_name='풀 내 위치')),
+                ('analytics', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='partners.analyticsdata', verbose_name='성과 데이터')),
+            ],
+            options={
+                'verbose_name': '샘플 성과 데이터',
+                'verbose_name_plural': '샘플 성과 데이터 풀',
+                'ordering': ['position'],
+            },
+        ),
+    ]
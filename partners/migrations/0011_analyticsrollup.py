@@ -0,0 +1,35 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+import rest_framework.utils.encoders
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0010_analyticssample'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsRollup',
+            fields=[
+                ('partner', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='analytics_rollup', serialize=False, to='partners.partner', verbose_name='사업자')),
+                ('event_count', models.PositiveIntegerField(default=0, verbose_name='이벤트 수')),
+                ('total_visitors', models.BigIntegerField(default=0, verbose_name='총 방문객')),
+                ('total_sales', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='총 판매액')),
+                ('total_reviews', models.BigIntegerField(default=0, verbose_name='총 리뷰 수')),
+                ('rating_sum', models.FloatField(default=0, verbose_name='평점 합계')),
+                ('sentiment_sum', models.FloatField(default=0, verbose_name='감성 점수 합계')),
+                ('best_visitor_count', models.IntegerField(blank=True, null=True)),
+                ('best_event', models.JSONField(blank=True, encoder=rest_framework.utils.encoders.JSONEncoder, null=True)),
+                ('recent_events', models.JSONField(blank=True, default=list, encoder=rest_framework.utils.encoders.JSONEncoder)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '성과 요약',
+                'verbose_name_plural': '성과 요약 목록',
+            },
+        ),
+    ]
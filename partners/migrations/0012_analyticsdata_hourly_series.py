@@ -0,0 +1,34 @@
+# Generated by Django 4.2.16 on 2026-10-19 02:58
+
+from django.db import migrations, models
+
+from partners.timeseries import encode_hourly
+
+
+def backfill_hourly_series(apps, schema_editor):
+    """기존 hourly_visitors JSON을 고정 길이 배열로 변환"""
+    AnalyticsData = apps.get_model('partners', 'AnalyticsData')
+    batch = []
+    for analytics in AnalyticsData.objects.only('id', 'hourly_visitors').iterator():
+        analytics.hourly_series = encode_hourly(analytics.hourly_visitors)
+        batch.append(analytics)
+        if len(batch) >= 500:
+            AnalyticsData.objects.bulk_update(batch, ['hourly_series'])
+            batch = []
+    AnalyticsData.objects.bulk_update(batch, ['hourly_series'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0011_analyticsrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticsdata',
+            name='hourly_series',
+            field=models.BinaryField(default=b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00', verbose_name='시간대별 방문객 시계열'),
+        ),
+        migrations.RunPython(backfill_hourly_series, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0012_analyticsdata_hourly_series'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsReport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source_updated_at', models.DateTimeField(verbose_name='성과 데이터 수정 시각')),
+                ('template_version', models.PositiveIntegerField(verbose_name='리포트 템플릿 버전')),
+                ('status', models.CharField(choices=[('pending', '생성 대기'), ('processing', '생성 중'), ('ready', '완료'), ('failed', '실패 (재시도 초과)')], default='pending', max_length=20)),
+                ('file', models.FileField(blank=True, upload_to='reports/analytics/%Y/%m/', verbose_name='PDF 파일')),
+                ('etag', models.CharField(blank=True, help_text='PDF 내용 SHA-256', max_length=64)),
+                ('file_size', models.PositiveIntegerField(default=0, verbose_name='파일 크기 (bytes)')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('claimed_at', models.DateTimeField(blank=True, help_text='워커가 생성을 시작한 시각', null=True)),
+                ('requested_at', models.DateTimeField(auto_now_add=True)),
+                ('generated_at', models.DateTimeField(blank=True, null=True)),
+                ('analytics', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reports', to='partners.analyticsdata', verbose_name='성과 데이터')),
+            ],
+            options={
+                'verbose_name': '성과 리포트 파일',
+                'verbose_name_plural': '성과 리포트 파일 목록',
+                'indexes': [models.Index(fields=['status', 'requested_at'], name='partners_an_status_b2ef8a_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='analyticsreport',
+            constraint=models.UniqueConstraint(fields=('analytics', 'source_updated_at', 'template_version'), name='unique_analytics_report_version'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+RECENT_EVENTS_LIMIT = 3
+
+
+def backfill_analytics_ids(apps, schema_editor):
+    """기존 요약 행의 최고/최근 성과 데이터 id 채우기"""
+    AnalyticsData = apps.get_model('partners', 'AnalyticsData')
+    AnalyticsRollup = apps.get_model('partners', 'AnalyticsRollup')
+    for rollup in AnalyticsRollup.objects.iterator():
+        analytics = AnalyticsData.objects.filter(partner_id=rollup.partner_id)
+        rollup.best_analytics_id = analytics.order_by('-visitor_count').values_list('id', flat=True).first()
+        rollup.recent_analytics_ids = list(
+            analytics.order_by('-generated_at').values_list('id', flat=True)[:RECENT_EVENTS_LIMIT]
+        )
+        rollup.save(update_fields=['best_analytics', 'recent_analytics_ids'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0013_analyticsreport'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='analyticsrollup',
+            name='best_event',
+        ),
+        migrations.RemoveField(
+            model_name='analyticsrollup',
+            name='recent_events',
+        ),
+        migrations.AddField(
+            model_name='analyticsrollup',
+            name='best_analytics',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='partners.analyticsdata', verbose_name='최고 성과 데이터'),
+        ),
+        migrations.AddField(
+            model_name='analyticsrollup',
+            name='recent_analytics_ids',
+            field=models.JSONField(blank=True, default=list, help_text='최근 성과 데이터 id (최신순)'),
+        ),
+        migrations.RunPython(backfill_analytics_ids, migrations.RunPython.noop),
+    ]
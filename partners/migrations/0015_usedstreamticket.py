@@ -0,0 +1,25 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:34
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0014_analyticsrollup_analytics_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsedStreamTicket',
+            fields=[
+                ('nonce', models.CharField(max_length=32, primary_key=True, serialize=False)),
+                ('used_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': '사용한 스트림 티켓',
+                'verbose_name_plural': '사용한 스트림 티켓 목록',
+            },
+        ),
+    ]
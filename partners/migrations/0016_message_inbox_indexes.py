@@ -0,0 +1,21 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0015_usedstreamticket'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['receiver', '-created_at', '-id'], name='partners_me_receive_ec5a14_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['sender', '-created_at', '-id'], name='partners_me_sender__a639f8_idx'),
+        ),
+    ]
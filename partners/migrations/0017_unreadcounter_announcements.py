@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0016_message_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unreadcounter',
+            name='announcements',
+            field=models.PositiveIntegerField(default=0, verbose_name='읽지 않은 공지'),
+        ),
+    ]
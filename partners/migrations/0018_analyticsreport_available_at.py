@@ -0,0 +1,27 @@
+# Generated by Django 4.2.16 on 2026-10-19 03:51
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0017_unreadcounter_announcements'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='analyticsreport',
+            name='partners_an_status_b2ef8a_idx',
+        ),
+        migrations.AddField(
+            model_name='analyticsreport',
+            name='available_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='이 시각 이후 생성 (재시도 backoff)'),
+        ),
+        migrations.AddIndex(
+            model_name='analyticsreport',
+            index=models.Index(fields=['status', 'available_at'], name='partners_an_status_7bece4_idx'),
+        ),
+    ]
@@ -1,6 +1,49 @@
-from django.db import models
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.db.models import Exists, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Greatest
 from django.conf import settings
 from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from .timeseries import EMPTY_SERIES, encode_hourly
+
+
+class LoadedValuesMixin:
+    """
+    DB에서 읽은 시점의 필드 값 보관 (from_db 스냅샷)
+    - signals에서 이전 값을 알기 위해 저장 직전에 다시 SELECT 하지 않아도 됨
+    - 저장 후에는 저장된 값으로 스냅샷 갱신
+    """
+
+    # 스냅샷을 남길 필드 (attname 기준)
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value
+            for name, value in zip(field_names, values)
+            if name in cls.tracked_fields and value is not models.DEFERRED
+        }
+        return instance
+
+    def has_loaded_value(self, name):
+        return name in getattr(self, '_loaded_values', {})
+
+    def get_loaded_value(self, name, default=None):
+        """DB에서 읽은 (또는 마지막으로 저장한) 값"""
+        return getattr(self, '_loaded_values', {}).get(name, default)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            name: getattr(self, name)
+            for name in self.tracked_fields
+            if name not in self.get_deferred_fields()
+        }
 
 
 class Partner(models.Model):
@@ -119,10 +162,35 @@ class Partner(models.Model):
             return 0
         return round((self.total_approvals / self.total_applications) * 100, 1)
 
-
-class Application(models.Model):
+    def adjust_counters(self, applications=0, approvals=0):
+        """
+        통계 카운터 원자적 증감
+        - UPDATE ... SET total_x = total_x + n 한 번으로 처리 (동시 지원에도 값이 유실되지 않음)
+        - 카운터 컬럼만 갱신하고 Partner 행의 다른 필드는 다시 쓰지 않음
+        - 메모리의 값은 로컬 증감만 반영 (정확한 값이 필요하면 refresh_from_db)
+        """
+        Partner.bump_counters(self.pk, applications=applications, approvals=approvals)
+        self.total_applications += applications
+        self.total_approvals += approvals
+
+    @staticmethod
+    def bump_counters(partner_id, applications=0, approvals=0):
+        """adjust_counters와 같지만 Partner 객체를 로드하지 않고 id로만 갱신"""
+        updates = {}
+        if applications:
+            updates['total_applications'] = F('total_applications') + applications
+        if approvals:
+            updates['total_approvals'] = F('total_approvals') + approvals
+        if updates:
+            Partner.objects.filter(pk=partner_id).update(**updates)
+
+
+class Application(LoadedValuesMixin, models.Model):
     """축제 참여 지원서"""
 
+    # 상태 변경 알림용 (partners.signals)
+    tracked_fields = ('status',)
+
     STATUS_CHOICES = [
         ('pending', '검토중'),
         ('approved', '승인됨'),
@@ -268,28 +336,140 @@ class Application(models.Model):
     def __str__(self):
         return f"{self.partner.brand_name} → {self.event.name} ({self.get_status_display()})"
 
+    # Partner.total_approvals에 포함되는 상태
+    APPROVED_STATUSES = ('approved', 'completed')
+
     def approve(self, organizer_message=''):
-        """지원서 승인"""
+        """
+        지원서 승인
+        - 승인 수는 DB의 상태를 조건으로 바꾼 경우에만 증가 (동시에 승인해도 한 번만 셈)
+        """
         self.status = 'approved'
         self.organizer_message = organizer_message
         self.reviewed_at = timezone.now()
-        self.save()
+        with transaction.atomic():
+            # 조건부 UPDATE가 행을 잠그므로 동시 요청은 먼저 들어온 쪽이 커밋된 뒤 0건으로 끝남
+            newly_approved = Application.objects.filter(pk=self.pk).exclude(
+                status__in=self.APPROVED_STATUSES
+            ).update(status='approved')
+            self.save(update_fields=['status', 'organizer_message', 'reviewed_at', 'updated_at'])
 
-        # Partner 통계 업데이트
-        self.partner.total_approvals += 1
-        self.partner.save()
+            # Partner 통계 업데이트 (이미 승인된 지원서는 다시 세지 않음)
+            if newly_approved:
+                self._adjust_partner_approvals(1)
 
     def reject(self, rejection_reason=''):
-        """지원서 거절"""
+        """
+        지원서 거절
+        - 승인 수는 DB의 승인 상태를 조건으로 바꾼 경우에만 감소
+        """
         self.status = 'rejected'
         self.rejection_reason = rejection_reason
         self.reviewed_at = timezone.now()
-        self.save()
+        with transaction.atomic():
+            was_approved = Application.objects.filter(
+                pk=self.pk, status__in=self.APPROVED_STATUSES
+            ).update(status='rejected')
+            self.save(update_fields=['status', 'rejection_reason', 'reviewed_at', 'updated_at'])
+
+            # 승인을 취소한 경우 승인 수에서 제외
+            if was_approved:
+                self._adjust_partner_approvals(-1)
+
+    def _adjust_partner_approvals(self, delta):
+        """로드된 Partner가 있으면 메모리 값도 맞추고, 없으면 id로만 갱신"""
+        if self._meta.get_field('partner').is_cached(self):
+            self.partner.adjust_counters(approvals=delta)
+        else:
+            Partner.bump_counters(self.partner_id, approvals=delta)
+
+
+class Conversation(models.Model):
+    """
+    대화 스레드 - 두 사용자 사이의 메시지를 지원서별로 묶음
+    - 참여자는 (작은 id, 큰 id) 순서로 저장해 같은 쌍은 한 스레드만 가짐
+    - 마지막 메시지/참여자별 읽지 않은 수를 비정규화해 스레드 목록을 메시지 조회 없이 보여줌
+      (메시지 signals에서 갱신, partners.conversations)
+    """
+
+    participant_low = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='참여자 (작은 id)'
+    )
+    participant_high = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='참여자 (큰 id)'
+    )
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='conversations',
+        null=True,
+        blank=True,
+        verbose_name='관련 지원서'
+    )
 
+    # === 비정규화 ===
+    last_message = models.ForeignKey(
+        'Message',
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True,
+        verbose_name='마지막 메시지'
+    )
+    last_message_at = models.DateTimeField(null=True, blank=True, verbose_name='마지막 메시지 시각')
+    low_unread = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 수 (작은 id)')
+    high_unread = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 수 (큰 id)')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '대화'
+        verbose_name_plural = '대화 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['participant_low', 'participant_high', 'application'],
+                name='unique_conversation_per_application',
+            ),
+            # application이 NULL이면 위 제약이 적용되지 않으므로 따로 보장
+            models.UniqueConstraint(
+                fields=['participant_low', 'participant_high'],
+                condition=Q(application__isnull=True),
+                name='unique_conversation_without_application',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['participant_low', '-last_message_at', '-id']),
+            models.Index(fields=['participant_high', '-last_message_at', '-id']),
+        ]
+
+    def __str__(self):
+        return f"{self.participant_low_id} ↔ {self.participant_high_id} ({self.application_id or '-'})"
+
+    @staticmethod
+    def participants(user_id, other_id):
+        """(participant_low_id, participant_high_id)"""
+        return (user_id, other_id) if user_id <= other_id else (other_id, user_id)
 
-class Message(models.Model):
+    @staticmethod
+    def unread_field(conversation_participant_low_id, user_id):
+        return 'low_unread' if user_id == conversation_participant_low_id else 'high_unread'
+
+    def unread_for(self, user_id):
+        return getattr(self, Conversation.unread_field(self.participant_low_id, user_id))
+
+
+class Message(LoadedValuesMixin, models.Model):
     """주최자-사업자 간 메시지"""
 
+    # 읽지 않은 메시지 카운터 증감용 (partners.signals)
+    tracked_fields = ('read', 'receiver_id')
+
     MESSAGE_TYPE_CHOICES = [
         ('direct', '1:1 메시지'),
         ('announcement', '전체 공지'),
@@ -325,6 +505,15 @@ class Message(models.Model):
         blank=True
     )
 
+    # 대화 스레드 (1:1 메시지만, 생성 시 signals에서 지정)
+    conversation = models.ForeignKey(
+        Conversation,
+        on_delete=models.CASCADE,
+        related_name='messages',
+        null=True,
+        blank=True
+    )
+
     # === 메시지 내용 ===
     subject = models.CharField(max_length=200, verbose_name='제목')
     content = models.TextField(verbose_name='내용')
@@ -347,6 +536,12 @@ class Message(models.Model):
         verbose_name = '메시지'
         verbose_name_plural = '메시지 목록'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['conversation', '-id']),
+            # 받은편지함/보낸편지함 keyset 페이지네이션 (created_at, id 역순)
+            models.Index(fields=['receiver', '-created_at', '-id']),
+            models.Index(fields=['sender', '-created_at', '-id']),
+        ]
 
     def __str__(self):
         if self.message_type == 'announcement':
@@ -358,7 +553,153 @@ class Message(models.Model):
         if not self.read:
             self.read = True
             self.read_at = timezone.now()
-            self.save()
+            self.save(update_fields=['read', 'read_at'])
+
+
+class AnnouncementQuerySet(models.QuerySet):
+    """
+    공지 조회 (fan-out-on-read)
+    - 수신자별 행을 만들지 않고, 조회 시점에 사용자의 지원서로 대상 공지를 계산
+    - 읽음 여부는 읽은 사용자만 AnnouncementReceipt 행을 가짐 (sparse)
+    """
+
+    def for_user(self, user_id):
+        """사용자(사업자)가 받는 공지 - 지원한 축제 중 대상 조건에 맞는 공지"""
+        applications = Application.objects.filter(partner__user_id=user_id)
+        audience_filter = Q()
+        for audience, statuses in Announcement.AUDIENCE_STATUSES.items():
+            audience_filter |= Q(
+                audience=audience,
+                event_id__in=applications.filter(status__in=statuses).values('event_id'),
+            )
+        return self.filter(audience_filter)
+
+    def with_read_at(self, user_id):
+        """사용자의 읽은 시각 annotate (읽지 않았으면 None)"""
+        return self.annotate(read_at=Subquery(
+            AnnouncementReceipt.objects.filter(
+                announcement_id=OuterRef('pk'), user_id=user_id
+            ).values('read_at')[:1]
+        ))
+
+    def unread_by(self, user_id):
+        return self.exclude(Exists(
+            AnnouncementReceipt.objects.filter(announcement_id=OuterRef('pk'), user_id=user_id)
+        ))
+
+    def mark_read(self, user_id):
+        """
+        읽음 처리 (영수증이 없는 공지만 INSERT)
+
+        Returns:
+            int: 새로 읽음 처리한 공지 수
+        """
+        announcement_ids = list(self.unread_by(user_id).values_list('id', flat=True))
+        AnnouncementReceipt.objects.bulk_create([
+            AnnouncementReceipt(announcement_id=announcement_id, user_id=user_id)
+            for announcement_id in announcement_ids
+        ], ignore_conflicts=True)
+        if announcement_ids:
+            # 받는 공지만 읽지 않은 공지 카운터에 포함됨 (관리자가 읽은 공지는 제외)
+            received = Announcement.objects.for_user(user_id).filter(id__in=announcement_ids).count()
+            UnreadCounter.bump(user_id, announcements=-received)
+        return len(announcement_ids)
+
+
+class Announcement(models.Model):
+    """
+    축제 단위 전체 공지 - 공지 한 건은 대상 인원과 무관하게 INSERT 한 번
+    받은편지함/읽지 않은 메시지 수에서 1:1 메시지와 합쳐서 보여줌
+    """
+
+    AUDIENCE_CHOICES = [
+        ('approved', '승인된 사업자'),
+        ('applicants', '지원한 모든 사업자'),
+    ]
+    # 대상별 공지를 받는 지원서 상태
+    AUDIENCE_STATUSES = {
+        'approved': Application.APPROVED_STATUSES,
+        'applicants': ('pending', 'approved', 'rejected', 'completed'),
+    }
+
+    event = models.ForeignKey(
+        'events.Event',
+        on_delete=models.CASCADE,
+        related_name='announcements',
+        verbose_name='축제'
+    )
+    audience = models.CharField(
+        max_length=20,
+        choices=AUDIENCE_CHOICES,
+        default='approved',
+        verbose_name='대상'
+    )
+    sender = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='sent_announcements',
+        verbose_name='보낸 사람'
+    )
+
+    # === 공지 내용 ===
+    subject = models.CharField(max_length=200, verbose_name='제목')
+    content = models.TextField(verbose_name='내용')
+    attachments = models.JSONField(
+        default=list,
+        blank=True,
+        help_text='파일 URL 리스트'
+    )
+
+    # === 타임스탬프 ===
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = AnnouncementQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = '공지'
+        verbose_name_plural = '공지 목록'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['event', 'audience', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"[공지] {self.subject}"
+
+    @classmethod
+    def audiences_for(cls, status):
+        """지원서 상태가 받는 공지 대상 (상태가 없으면 빈 set)"""
+        return {audience for audience, statuses in cls.AUDIENCE_STATUSES.items() if status in statuses}
+
+    def recipient_ids(self):
+        """공지를 받는 사용자 id (대상 조건에 맞는 지원서의 사업자)"""
+        return Application.objects.filter(
+            event_id=self.event_id, status__in=self.AUDIENCE_STATUSES[self.audience]
+        ).values_list('partner__user_id', flat=True)
+
+
+class AnnouncementReceipt(models.Model):
+    """공지 읽음 기록 (읽은 사용자만 행이 있음)"""
+
+    announcement = models.ForeignKey(
+        Announcement,
+        on_delete=models.CASCADE,
+        related_name='receipts'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='announcement_receipts'
+    )
+    read_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = '공지 읽음 기록'
+        verbose_name_plural = '공지 읽음 기록 목록'
+        unique_together = ['announcement', 'user']
+
+    def __str__(self):
+        return f"{self.user_id} - {self.announcement_id}"
 
 
 class AnalyticsData(models.Model):
@@ -408,6 +749,11 @@ class AnalyticsData(models.Model):
         blank=True,
         help_text='{"10": 120, "11": 250, ...}'
     )
+    # 0~23시 고정 길이 배열 (save()에서 hourly_visitors로 갱신, partners.timeseries)
+    hourly_series = models.BinaryField(
+        default=EMPTY_SERIES,
+        verbose_name='시간대별 방문객 시계열'
+    )
 
     # === 인기 제품 ===
     top_products = models.JSONField(
@@ -452,6 +798,134 @@ class AnalyticsData(models.Model):
     def __str__(self):
         return f"{self.partner.brand_name} - {self.event.name} 성과"
 
+    def save(self, *args, **kwargs):
+        self.hourly_series = encode_hourly(self.hourly_visitors)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'hourly_visitors' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'hourly_series'}
+        super().save(*args, **kwargs)
+
+
+class AnalyticsRollup(models.Model):
+    """
+    사업자별 성과 요약 (AnalyticsViewSet.summary 응답을 행 하나로 미리 계산)
+    - 새 성과 데이터는 합계/최고 성과/최근 목록에 바로 더함, 수정/삭제 시에는 사업자 단위로 다시 계산
+      (signals -> partners.rollups, 요약 행을 잠근 뒤 갱신)
+    - 평균은 합계/개수로 조회 시 계산
+    """
+
+    partner = models.OneToOneField(
+        Partner,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='analytics_rollup',
+        verbose_name='사업자'
+    )
+    event_count = models.PositiveIntegerField(default=0, verbose_name='이벤트 수')
+    total_visitors = models.BigIntegerField(default=0, verbose_name='총 방문객')
+    total_sales = models.DecimalField(max_digits=14, decimal_places=2, default=0, verbose_name='총 판매액')
+    total_reviews = models.BigIntegerField(default=0, verbose_name='총 리뷰 수')
+    rating_sum = models.FloatField(default=0, verbose_name='평점 합계')
+    sentiment_sum = models.FloatField(default=0, verbose_name='감성 점수 합계')
+
+    # 최고 성과 / 최근 성과 데이터 (id만 저장 - 이벤트/브랜드 이름은 조회 시 직렬화해 변경이 바로 반영됨)
+    best_visitor_count = models.IntegerField(null=True, blank=True)
+    best_analytics = models.ForeignKey(
+        AnalyticsData,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='최고 성과 데이터'
+    )
+    recent_analytics_ids = models.JSONField(default=list, blank=True, help_text='최근 성과 데이터 id (최신순)')
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '성과 요약'
+        verbose_name_plural = '성과 요약 목록'
+
+    def __str__(self):
+        return f"{self.partner_id} 성과 요약 ({self.event_count}개)"
+
+
+class AnalyticsSample(models.Model):
+    """
+    샘플 성과 데이터 풀 - 자기 데이터가 없는 사업자에게 보여줄 예시 데이터
+    refresh_analytics_samples 명령어로 주기적으로 무작위 추출해 위치(position) 순으로 저장
+    사업자별 샘플은 사업자 id로 고정된 위치를 골라 PK 조회 (partners.samples)
+    """
+
+    position = models.PositiveIntegerField(primary_key=True, verbose_name='풀 내 위치')
+    analytics = models.ForeignKey(
+        AnalyticsData,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='성과 데이터'
+    )
+
+    class Meta:
+        verbose_name = '샘플 성과 데이터'
+        verbose_name_plural = '샘플 성과 데이터 풀'
+        ordering = ['position']
+
+    def __str__(self):
+        return f"#{self.position} - {self.analytics_id}"
+
+
+class AnalyticsReport(models.Model):
+    """
+    성과 데이터 PDF 리포트 파일 (partners.reports)
+    - (성과 데이터, 성과 데이터 수정 시각, 리포트 템플릿 버전) 조합마다 한 번만 생성
+      -> 데이터나 템플릿이 바뀌면 새 키로 다시 생성, 그 전까지는 저장된 파일을 그대로 내려줌
+    - 생성은 process_report_queue 워커가 처리 (웹 요청은 대기열에 넣기만 함)
+    """
+
+    STATUS_CHOICES = [
+        ('pending', '생성 대기'),
+        ('processing', '생성 중'),
+        ('ready', '완료'),
+        ('failed', '실패 (재시도 초과)'),
+    ]
+
+    analytics = models.ForeignKey(
+        AnalyticsData,
+        on_delete=models.CASCADE,
+        related_name='reports',
+        verbose_name='성과 데이터'
+    )
+    source_updated_at = models.DateTimeField(verbose_name='성과 데이터 수정 시각')
+    template_version = models.PositiveIntegerField(verbose_name='리포트 템플릿 버전')
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    file = models.FileField(upload_to='reports/analytics/%Y/%m/', blank=True, verbose_name='PDF 파일')
+    etag = models.CharField(max_length=64, blank=True, help_text='PDF 내용 SHA-256')
+    file_size = models.PositiveIntegerField(default=0, verbose_name='파일 크기 (bytes)')
+
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(default=timezone.now, help_text='이 시각 이후 생성 (재시도 backoff)')
+    claimed_at = models.DateTimeField(null=True, blank=True, help_text='워커가 생성을 시작한 시각')
+    requested_at = models.DateTimeField(auto_now_add=True)
+    generated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = '성과 리포트 파일'
+        verbose_name_plural = '성과 리포트 파일 목록'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['analytics', 'source_updated_at', 'template_version'],
+                name='unique_analytics_report_version',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.analytics_id} 리포트 v{self.template_version} ({self.get_status_display()})"
+
 
 class ImageUpload(models.Model):
     """파일 업로드 관리 모델"""
@@ -519,6 +993,30 @@ class ImageUpload(models.Model):
         return None
 
 
+class NotificationQuerySet(models.QuerySet):
+    """알림 일괄 처리 (행마다 저장하지 않고 UPDATE/DELETE 한 번)"""
+
+    def mark_read(self):
+        """
+        읽지 않은 알림 읽음 처리
+
+        Returns:
+            int: 읽음 처리한 알림 수
+        """
+        return self.filter(read=False).update(read=True, read_at=timezone.now())
+
+    def purge_read(self, days):
+        """
+        읽은 지 days일이 지난 알림 삭제
+
+        Returns:
+            int: 삭제한 알림 수
+        """
+        cutoff = timezone.now() - timedelta(days=days)
+        deleted, _ = self.filter(read=True, read_at__lt=cutoff).delete()
+        return deleted
+
+
 class Notification(models.Model):
     """알림 모델"""
 
@@ -584,6 +1082,8 @@ class Notification(models.Model):
     # === 타임스탬프 ===
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성 시각')
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         verbose_name = '알림'
         verbose_name_plural = '알림 목록'
@@ -596,11 +1096,13 @@ class Notification(models.Model):
         return f"{self.user.username} - {self.title} ({self.get_notification_type_display()})"
 
     def mark_as_read(self):
-        """읽음 처리"""
-        if not self.read:
-            self.read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=['read', 'read_at'])
+        """읽음 처리 (실제로 읽음 상태가 바뀐 경우에만 카운터 감소)"""
+        if self.read:
+            return
+        self.read = True
+        self.read_at = timezone.now()
+        if Notification.objects.filter(pk=self.pk, read=False).update(read=True, read_at=self.read_at):
+            UnreadCounter.bump(self.user_id, notifications=-1)
 
 
 class ApplicationDraft(models.Model):
@@ -676,3 +1178,160 @@ class FestivalBookmark(models.Model):
 
     def __str__(self):
         return f"{self.partner.brand_name} ❤️ {self.event.name}"
+
+
+class DashboardSnapshot(models.Model):
+    """
+    사업자 대시보드 스냅샷 - DashboardView 응답을 JSON 문서 하나로 미리 계산해 저장
+    지원서/메시지가 바뀌면 signals에서 갱신, D-day는 refresh_dashboards(매일)로 갱신
+    """
+
+    partner = models.OneToOneField(
+        Partner,
+        on_delete=models.CASCADE,
+        related_name='dashboard_snapshot',
+        verbose_name='사업자'
+    )
+    # API 응답과 같은 형식으로 저장 (DRF JSON 인코더)
+    data = models.JSONField(default=dict, encoder=JSONEncoder, verbose_name='대시보드 데이터')
+    snapshot_date = models.DateField(verbose_name='D-day 기준일')
+    stale = models.BooleanField(default=False, verbose_name='갱신 필요')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '대시보드 스냅샷'
+        verbose_name_plural = '대시보드 스냅샷 목록'
+
+    def __str__(self):
+        return f"{self.partner.brand_name} 대시보드 ({self.snapshot_date})"
+
+
+class NotificationOutbox(models.Model):
+    """
+    알림 발송 대기열 (transactional outbox)
+    signals는 원본 변경과 같은 트랜잭션에서 이벤트 한 줄만 기록하고,
+    process_notification_outbox 워커가 모아서 Notification을 생성
+    """
+
+    EVENT_CHOICES = [
+        ('application_status', '지원서 제출/상태 변경'),
+        ('message_received', '새 메시지'),
+        ('analytics_ready', '성과 데이터 생성'),
+    ]
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('failed', '실패 (재시도 초과)'),
+    ]
+
+    event_type = models.CharField(max_length=30, choices=EVENT_CHOICES)
+    payload = models.JSONField(default=dict, encoder=JSONEncoder, help_text='알림 생성에 필요한 값')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now, help_text='이 시각 이후 처리 (재시도 backoff)')
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '알림 발송 대기열'
+        verbose_name_plural = '알림 발송 대기열'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_event_type_display()} #{self.id} ({self.get_status_display()})"
+
+
+class UnreadCounter(models.Model):
+    """
+    사용자별 읽지 않은 메시지/알림/공지 수 (배지 폴링용 비정규화 카운터)
+    메시지/알림/공지 생성과 읽음 처리 경로에서 원자적으로 증감하고,
+    reconcile_unread_counters 명령어로 주기적으로 실제 값과 맞춤
+    행은 처음 증가할 때 만들어짐 (행이 없으면 모두 0)
+    """
+
+    COUNTER_FIELDS = ('messages', 'notifications', 'announcements')
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unread_counter',
+        verbose_name='사용자'
+    )
+    messages = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 메시지')
+    notifications = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 알림')
+    announcements = models.PositiveIntegerField(default=0, verbose_name='읽지 않은 공지')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '읽지 않음 카운터'
+        verbose_name_plural = '읽지 않음 카운터 목록'
+
+    def __str__(self):
+        return f"{self.user_id}: 메시지 {self.messages}, 알림 {self.notifications}, 공지 {self.announcements}"
+
+    @staticmethod
+    def _updates(deltas):
+        updates = {}
+        for field, delta in deltas.items():
+            if delta > 0:
+                updates[field] = F(field) + delta
+            elif delta < 0:
+                updates[field] = Greatest(F(field) + delta, Value(0))
+        return updates
+
+    @staticmethod
+    def _create_missing(user_ids):
+        """없는 카운터 행을 0으로 생성 (INSERT ... ON CONFLICT DO NOTHING, 동시에 만들어도 안전)"""
+        UnreadCounter.objects.bulk_create(
+            [UnreadCounter(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+        )
+
+    @staticmethod
+    def bump(user_id, messages=0, notifications=0, announcements=0):
+        """
+        카운터 원자적 증감 (보통 UPDATE 한 번, 0 아래로는 내려가지 않음)
+        - 아직 카운터 행이 없는 사용자는 0인 행을 만든 뒤 증가 (감소만 있으면 그대로 0)
+        """
+        deltas = {'messages': messages, 'notifications': notifications, 'announcements': announcements}
+        updates = UnreadCounter._updates(deltas)
+        if not updates or user_id is None:
+            return
+        counter = UnreadCounter.objects.filter(user_id=user_id)
+        if counter.update(updated_at=timezone.now(), **updates):
+            return
+        if any(delta > 0 for delta in deltas.values()):
+            UnreadCounter._create_missing([user_id])
+            counter.update(updated_at=timezone.now(), **updates)
+
+    @staticmethod
+    def bump_many(user_ids, messages=0, notifications=0, announcements=0):
+        """여러 사용자 카운터를 같은 값만큼 증감 (공지 fan-out 등, 쿼리 두 번)"""
+        deltas = {'messages': messages, 'notifications': notifications, 'announcements': announcements}
+        updates = UnreadCounter._updates(deltas)
+        user_ids = {user_id for user_id in user_ids if user_id is not None}
+        if not updates or not user_ids:
+            return
+        if any(delta > 0 for delta in deltas.values()):
+            UnreadCounter._create_missing(user_ids)
+        UnreadCounter.objects.filter(user_id__in=user_ids).update(updated_at=timezone.now(), **updates)
+
+class UsedStreamTicket(models.Model):
+    """
+    사용한 스트림 티켓 (partners.streaming.redeem_ticket)
+    - nonce가 기본키라 여러 워커/인스턴스에 같은 티켓이 동시에 들어와도 INSERT 하나만 성공
+      (프로세스별 LocMemCache와 달리 모든 워커가 같은 기록을 봄)
+    - 유효 시간이 지난 행은 티켓을 사용할 때 정리
+    """
+
+    nonce = models.CharField(max_length=32, primary_key=True)
+    used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name = '사용한 스트림 티켓'
+        verbose_name_plural = '사용한 스트림 티켓 목록'
+
+    def __str__(self):
+        return f"{self.nonce} ({self.used_at})"
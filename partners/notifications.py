@@ -0,0 +1,269 @@
+"""
+알림 fan-out (transactional outbox)
+- signals: enqueue()로 NotificationOutbox에 이벤트 한 줄만 기록
+  (호출한 쪽의 트랜잭션이 있으면 그 안에서 원본 변경과 함께 커밋/롤백)
+- 워커: process_outbox_batch()로 대기열을 모아 Notification을 bulk_create
+- 실패한 이벤트는 backoff 후 재시도, 재시도 한도를 넘으면 failed로 남김
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from events.models import Event
+
+from .models import Application, Notification, NotificationOutbox, Partner, UnreadCounter
+from .streaming import publish
+
+
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 60 * 60
+
+
+def enqueue(event_type, **payload):
+    """
+    알림 이벤트 기록 (요청 경로에서는 INSERT 한 번)
+    - 호출한 쪽의 atomic 블록이 있으면 합류하므로 원본 행과 outbox 행이 같이 커밋됨
+    """
+    with transaction.atomic():
+        return NotificationOutbox.objects.create(event_type=event_type, payload=payload)
+
+
+def _application_notifications(payload, context):
+    """지원서 제출/승인/거절/완료 알림"""
+    user_id = context['partner_users'].get(payload['partner_id'])
+    event_name = context['event_names'].get(payload['event_id'], '')
+    if user_id is None:
+        return []
+
+    base = {
+        'user_id': user_id,
+        'application_id': payload['application_id'],
+        'link': '/partner/applications',
+    }
+    extra = {'event_id': payload['event_id'], 'event_name': event_name}
+    status = payload['status']
+
+    # 새로 생성된 지원서 (제출)
+    if payload['created']:
+        return [Notification(
+            **base,
+            notification_type='application_submitted',
+            title='지원서 제출 완료',
+            message=f'{event_name}에 지원서를 제출했습니다. 검토 결과를 기다려 주세요.',
+            extra_data=extra,
+        )]
+
+    # 승인됨
+    if status == 'approved':
+        notifications = [Notification(
+            **base,
+            notification_type='application_approved',
+            title=f'{event_name} 지원 승인!',
+            message=f'축하합니다! {event_name} 지원이 승인되었습니다.\n부스 위치: {payload["booth_location"] or "추후 안내"}',
+            extra_data={
+                **extra,
+                'booth_location': payload['booth_location'],
+                'organizer_message': payload['organizer_message'],
+            },
+        )]
+
+        # 결제 필요 알림 (미결제 상태인 경우)
+        if payload['payment_status'] == 'unpaid' and float(payload['participation_fee']) > 0:
+            notifications.append(Notification(
+                **base,
+                notification_type='payment_required',
+                title='참가비 결제 필요',
+                message=f'{event_name} 참가비({payload["participation_fee"]}원)를 결제해 주세요.',
+                extra_data={**extra, 'amount': payload['participation_fee']},
+            ))
+        return notifications
+
+    # 거절됨
+    if status == 'rejected':
+        return [Notification(
+            **base,
+            notification_type='application_rejected',
+            title=f'{event_name} 지원 결과 안내',
+            message=f'아쉽게도 {event_name} 지원이 선정되지 못했습니다.\n사유: {payload["rejection_reason"] or "자세한 내용은 주최측 메시지를 확인해 주세요."}',
+            extra_data={**extra, 'rejection_reason': payload['rejection_reason']},
+        )]
+
+    # 완료됨
+    if status == 'completed':
+        return [Notification(
+            **{**base, 'link': '/partner/analytics'},
+            notification_type='analytics_ready',
+            title=f'{event_name} 참여 완료',
+            message=f'{event_name} 축제가 성공적으로 마무리되었습니다. 성과 데이터를 확인해 보세요!',
+            extra_data=extra,
+        )]
+
+    return []
+
+
+def _message_notifications(payload, context):
+    """새 메시지 알림 (받는 사람에게만)"""
+    sender_name = context['usernames'].get(payload['sender_id'], '')
+    return [Notification(
+        user_id=payload['receiver_id'],
+        notification_type='message_received',
+        title='새 메시지',
+        message=f'{sender_name}님으로부터 새 메시지가 도착했습니다.\n제목: {payload["subject"]}',
+        link='/partner/messages',
+        application_id=payload['application_id'],
+        extra_data={
+            'message_id': payload['message_id'],
+            'sender': sender_name,
+            'subject': payload['subject'],
+        },
+    )]
+
+
+def _analytics_notifications(payload, context):
+    """성과 데이터 생성 알림"""
+    user_id = context['partner_users'].get(payload['partner_id'])
+    event_name = context['event_names'].get(payload['event_id'], '')
+    if user_id is None:
+        return []
+    return [Notification(
+        user_id=user_id,
+        notification_type='analytics_ready',
+        title='성과 데이터 준비 완료',
+        message=f'{event_name}의 성과 데이터가 생성되었습니다. 지금 확인해 보세요!',
+        link='/partner/analytics',
+        application_id=payload['application_id'],
+        extra_data={
+            'event_id': payload['event_id'],
+            'event_name': event_name,
+            'analytics_id': payload['analytics_id'],
+            'visitor_count': payload['visitor_count'],
+            'average_rating': payload['average_rating'],
+        },
+    )]
+
+
+BUILDERS = {
+    'application_status': _application_notifications,
+    'message_received': _message_notifications,
+    'analytics_ready': _analytics_notifications,
+}
+
+
+def _payload_ids(records, key):
+    return {r.payload[key] for r in records if r.payload.get(key) is not None}
+
+
+def _load_context(records):
+    """배치 전체에 필요한 사용자/축제/지원서 정보를 한 번에 조회"""
+    partner_ids = _payload_ids(records, 'partner_id')
+    event_ids = _payload_ids(records, 'event_id')
+    user_ids = _payload_ids(records, 'sender_id') | _payload_ids(records, 'receiver_id')
+    application_ids = _payload_ids(records, 'application_id')
+    User = get_user_model()
+    context = {
+        'partner_users': dict(
+            Partner.objects.filter(id__in=partner_ids).values_list('id', 'user_id')
+        ) if partner_ids else {},
+        'event_names': dict(
+            Event.objects.filter(id__in=event_ids).values_list('id', 'name')
+        ) if event_ids else {},
+        'usernames': dict(
+            User.objects.filter(id__in=user_ids).values_list('id', 'username')
+        ) if user_ids else {},
+        'application_ids': set(
+            Application.objects.filter(id__in=application_ids).values_list('id', flat=True)
+        ) if application_ids else set(),
+    }
+    # 알림을 받을 수 있는 (아직 존재하는) 사용자
+    context['user_ids'] = set(context['partner_users'].values()) | set(context['usernames'])
+    return context
+
+
+def _is_deliverable(notification, context):
+    """
+    이벤트 기록 후 삭제된 사용자/지원서를 가리키는 알림은 건너뜀
+    (FK 검사가 커밋 시점으로 미뤄지는 DB에서 배치 전체가 실패하지 않도록)
+    """
+    if notification.application_id is not None and notification.application_id not in context['application_ids']:
+        return False
+    return notification.user_id in context['user_ids']
+
+
+def _deliver(records):
+    """이벤트 목록 -> Notification bulk_create (호출한 트랜잭션 안에서)"""
+    context = _load_context(records)
+    notifications = []
+    for record in records:
+        notifications.extend(
+            notification
+            for notification in BUILDERS[record.event_type](record.payload, context)
+            if _is_deliverable(notification, context)
+        )
+    Notification.objects.bulk_create(notifications)
+
+    # bulk_create는 post_save를 보내지 않으므로 읽지 않은 알림 카운터는 여기서 증가
+    user_counts = Counter(notification.user_id for notification in notifications)
+    for user_id, count in user_counts.items():
+        UnreadCounter.bump(user_id, notifications=count)
+
+    # 커밋되면 연결된 스트림에 새 알림 신호
+    if user_counts:
+        transaction.on_commit(lambda: publish(user_counts), robust=True)
+    return len(notifications)
+
+
+def _retry_later(record, error, max_attempts):
+    record.attempts += 1
+    record.last_error = f'{type(error).__name__}: {error}'[:2000]
+    if record.attempts >= max_attempts:
+        record.status = 'failed'
+    else:
+        delay = min(RETRY_BASE_SECONDS * 2 ** (record.attempts - 1), RETRY_MAX_SECONDS)
+        record.available_at = timezone.now() + timedelta(seconds=delay)
+    record.save(update_fields=['attempts', 'last_error', 'status', 'available_at'])
+
+
+def process_outbox_batch(batch_size=200, max_attempts=5):
+    """
+    처리 가능한 대기열 이벤트를 한 배치 처리
+
+    - 여러 워커가 동시에 돌아도 같은 이벤트를 두 번 처리하지 않음 (SKIP LOCKED)
+    - 배치 전체가 실패하면 이벤트별로 다시 시도해 문제 이벤트만 재시도 대기로 돌림
+
+    Returns:
+        (처리한 이벤트 수, 생성한 알림 수, 실패한 이벤트 수)
+    """
+    with transaction.atomic():
+        records = list(
+            NotificationOutbox.objects.select_for_update(skip_locked=True).filter(
+                status='pending',
+                available_at__lte=timezone.now(),
+            ).order_by('id')[:batch_size]
+        )
+        if not records:
+            return 0, 0, 0
+
+        try:
+            with transaction.atomic():
+                created = _deliver(records)
+            done = records
+            failed = 0
+        except Exception:
+            created = 0
+            done = []
+            failed = 0
+            for record in records:
+                try:
+                    with transaction.atomic():
+                        created += _deliver([record])
+                    done.append(record)
+                except Exception as error:
+                    _retry_later(record, error, max_attempts)
+                    failed += 1
+
+        NotificationOutbox.objects.filter(id__in=[record.id for record in done]).delete()
+    return len(records), created, failed
@@ -1,5 +1,8 @@
 """
 PDF 리포트 생성 유틸리티
+- 한글 폰트는 프로세스당 한 번만 찾아 등록 (settings.PDF_FONT_PATHS -> 기본 경로 -> ReportLab 내장 CID 폰트)
+- TTF 폰트는 리포트에 쓰인 글자만 subset으로 포함 (폰트 전체를 넣지 않아 파일 크기 유지)
+- 문단/표 스타일도 처음 한 번만 만들고 재사용
 """
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
@@ -7,33 +10,120 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFError, TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from django.conf import settings
+from functools import lru_cache
 from io import BytesIO
 from datetime import datetime
+import logging
 import os
 
+from .timeseries import active_hours, decode_hourly
 
+
+logger = logging.getLogger(__name__)
+
+# 리포트 레이아웃/내용이 바뀌면 올림 (저장된 PDF 파일 캐시 키, partners.reports)
+TEMPLATE_VERSION = 2
+
+# settings.PDF_FONT_PATHS가 비어 있을 때 찾는 한글 TTF 경로 (Linux 패키지 / macOS / Windows)
+DEFAULT_FONT_PATHS = [
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSansKR-Regular.ttf',
+    '/Library/Fonts/AppleGothic.ttf',
+    'C:/Windows/Fonts/malgun.ttf',
+]
+DEFAULT_BOLD_FONT_PATHS = [
+    '/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf',
+    '/usr/share/fonts/nanum/NanumGothicBold.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSansKR-Bold.ttf',
+    'C:/Windows/Fonts/malgunbd.ttf',
+]
+# 한글 TTF가 없을 때 사용 (ReportLab 내장, 파일 포함 없이 뷰어의 한글 폰트로 표시)
+FALLBACK_CID_FONT = 'HYGothic-Medium'
+HANGUL_SAMPLE = '가'
+
+HEADER_TEXT_COLOR = colors.whitesmoke
+ROW_BACKGROUNDS = [colors.white, colors.HexColor('#f5f5f5')]
+
+
+def _register_ttf(name, paths):
+    """
+    경로 목록에서 처음으로 등록되는 TTF를 name으로 등록
+
+    subset 포함이 금지된 폰트(fsType 제한), 읽을 수 없는 파일, 한글 글리프가 없는 폰트는 건너뜀
+
+    Returns:
+        str: 등록한 파일 경로 (없으면 None)
+    """
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        try:
+            font = TTFont(name, path)
+        except TTFError as e:
+            logger.warning('PDF 폰트 등록 실패 (%s): %s', path, e)
+            continue
+        if ord(HANGUL_SAMPLE) not in font.face.charToGlyph:
+            logger.warning('PDF 폰트에 한글 글리프가 없습니다 (%s)', path)
+            continue
+        pdfmetrics.registerFont(font)
+        return path
+    return None
+
+
+@lru_cache(maxsize=1)
+def get_fonts():
+    """
+    리포트 폰트 (프로세스당 한 번 등록)
+
+    Returns:
+        dict: regular, bold (폰트 이름), embedded (TTF subset 포함 여부), path
+    """
+    path = _register_ttf('ReportKorean', settings.PDF_FONT_PATHS or DEFAULT_FONT_PATHS)
+    if path is None:
+        logger.warning('한글 TTF 폰트를 찾지 못해 내장 CID 폰트(%s)를 사용합니다.', FALLBACK_CID_FONT)
+        pdfmetrics.registerFont(UnicodeCIDFont(FALLBACK_CID_FONT))
+        return {'regular': FALLBACK_CID_FONT, 'bold': FALLBACK_CID_FONT, 'embedded': False, 'path': None}
+
+    bold = 'ReportKorean'
+    if _register_ttf('ReportKoreanBold', settings.PDF_BOLD_FONT_PATHS or DEFAULT_BOLD_FONT_PATHS):
+        bold = 'ReportKoreanBold'
+    pdfmetrics.registerFontFamily('ReportKorean', normal='ReportKorean', bold=bold)
+    return {'regular': 'ReportKorean', 'bold': bold, 'embedded': True, 'path': path}
+
+
+def _header_table_style(fonts, header_color, font_size, padding):
+    """첫 행이 머리글인 표 스타일"""
+    return TableStyle([
+        ('FONTNAME', (0, 0), (-1, 0), fonts['bold']),
+        ('FONTNAME', (0, 1), (-1, -1), fonts['regular']),
+        ('FONTSIZE', (0, 0), (-1, -1), font_size),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), HEADER_TEXT_COLOR),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), ROW_BACKGROUNDS),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+        ('TOPPADDING', (0, 0), (-1, -1), padding),
+    ])
+
+
+@lru_cache(maxsize=1)
 def get_korean_style():
-    """한글 지원 스타일 반환"""
+    """한글 지원 문단/표 스타일 반환 (처음 호출 시 한 번 생성)"""
+    fonts = get_fonts()
     styles = getSampleStyleSheet()
 
-    # 한글 폰트 등록 시도 (시스템에 있는 경우)
-    try:
-        # Windows
-        if os.path.exists('C:/Windows/Fonts/malgun.ttf'):
-            pdfmetrics.registerFont(TTFont('Korean', 'C:/Windows/Fonts/malgun.ttf'))
-            font_name = 'Korean'
-        else:
-            font_name = 'Helvetica'
-    except:
-        font_name = 'Helvetica'
-
     # 커스텀 스타일 생성
     title_style = ParagraphStyle(
         'CustomTitle',
         parent=styles['Heading1'],
-        fontName=font_name,
+        fontName=fonts['bold'],
         fontSize=24,
         textColor=colors.HexColor('#1a1a1a'),
         spaceAfter=30,
@@ -43,7 +133,7 @@ def get_korean_style():
     heading_style = ParagraphStyle(
         'CustomHeading',
         parent=styles['Heading2'],
-        fontName=font_name,
+        fontName=fonts['bold'],
         fontSize=16,
         textColor=colors.HexColor('#333333'),
         spaceAfter=12,
@@ -53,16 +143,29 @@ def get_korean_style():
     body_style = ParagraphStyle(
         'CustomBody',
         parent=styles['BodyText'],
-        fontName=font_name,
+        fontName=fonts['regular'],
         fontSize=10,
         textColor=colors.HexColor('#666666'),
         spaceAfter=6,
     )
 
+    info_table_style = TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), fonts['regular']),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#666666')),
+        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a1a1a')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ])
+
     return {
         'title': title_style,
         'heading': heading_style,
         'body': body_style,
+        'info_table': info_table_style,
+        'kpi_table': _header_table_style(fonts, '#4CAF50', 10, 10),
+        'product_table': _header_table_style(fonts, '#2196F3', 9, 8),
+        'hourly_table': _header_table_style(fonts, '#FF9800', 9, 6),
     }
 
 
@@ -106,14 +209,7 @@ def generate_analytics_pdf(analytics_data, partner_name, event_name):
         ['Date:', analytics_data.generated_at.strftime('%Y-%m-%d')],
     ]
     info_table = Table(info_data, colWidths=[2*inch, 4*inch])
-    info_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#666666')),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1a1a1a')),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    info_table.setStyle(styles['info_table'])
     story.append(info_table)
     story.append(Spacer(1, 20))
 
@@ -130,19 +226,7 @@ def generate_analytics_pdf(analytics_data, partner_name, event_name):
     ]
 
     kpi_table = Table(kpi_data, colWidths=[3*inch, 3*inch])
-    kpi_table.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-    ]))
+    kpi_table.setStyle(styles['kpi_table'])
     story.append(kpi_table)
     story.append(Spacer(1, 20))
 
@@ -160,44 +244,21 @@ def generate_analytics_pdf(analytics_data, partner_name, event_name):
             ])
 
         product_table = Table(product_data, colWidths=[0.8*inch, 2.5*inch, 1.2*inch, 1.5*inch])
-        product_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2196F3')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ]))
+        product_table.setStyle(styles['product_table'])
         story.append(product_table)
         story.append(Spacer(1, 20))
 
     # === 시간대별 방문객 ===
-    if analytics_data.hourly_visitors:
+    hourly_rows = active_hours(decode_hourly(analytics_data.hourly_series))
+    if hourly_rows:
         story.append(Paragraph("Hourly Visitor Distribution", styles['heading']))
 
         hourly_data = [['Hour', 'Visitors']]
-        for hour, count in sorted(analytics_data.hourly_visitors.items()):
+        for hour, count in hourly_rows:
             hourly_data.append([f"{hour}:00", str(count)])
 
         hourly_table = Table(hourly_data, colWidths=[1.5*inch, 1.5*inch])
-        hourly_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#FF9800')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        hourly_table.setStyle(styles['hourly_table'])
         story.append(hourly_table)
         story.append(Spacer(1, 20))
 
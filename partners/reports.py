@@ -0,0 +1,310 @@
+"""
+성과 데이터 PDF 리포트 (AnalyticsReport)
+- 리포트 키: (성과 데이터 id, 성과 데이터 updated_at, pdf_generator.TEMPLATE_VERSION)
+- 다운로드 요청: 키에 맞는 완료된 파일이 있으면 그대로 전달, 없으면 대기열에 넣기만 함
+- 워커(process_report_queue): 대기 중인 리포트를 하나씩 가져가 PDF 생성 후 파일로 저장
+  (SKIP LOCKED로 가져가므로 워커 여러 개를 돌려도 같은 리포트를 두 번 만들지 않음)
+  실패한 리포트는 backoff 후 재시도 (저장소/폰트 오류 같은 일시적인 실패가 지나갈 시간을 둠)
+- 새 파일이 완료되면 같은 성과 데이터의 이전 키 리포트는 삭제 (파일은 signals에서 삭제)
+- 전체 다운로드(export-all): 여러 리포트를 스레드 풀에서 만들어 끝나는 순서대로 ZIP 응답에 바로 씀
+  (저장된 파일이 있으면 다시 만들지 않음, 메모리에는 동시에 만드는 리포트 수만큼만 보관)
+  ASGI는 stream_reports_zip(async), WSGI는 iter_reports_zip(sync)
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import AnalyticsReport
+from .pdf_generator import TEMPLATE_VERSION, generate_analytics_pdf
+
+
+logger = logging.getLogger(__name__)
+
+# 워커가 중간에 죽어 processing으로 남은 리포트를 다시 가져가기까지 대기 시간
+STALE_PROCESSING_SECONDS = 10 * 60
+
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 30 * 60
+
+
+def report_filename(analytics):
+    return f"analytics_{analytics.partner_id}_{analytics.event_id}_{analytics.generated_at.strftime('%Y%m%d')}.pdf"
+
+
+def current_report(analytics):
+    """현재 키의 리포트 (없으면 None)"""
+    return AnalyticsReport.objects.filter(
+        analytics=analytics,
+        source_updated_at=analytics.updated_at,
+        template_version=TEMPLATE_VERSION,
+    ).first()
+
+
+def request_report(analytics):
+    """
+    현재 키의 리포트 조회, 없으면 생성 대기열에 추가 (실패한 리포트는 다시 대기열로)
+
+    Returns:
+        AnalyticsReport
+    """
+    report, _ = AnalyticsReport.objects.get_or_create(
+        analytics=analytics,
+        source_updated_at=analytics.updated_at,
+        template_version=TEMPLATE_VERSION,
+    )
+    # 재배포 등으로 저장소에서 파일이 사라진 경우도 다시 생성
+    missing = report.status == 'ready' and not report.file.storage.exists(report.file.name)
+    if report.status == 'failed' or missing:
+        AnalyticsReport.objects.filter(pk=report.pk, status=report.status).update(
+            status='pending', attempts=0, available_at=timezone.now()
+        )
+        report.status = 'pending'
+        report.attempts = 0
+    return report
+
+
+def _claim_report():
+    """대기 중인 (또는 멈춘) 리포트 하나를 processing으로 표시하고 가져감"""
+    now = timezone.now()
+    with transaction.atomic():
+        report = AnalyticsReport.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+            Q(status='pending', available_at__lte=now)
+            | Q(status='processing', claimed_at__lt=now - timedelta(seconds=STALE_PROCESSING_SECONDS))
+        ).select_related('analytics', 'analytics__partner', 'analytics__event').order_by(
+            'requested_at', 'id'
+        ).first()
+        if report is None:
+            return None
+        report.status = 'processing'
+        report.claimed_at = now
+        report.attempts += 1
+        report.save(update_fields=['status', 'claimed_at', 'attempts'])
+    return report
+
+
+def build_report(report):
+    """PDF 생성 후 파일 저장, 같은 성과 데이터의 이전 리포트 정리"""
+    analytics = report.analytics
+    content = generate_analytics_pdf(analytics, analytics.partner.brand_name, analytics.event.name).getvalue()
+
+    report.file.save(report_filename(analytics), ContentFile(content), save=False)
+    updated = AnalyticsReport.objects.filter(pk=report.pk).update(
+        file=report.file.name,
+        etag=hashlib.sha256(content).hexdigest(),
+        file_size=len(content),
+        status='ready',
+        last_error='',
+        generated_at=timezone.now(),
+    )
+    if not updated:
+        # 생성하는 동안 성과 데이터(리포트 행)가 삭제됨
+        report.file.delete(save=False)
+        return
+
+    # 이전 키 리포트 정리 (파일은 post_delete signal에서 삭제)
+    AnalyticsReport.objects.filter(analytics_id=analytics.id).exclude(pk=report.pk).delete()
+
+
+def process_next_report(max_attempts=3):
+    """
+    리포트 하나 생성 (실패하면 max_attempts까지 backoff 후 다시 대기열로)
+
+    Returns:
+        AnalyticsReport: 처리한 리포트 (대기열이 비었으면 None)
+    """
+    report = _claim_report()
+    if report is None:
+        return None
+
+    try:
+        build_report(report)
+    except Exception as error:
+        delay = min(RETRY_BASE_SECONDS * 2 ** (report.attempts - 1), RETRY_MAX_SECONDS)
+        AnalyticsReport.objects.filter(pk=report.pk).update(
+            status='failed' if report.attempts >= max_attempts else 'pending',
+            last_error=f'{type(error).__name__}: {error}'[:2000],
+            available_at=timezone.now() + timedelta(seconds=delay),
+        )
+    return report
+
+
+def ready_report_files(analytics_list):
+    """
+    현재 키로 생성이 끝난 리포트 파일 (전체 다운로드에서 다시 만들지 않고 그대로 사용)
+
+    Returns:
+        dict: {성과 데이터 id: 파일 이름}
+    """
+    updated_at = {analytics.id: analytics.updated_at for analytics in analytics_list}
+    reports = AnalyticsReport.objects.filter(
+        analytics_id__in=updated_at,
+        template_version=TEMPLATE_VERSION,
+        status='ready',
+    ).values_list('analytics_id', 'source_updated_at', 'file')
+    return {
+        analytics_id: name
+        for analytics_id, source_updated_at, name in reports
+        if name and updated_at[analytics_id] == source_updated_at
+    }
+
+
+def _report_content(analytics, file_name=None):
+    """리포트 PDF 바이트 (저장된 파일이 있으면 읽고, 없거나 읽을 수 없으면 새로 생성)"""
+    if file_name:
+        try:
+            with default_storage.open(file_name, 'rb') as report_file:
+                return report_file.read()
+        except OSError:
+            pass
+    return generate_analytics_pdf(analytics, analytics.partner.brand_name, analytics.event.name).getvalue()
+
+
+def _export_report(analytics, file_name=None):
+    """
+    스레드 풀 작업 단위: 리포트 PDF 바이트
+    - 풀 스레드가 연 DB 연결은 작업이 끝날 때 닫음 (스레드별 연결이 남지 않도록)
+    """
+    try:
+        return _report_content(analytics, file_name)
+    finally:
+        connections.close_all()
+
+
+class _ZipChunks(io.RawIOBase):
+    """
+    ZipFile 출력을 모아 두었다가 응답 청크로 넘기는 쓰기 전용 스트림
+    seek할 수 없으므로 ZipFile이 크기/CRC를 각 파일 뒤(data descriptor)에 기록
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class _ReportArchive:
+    """끝난 리포트 작업을 ZIP 항목으로 쓰고 응답 청크를 돌려줌 (sync/async 스트림 공용)"""
+
+    def __init__(self):
+        self._chunks = _ZipChunks()
+        self._archive = zipfile.ZipFile(self._chunks, 'w', compression=zipfile.ZIP_STORED)  # PDF는 이미 압축됨
+        self._failed = []
+
+    def add(self, analytics, future):
+        """완료된 작업 결과를 쓰고 청크 반환 (실패한 리포트는 건너뛰고 b'')"""
+        try:
+            content = future.result()
+        except Exception:
+            logger.exception('리포트 생성 실패 (성과 데이터 %s)', analytics.id)
+            self._failed.append(analytics)
+            return b''
+        entry = zipfile.ZipInfo(report_filename(analytics), date_time=analytics.generated_at.timetuple()[:6])
+        self._archive.writestr(entry, content)
+        return self._chunks.drain()
+
+    def close(self):
+        """실패 목록(errors.txt)과 ZIP 끝부분을 쓰고 마지막 청크 반환"""
+        if self._failed:
+            self._archive.writestr('errors.txt', '\n'.join(
+                f'{report_filename(analytics)}: 리포트를 만들지 못했습니다.' for analytics in self._failed
+            ))
+        self._archive.close()
+        return self._chunks.drain()
+
+
+def iter_reports_zip(analytics_list, file_names=None, workers=2):
+    """
+    리포트 ZIP 스트림 (WSGI StreamingHttpResponse용 sync iterator)
+
+    - 리포트는 workers개 스레드에서 동시에 만들고, 끝나는 순서대로 ZIP 항목으로 씀
+    - 만들고 있는 리포트는 최대 workers개 (다 쓴 리포트는 바로 응답으로 내보내고 버림)
+    - 실패한 리포트는 건너뛰고 마지막에 errors.txt로 목록을 남김
+
+    Args:
+        analytics_list: partner/event를 함께 조회한 AnalyticsData 목록
+        file_names: ready_report_files() 결과
+    """
+    file_names = file_names or {}
+    archive = _ReportArchive()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report-export')
+    remaining = iter(analytics_list)
+    running = {}
+
+    def submit_next():
+        analytics = next(remaining, None)
+        if analytics is not None:
+            running[pool.submit(_export_report, analytics, file_names.get(analytics.id))] = analytics
+
+    try:
+        for _ in range(workers):
+            submit_next()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                analytics = running.pop(future)
+                submit_next()
+                chunk = archive.add(analytics, future)
+                if chunk:
+                    yield chunk
+        yield archive.close()
+    finally:
+        # 클라이언트가 중간에 끊으면 대기 중인 생성 작업은 취소
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def stream_reports_zip(analytics_list, file_names=None, workers=2):
+    """
+    리포트 ZIP 스트림 (ASGI StreamingHttpResponse용 async generator, 동작은 iter_reports_zip과 같음)
+
+    WSGI에서 Django는 async iterator를 전부 읽은 뒤 보내므로 iter_reports_zip을 사용
+    """
+    file_names = file_names or {}
+    loop = asyncio.get_running_loop()
+    archive = _ReportArchive()
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='report-export')
+    remaining = iter(analytics_list)
+    running = {}
+
+    def submit_next():
+        analytics = next(remaining, None)
+        if analytics is not None:
+            future = loop.run_in_executor(pool, _export_report, analytics, file_names.get(analytics.id))
+            running[future] = analytics
+
+    try:
+        for _ in range(workers):
+            submit_next()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                analytics = running.pop(future)
+                submit_next()
+                chunk = archive.add(analytics, future)
+                if chunk:
+                    yield chunk
+        yield archive.close()
+    finally:
+        # 클라이언트가 중간에 끊으면 대기 중인 생성 작업은 취소 (이벤트 루프를 막지 않음)
+        pool.shutdown(wait=False, cancel_futures=True)
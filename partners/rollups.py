@@ -0,0 +1,149 @@
+"""
+사업자별 성과 요약 (AnalyticsRollup)
+- summary 요청은 요약 행 하나 + 최고/최근 성과 데이터(id로 조회)만 읽음
+- 최고/최근 성과 데이터는 id만 저장하고 응답할 때 직렬화 (이벤트/브랜드 이름이 바뀌어도 최신 값)
+- 성과 데이터 생성: 요약 행을 잠그고 합계/최고 성과/최근 목록에 바로 반영
+- 성과 데이터 수정/삭제: 해당 사업자 요약만 다시 계산
+- 기존 데이터는 rebuild_analytics_rollups 명령어로 채움 (요약 행이 없으면 처음 조회할 때 계산)
+"""
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from .models import AnalyticsData, AnalyticsRollup
+from .serializers import AnalyticsDataSerializer
+
+
+RECENT_EVENTS_LIMIT = 3
+
+
+def _best_event(analytics):
+    return {
+        'id': analytics.event.id,
+        'name': analytics.event.name,
+        'visitor_count': analytics.visitor_count,
+        'sales': float(analytics.estimated_sales),
+    }
+
+
+def summarize(queryset):
+    """
+    성과 데이터 queryset 요약 (요약 행 계산 / 샘플 데이터 요약에 사용)
+
+    Returns:
+        dict: AnalyticsRollup 필드 값
+    """
+    totals = queryset.aggregate(
+        event_count=Count('id'),
+        total_visitors=Sum('visitor_count'),
+        total_sales=Sum('estimated_sales'),
+        total_reviews=Sum('review_count'),
+        rating_sum=Sum('average_rating'),
+        sentiment_sum=Sum('sentiment_score'),
+    )
+    summary = {key: value or 0 for key, value in totals.items()}
+
+    best = queryset.order_by('-visitor_count').values('id', 'visitor_count').first()
+    summary['best_visitor_count'] = best['visitor_count'] if best else None
+    summary['best_analytics_id'] = best['id'] if best else None
+    summary['recent_analytics_ids'] = list(
+        queryset.order_by('-generated_at').values_list('id', flat=True)[:RECENT_EVENTS_LIMIT]
+    )
+    return summary
+
+
+def summary_response(summary, is_sample_data=False):
+    """
+    요약 값 -> summary API 응답
+    최고/최근 성과 데이터는 id로 한 번에 조회해 직렬화 (현재 이벤트/브랜드 이름 사용)
+    """
+    ids = [*summary['recent_analytics_ids'], summary['best_analytics_id']]
+    analytics = AnalyticsData.objects.select_related('partner', 'event').in_bulk(
+        [analytics_id for analytics_id in ids if analytics_id is not None]
+    )
+
+    count = summary['event_count']
+    data = {
+        'total_visitors': summary['total_visitors'] if count else None,
+        'total_sales': summary['total_sales'] if count else None,
+        'avg_rating': summary['rating_sum'] / count if count else None,
+        'total_reviews': summary['total_reviews'] if count else None,
+        'avg_sentiment': summary['sentiment_sum'] / count if count else None,
+        'total_events': count,
+        'is_sample_data': is_sample_data,
+    }
+    best = analytics.get(summary['best_analytics_id'])
+    if best:
+        data['best_event'] = _best_event(best)
+    data['recent_events'] = AnalyticsDataSerializer(
+        [analytics[analytics_id] for analytics_id in summary['recent_analytics_ids'] if analytics_id in analytics],
+        many=True,
+    ).data
+    return data
+
+
+def rebuild_rollup(partner_id, create=True):
+    """
+    사업자 요약 다시 계산
+    - 요약 행을 먼저 잠그고 계산 (동시에 add_to_rollup으로 더해진 값을 덮어쓰지 않도록)
+
+    Args:
+        create: False면 요약 행이 있을 때만 갱신 (사업자 삭제 중 다시 생성하지 않도록)
+
+    Returns:
+        dict: 요약 값 (요약 행이 없어 갱신하지 않았으면 None)
+    """
+    with transaction.atomic():
+        if create:
+            # 처음 생성이 동시에 일어나면 한쪽은 상대가 커밋할 때까지 기다렸다가 기존 행을 가져옴
+            AnalyticsRollup.objects.get_or_create(partner_id=partner_id)
+        locked = AnalyticsRollup.objects.select_for_update().filter(partner_id=partner_id)
+        if not list(locked.values_list('partner_id', flat=True)):
+            return None
+
+        summary = summarize(AnalyticsData.objects.filter(partner_id=partner_id))
+        locked.update(**summary, updated_at=timezone.now())
+    return summary
+
+
+def add_to_rollup(analytics):
+    """새 성과 데이터를 요약에 반영 (요약 행이 없으면 행을 만들고 잠근 뒤 전체 계산)"""
+    with transaction.atomic():
+        rollup = AnalyticsRollup.objects.select_for_update().filter(partner_id=analytics.partner_id).first()
+        if rollup is None:
+            rebuild_rollup(analytics.partner_id)
+            return
+
+        rollup.event_count += 1
+        rollup.total_visitors += analytics.visitor_count
+        rollup.total_sales += analytics.estimated_sales
+        rollup.total_reviews += analytics.review_count
+        rollup.rating_sum += analytics.average_rating
+        rollup.sentiment_sum += analytics.sentiment_score
+        if rollup.best_visitor_count is None or analytics.visitor_count > rollup.best_visitor_count:
+            rollup.best_visitor_count = analytics.visitor_count
+            rollup.best_analytics_id = analytics.id
+        rollup.recent_analytics_ids = [
+            analytics.id,
+            *rollup.recent_analytics_ids[:RECENT_EVENTS_LIMIT - 1],
+        ]
+        rollup.save()
+
+
+def analytics_summary(partner_id):
+    """
+    사업자의 성과 요약 응답 (요약 행 한 건 + 최고/최근 성과 데이터 조회)
+
+    Returns:
+        dict 또는 자기 성과 데이터가 없으면 None
+    """
+    summary = AnalyticsRollup.objects.filter(partner_id=partner_id).values(
+        'event_count', 'total_visitors', 'total_sales', 'total_reviews',
+        'rating_sum', 'sentiment_sum', 'best_analytics_id', 'recent_analytics_ids',
+    ).first()
+    if summary is None:
+        summary = rebuild_rollup(partner_id)
+    if not summary['event_count']:
+        return None
+    return summary_response(summary)
@@ -0,0 +1,84 @@
+"""
+샘플 성과 데이터 (자기 데이터가 없는 사업자용 예시)
+- 전체 성과 데이터에서 무작위로 뽑은 풀을 AnalyticsSample에 미리 저장 (refresh_analytics_samples)
+- 사업자별 샘플은 사업자 id를 seed로 풀 위치를 고르므로 요청마다 같은 결과 -> 캐시 가능
+- 요청 경로에서는 풀 크기 + 위치(PK) 조회뿐, ORDER BY RANDOM() 없음
+- 샘플 요약(summary 응답)도 샘플 id와 같은 시간 동안 캐시 (요청마다 집계/직렬화하지 않음)
+"""
+
+import random
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import AnalyticsData, AnalyticsSample
+from .rollups import summarize, summary_response
+
+
+SAMPLE_POOL_SIZE = 200
+SAMPLES_PER_PARTNER = 5
+
+
+def _sample_key(partner_id):
+    return f'partners:{partner_id}:analytics_sample'
+
+
+def _sample_summary_key(partner_id):
+    return f'partners:{partner_id}:analytics_sample_summary'
+
+
+def refresh_sample_pool(size=SAMPLE_POOL_SIZE, seed=None):
+    """
+    샘플 풀 다시 추출 (id 목록에서 무작위 추출, 테이블 정렬 없음)
+
+    Returns:
+        int: 풀 크기
+    """
+    analytics_ids = list(AnalyticsData.objects.values_list('id', flat=True))
+    chosen = random.Random(seed).sample(analytics_ids, min(size, len(analytics_ids)))
+    with transaction.atomic():
+        AnalyticsSample.objects.all().delete()
+        AnalyticsSample.objects.bulk_create(
+            [AnalyticsSample(position=position, analytics_id=analytics_id)
+             for position, analytics_id in enumerate(chosen)],
+            ignore_conflicts=True,
+        )
+    return len(chosen)
+
+
+def sample_analytics_ids(partner_id, count=SAMPLES_PER_PARTNER):
+    """
+    사업자별 고정 샘플 성과 데이터 id (풀이 비어 있으면 처음 한 번 채움)
+
+    Returns:
+        list: AnalyticsData id (풀 위치 순)
+    """
+    key = _sample_key(partner_id)
+    sample_ids = cache.get(key)
+    if sample_ids is not None:
+        return sample_ids
+
+    pool_size = AnalyticsSample.objects.count() or refresh_sample_pool()
+    positions = random.Random(partner_id).sample(range(pool_size), min(count, pool_size))
+    sample_ids = list(
+        AnalyticsSample.objects.filter(position__in=positions).values_list('analytics_id', flat=True)
+    )
+    cache.set(key, sample_ids, settings.PARTNER_STATS_CACHE_TIMEOUT)
+    return sample_ids
+
+
+def sample_summary(partner_id):
+    """
+    사업자별 샘플 성과 데이터 요약 (summary API 응답, is_sample_data=True)
+
+    Returns:
+        dict: summary_response() 결과
+    """
+    key = _sample_summary_key(partner_id)
+    summary = cache.get(key)
+    if summary is None:
+        sample = AnalyticsData.objects.filter(id__in=sample_analytics_ids(partner_id))
+        summary = summary_response(summarize(sample), is_sample_data=True)
+        cache.set(key, summary, settings.PARTNER_STATS_CACHE_TIMEOUT)
+    return summary
@@ -1,5 +1,6 @@
 from rest_framework import serializers
-from .models import Partner, Application, Message, AnalyticsData, ImageUpload, Notification, ApplicationDraft, FestivalBookmark
+from rest_framework.reverse import reverse
+from .models import Partner, Application, Conversation, Message, Announcement, AnalyticsData, AnalyticsReport, ImageUpload, Notification, ApplicationDraft, FestivalBookmark
 from events.serializers import EventSerializer
 from django.contrib.auth import get_user_model
 from django.db import transaction
@@ -211,9 +212,10 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         partner = self.context["request"].user.partner_profile
         validated_data["partner"] = partner
-        partner.total_applications += 1
-        partner.save()
-        return super().create(validated_data)
+        with transaction.atomic():
+            application = super().create(validated_data)
+            partner.adjust_counters(applications=1)
+        return application
 
 
 class MessageSerializer(serializers.ModelSerializer):
@@ -258,6 +260,109 @@ class MessageSerializer(serializers.ModelSerializer):
         return None
 
 
+class ConversationSerializer(serializers.ModelSerializer):
+    """
+    대화 스레드 Serializer (요청한 사용자 기준)
+    participant_low/high, application__event/partner, last_message를 select_related 해서 사용
+    """
+    other_user = serializers.SerializerMethodField()
+    application_info = serializers.SerializerMethodField()
+    last_message = serializers.SerializerMethodField()
+    unread_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Conversation
+        fields = [
+            "id", "other_user",
+            "application", "application_info",
+            "last_message", "last_message_at",
+            "unread_count",
+            "created_at"
+        ]
+
+    def _user_id(self):
+        return self.context['request'].user.id
+
+    def get_other_user(self, obj):
+        other = obj.participant_high if obj.participant_low_id == self._user_id() else obj.participant_low
+        return {
+            "id": other.id,
+            "username": other.username,
+        }
+
+    def get_application_info(self, obj):
+        if obj.application:
+            return {
+                "id": obj.application.id,
+                "event_name": obj.application.event.name,
+                "partner_name": obj.application.partner.brand_name,
+            }
+        return None
+
+    def get_last_message(self, obj):
+        message = obj.last_message
+        if message is None:
+            return None
+        return {
+            "id": message.id,
+            "sender": message.sender_id,
+            "subject": message.subject,
+            "content": message.content[:100],
+            "created_at": serializers.DateTimeField().to_representation(message.created_at),
+        }
+
+    def get_unread_count(self, obj):
+        return obj.unread_for(self._user_id())
+
+
+class AnnouncementSerializer(serializers.ModelSerializer):
+    """
+    축제 공지 Serializer
+    받은편지함에서 메시지와 같이 보여줄 수 있도록 message_type/read 필드 포함
+    """
+    message_type = serializers.SerializerMethodField()
+    sender_info = serializers.SerializerMethodField()
+    event_info = serializers.SerializerMethodField()
+    audience_display = serializers.CharField(source='get_audience_display', read_only=True)
+    read = serializers.SerializerMethodField()
+    read_at = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Announcement
+        fields = [
+            "id", "message_type",
+            "event", "event_info", "audience", "audience_display",
+            "sender", "sender_info",
+            "subject", "content", "attachments",
+            "read", "read_at",
+            "created_at"
+        ]
+        read_only_fields = ["sender", "created_at"]
+
+    def get_message_type(self, obj):
+        return 'announcement'
+
+    def get_sender_info(self, obj):
+        return {
+            "id": obj.sender.id,
+            "username": obj.sender.username,
+        }
+
+    def get_event_info(self, obj):
+        return {
+            "id": obj.event.id,
+            "name": obj.event.name,
+        }
+
+    def get_read_at(self, obj):
+        # AnnouncementQuerySet.with_read_at()으로 annotate된 값
+        read_at = getattr(obj, 'read_at', None)
+        return serializers.DateTimeField().to_representation(read_at) if read_at else None
+
+    def get_read(self, obj):
+        return getattr(obj, 'read_at', None) is not None
+
+
 class AnalyticsDataSerializer(serializers.ModelSerializer):
     partner_info = serializers.SerializerMethodField()
     event_info = serializers.SerializerMethodField()
@@ -290,6 +395,27 @@ class AnalyticsDataSerializer(serializers.ModelSerializer):
         }
 
 
+class AnalyticsReportSerializer(serializers.ModelSerializer):
+    """PDF 리포트 생성 상태"""
+    download_url = serializers.SerializerMethodField()
+    status_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AnalyticsReport
+        fields = [
+            "analytics", "status", "template_version", "file_size",
+            "requested_at", "generated_at", "last_error",
+            "download_url", "status_url",
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        return reverse('analytics-export-pdf', args=[obj.analytics_id], request=self.context.get('request'))
+
+    def get_status_url(self, obj):
+        return reverse('analytics-export-pdf-status', args=[obj.analytics_id], request=self.context.get('request'))
+
+
 class ImageUploadSerializer(serializers.ModelSerializer):
     """이미지 업로드 Serializer (검증 포함)"""
 
@@ -389,6 +515,22 @@ class NotificationSerializer(serializers.ModelSerializer):
         return None
 
 
+class NotificationIdsSerializer(serializers.Serializer):
+    """알림 일괄 읽음 처리 요청 (id 목록)"""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+
+
+class NotificationPurgeSerializer(serializers.Serializer):
+    """읽은 알림 정리 요청"""
+
+    days = serializers.IntegerField(min_value=0, default=30)
+
+
 class ApplicationDraftSerializer(serializers.ModelSerializer):
     """지원서 임시저장 Serializer"""
 
@@ -1,168 +1,248 @@
 """
 Django Signals for Partners App
-지원서 상태 변경 시 자동 알림 생성
+지원서 상태 변경/메시지/성과 데이터 생성 시 알림 이벤트 기록 (outbox, 워커가 알림 생성)
+지원서 변경 시 사업자 통계 캐시 무효화
+지원서/메시지 변경 시 대시보드 스냅샷 갱신
+메시지 생성/읽음/삭제 시 읽지 않은 메시지 카운터/대화 스레드 갱신
+공지 생성/삭제, 지원서 상태 변경(공지 대상 변경) 시 읽지 않은 공지 카운터 갱신
+성과 데이터 변경 시 사업자 성과 요약 갱신
+성과 리포트 삭제 시 PDF 파일 삭제
 """
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from .models import Application, Message, Notification, AnalyticsData
+from .models import Partner, Application, Announcement, Message, AnalyticsData, AnalyticsReport, UnreadCounter
+from .dashboard import mark_dashboard_stale
+from . import badges, conversations, rollups
+from .notifications import enqueue
+from .streaming import publish
+from .stats import invalidate_partner_stats
 
 
 @receiver(pre_save, sender=Application)
 def track_application_status_change(sender, instance, **kwargs):
-    """지원서 상태 변경 추적"""
-    if instance.pk:
-        try:
-            old_instance = Application.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except Application.DoesNotExist:
-            instance._old_status = None
-    else:
+    """
+    지원서 상태 변경 추적
+    - DB에서 읽은 인스턴스는 from_db 스냅샷의 상태 사용 (추가 쿼리 없음)
+    - 스냅샷이 없는 경우(pk를 지정해 직접 만든 인스턴스 등)에만 DB 조회
+    """
+    if not instance.pk:
         instance._old_status = None
+    elif instance.has_loaded_value('status'):
+        instance._old_status = instance.get_loaded_value('status')
+    else:
+        instance._old_status = Application.objects.filter(
+            pk=instance.pk
+        ).values_list('status', flat=True).first()
+
+
+def _notifies_status(old_status, new_status, created):
+    """지원서 저장이 알림 이벤트(제출/승인/거절/완료)를 남기는지"""
+    if created:
+        return True
+    return old_status != new_status and new_status in ('approved', 'rejected', 'completed')
 
 
 @receiver(post_save, sender=Application)
 def application_status_changed(sender, instance, created, **kwargs):
     """
-    지원서 상태 변경 시 알림 생성
+    지원서 상태 변경 시 알림 이벤트 기록
     - 지원서 제출 (created=True)
     - 승인 (status changed to 'approved')
     - 거절 (status changed to 'rejected')
     - 완료 (status changed to 'completed')
-    """
-    user = instance.partner.user
-    event_name = instance.event.name
 
-    # 새로 생성된 지원서 (제출)
-    if created:
-        Notification.objects.create(
-            user=user,
-            notification_type='application_submitted',
-            title='지원서 제출 완료',
-            message=f'{event_name}에 지원서를 제출했습니다. 검토 결과를 기다려 주세요.',
-            link=f'/partner/applications',
-            application=instance,
-            extra_data={
-                'event_id': instance.event.id,
-                'event_name': event_name,
-            }
-        )
-        return
-
-    # 상태 변경 확인
+    Notification 생성은 process_notification_outbox 워커가 처리 (partners.notifications)
+    """
     old_status = getattr(instance, '_old_status', None)
     new_status = instance.status
 
-    if old_status == new_status:
+    if not _notifies_status(old_status, new_status, created):
         return  # 상태 변경 없음
 
-    # 승인됨
-    if new_status == 'approved':
-        Notification.objects.create(
-            user=user,
-            notification_type='application_approved',
-            title=f'{event_name} 지원 승인!',
-            message=f'축하합니다! {event_name} 지원이 승인되었습니다.\n부스 위치: {instance.booth_location or "추후 안내"}',
-            link=f'/partner/applications',
-            application=instance,
-            extra_data={
-                'event_id': instance.event.id,
-                'event_name': event_name,
-                'booth_location': instance.booth_location,
-                'organizer_message': instance.organizer_message,
-            }
-        )
+    # 알림 문구는 변경 시점의 값 기준 (워커가 처리하기 전에 다시 바뀌어도 유지)
+    enqueue(
+        'application_status',
+        application_id=instance.id,
+        partner_id=instance.partner_id,
+        event_id=instance.event_id,
+        created=created,
+        status=new_status,
+        booth_location=instance.booth_location,
+        organizer_message=instance.organizer_message,
+        rejection_reason=instance.rejection_reason,
+        payment_status=instance.payment_status,
+        participation_fee=str(instance.participation_fee),
+    )
 
-        # 결제 필요 알림 (미결제 상태인 경우)
-        if instance.payment_status == 'unpaid' and instance.participation_fee > 0:
-            Notification.objects.create(
-                user=user,
-                notification_type='payment_required',
-                title='참가비 결제 필요',
-                message=f'{event_name} 참가비({instance.participation_fee}원)를 결제해 주세요.',
-                link=f'/partner/applications',
-                application=instance,
-                extra_data={
-                    'event_id': instance.event.id,
-                    'event_name': event_name,
-                    'amount': str(instance.participation_fee),
-                }
-            )
-
-    # 거절됨
-    elif new_status == 'rejected':
-        Notification.objects.create(
-            user=user,
-            notification_type='application_rejected',
-            title=f'{event_name} 지원 결과 안내',
-            message=f'아쉽게도 {event_name} 지원이 선정되지 못했습니다.\n사유: {instance.rejection_reason or "자세한 내용은 주최측 메시지를 확인해 주세요."}',
-            link=f'/partner/applications',
-            application=instance,
-            extra_data={
-                'event_id': instance.event.id,
-                'event_name': event_name,
-                'rejection_reason': instance.rejection_reason,
-            }
-        )
 
-    # 완료됨
-    elif new_status == 'completed':
-        Notification.objects.create(
-            user=user,
-            notification_type='analytics_ready',
-            title=f'{event_name} 참여 완료',
-            message=f'{event_name} 축제가 성공적으로 마무리되었습니다. 성과 데이터를 확인해 보세요!',
-            link=f'/partner/analytics',
-            application=instance,
-            extra_data={
-                'event_id': instance.event.id,
-                'event_name': event_name,
-            }
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_application_stats(sender, instance, **kwargs):
+    """
+    지원서 생성/변경/삭제 시 해당 사업자 통계 캐시 무효화 (커밋 후)
+    - 대시보드 스냅샷은 무효화된 통계로 다시 계산되도록 그 다음에 예약
+    """
+    partner_id = instance.partner_id
+    transaction.on_commit(lambda: invalidate_partner_stats(partner_id))
+    mark_dashboard_stale(partner_id=partner_id)
+
+
+@receiver(post_delete, sender=Application)
+def release_partner_counters(sender, instance, **kwargs):
+    """지원서 삭제 시 사업자 통계 카운터 차감 (원자적 UPDATE)"""
+    Partner.bump_counters(
+        instance.partner_id,
+        applications=-1,
+        approvals=-1 if instance.status in Application.APPROVED_STATUSES else 0,
+    )
+
+
+def _partner_user_id(application):
+    if Application._meta.get_field('partner').is_cached(application):
+        return application.partner.user_id
+    return Partner.objects.filter(pk=application.partner_id).values_list('user_id', flat=True).first()
+
+
+@receiver(post_save, sender=Application)
+def update_announcement_audience(sender, instance, created, **kwargs):
+    """지원서 생성/상태 변경으로 받는 공지가 바뀌면 읽지 않은 공지 카운터 증감"""
+    old_status = None if created else getattr(instance, '_old_status', None)
+    if Announcement.audiences_for(old_status) != Announcement.audiences_for(instance.status):
+        badges.audience_changed(_partner_user_id(instance), instance.event_id, old_status, instance.status)
+
+
+@receiver(post_delete, sender=Application)
+def release_announcement_audience(sender, instance, **kwargs):
+    """지원서 삭제 시 더 이상 받지 않는 공지를 읽지 않은 공지 카운터에서 차감"""
+    if Announcement.audiences_for(instance.status):
+        badges.audience_changed(_partner_user_id(instance), instance.event_id, instance.status, None)
+
+
+@receiver(post_save, sender=Announcement)
+def fan_out_announcement(sender, instance, created, **kwargs):
+    """새 공지: 대상 사업자의 읽지 않은 공지 카운터 증가 (UPDATE 한 번, 행이 없으면 생성)"""
+    if created:
+        UnreadCounter.bump_many(instance.recipient_ids(), announcements=1)
+
+
+@receiver(pre_delete, sender=Announcement)
+def release_announcement(sender, instance, **kwargs):
+    """공지 삭제: 아직 읽지 않은 대상의 카운터 차감 (읽음 기록이 함께 지워지기 전에 계산)"""
+    read_user_ids = set(instance.receipts.values_list('user_id', flat=True))
+    UnreadCounter.bump_many(set(instance.recipient_ids()) - read_user_ids, announcements=-1)
+
+
+@receiver(post_save, sender=Message)
+@receiver(post_delete, sender=Message)
+def refresh_receiver_dashboard(sender, instance, **kwargs):
+    """받은 메시지 생성/읽음/삭제 시 받는 사람의 대시보드 갱신"""
+    if instance.receiver_id:
+        mark_dashboard_stale(partner__user_id=instance.receiver_id)
+
+
+@receiver(pre_save, sender=Message)
+def assign_conversation(sender, instance, **kwargs):
+    """새 1:1 메시지를 대화 스레드에 배정 (같은 INSERT에 conversation_id 포함)"""
+    if instance._state.adding and instance.conversation_id is None and instance.receiver_id:
+        instance.conversation = conversations.conversation_for(
+            instance.sender_id, instance.receiver_id, instance.application_id
         )
 
 
+@receiver(post_save, sender=Message)
+def count_unread_message(sender, instance, created, **kwargs):
+    """
+    읽지 않은 메시지 카운터/대화 스레드 갱신 (from_db 스냅샷과 비교)
+    - 스냅샷이 없는 인스턴스의 변경은 reconcile_unread_counters로 보정
+    """
+    if created:
+        if instance.conversation_id:
+            conversations.record_message(instance)
+        old_receiver_id, old_unread = None, False
+    elif instance.has_loaded_value('read') and instance.has_loaded_value('receiver_id'):
+        old_receiver_id = instance.get_loaded_value('receiver_id')
+        old_unread = not instance.get_loaded_value('read')
+    else:
+        return
+
+    new_unread = not instance.read
+    if (old_receiver_id, old_unread) == (instance.receiver_id, new_unread):
+        return
+    if old_unread:
+        UnreadCounter.bump(old_receiver_id, messages=-1)
+        conversations.adjust_unread(instance, old_receiver_id, -1)
+    if new_unread:
+        UnreadCounter.bump(instance.receiver_id, messages=1)
+        if not created:  # 새 메시지는 record_message에서 이미 반영
+            conversations.adjust_unread(instance, instance.receiver_id, 1)
+
+
+@receiver(post_delete, sender=Message)
+def release_unread_message(sender, instance, **kwargs):
+    """메시지 삭제 시 읽지 않은 수 감소, 마지막 메시지였으면 스레드의 마지막 메시지 다시 지정"""
+    if not instance.read:
+        UnreadCounter.bump(instance.receiver_id, messages=-1)
+        conversations.adjust_unread(instance, instance.receiver_id, -1)
+    if instance.conversation_id:
+        conversations.refresh_last_message(instance.conversation_id)
+
+
 @receiver(post_save, sender=Message)
 def message_received(sender, instance, created, **kwargs):
     """
-    새 메시지 수신 시 알림 생성
+    새 메시지 수신 시 알림 이벤트 기록
     """
-    if created and instance.receiver:
+    if created and instance.receiver_id:
         # 받는 사람에게만 알림 생성
-        Notification.objects.create(
-            user=instance.receiver,
-            notification_type='message_received',
-            title='새 메시지',
-            message=f'{instance.sender.username}님으로부터 새 메시지가 도착했습니다.\n제목: {instance.subject}',
-            link=f'/partner/messages',
-            application=instance.application,
-            extra_data={
-                'message_id': instance.id,
-                'sender': instance.sender.username,
-                'subject': instance.subject,
-            }
+        enqueue(
+            'message_received',
+            message_id=instance.id,
+            sender_id=instance.sender_id,
+            receiver_id=instance.receiver_id,
+            application_id=instance.application_id,
+            subject=instance.subject,
         )
+        # 커밋되면 받는 사람의 스트림에 새 메시지 신호 (브로커 오류는 요청에 영향 없음)
+        receiver_id = instance.receiver_id
+        transaction.on_commit(lambda: publish([receiver_id]), robust=True)
 
 
 @receiver(post_save, sender=AnalyticsData)
 def analytics_ready(sender, instance, created, **kwargs):
     """
-    성과 데이터 생성 시 알림
+    성과 데이터 생성 시 알림 이벤트 기록
     """
     if created:
-        user = instance.partner.user
-        event_name = instance.event.name
-
-        Notification.objects.create(
-            user=user,
-            notification_type='analytics_ready',
-            title='성과 데이터 준비 완료',
-            message=f'{event_name}의 성과 데이터가 생성되었습니다. 지금 확인해 보세요!',
-            link=f'/partner/analytics',
-            application=instance.application,
-            extra_data={
-                'event_id': instance.event.id,
-                'event_name': event_name,
-                'analytics_id': instance.id,
-                'visitor_count': instance.visitor_count,
-                'average_rating': float(instance.average_rating),
-            }
+        enqueue(
+            'analytics_ready',
+            analytics_id=instance.id,
+            partner_id=instance.partner_id,
+            event_id=instance.event_id,
+            application_id=instance.application_id,
+            visitor_count=instance.visitor_count,
+            average_rating=float(instance.average_rating),
         )
+
+
+@receiver(post_save, sender=AnalyticsData)
+def update_analytics_rollup(sender, instance, created, **kwargs):
+    """성과 데이터 생성 시 사업자 요약에 더하고, 수정 시 다시 계산"""
+    if created:
+        rollups.add_to_rollup(instance)
+    else:
+        rollups.rebuild_rollup(instance.partner_id)
+
+
+@receiver(post_delete, sender=AnalyticsData)
+def remove_from_analytics_rollup(sender, instance, **kwargs):
+    """성과 데이터 삭제 시 사업자 요약 다시 계산 (사업자 삭제 중이면 요약 행도 같이 삭제됨)"""
+    rollups.rebuild_rollup(instance.partner_id, create=False)
+
+
+@receiver(post_delete, sender=AnalyticsReport)
+def delete_report_file(sender, instance, **kwargs):
+    """리포트 행 삭제 (성과 데이터 삭제/새 리포트로 교체) 시 저장된 PDF 파일도 삭제 (커밋 후)"""
+    if instance.file:
+        storage, name = instance.file.storage, instance.file.name
+        transaction.on_commit(lambda: storage.delete(name), robust=True)
@@ -0,0 +1,103 @@
+"""
+사업자별 지원 통계 서비스
+- 패널마다 조건부 집계(aggregate + Count(filter=Q)) 한 번으로 계산
+- 결과는 캐시에 저장하고, 사업자의 지원서가 바뀌면 무효화 (signals 참고)
+- ApplicationViewSet.stats, DashboardView에서 공통으로 사용
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .models import Application
+
+
+APPLICATION_STATUSES = ['pending', 'approved', 'rejected', 'completed']
+RECENT_REVIEWED_LIMIT = 3
+UPCOMING_EVENTS_LIMIT = 5
+
+
+def _stats_key(partner_id):
+    return f'partners:{partner_id}:application_stats'
+
+
+def _timeline_key(partner_id, today):
+    # 다가오는 일정은 날짜가 바뀌면 대상이 달라지므로 날짜별로 캐시
+    return f'partners:{partner_id}:application_timeline:{today.isoformat()}'
+
+
+def application_stats(partner_id):
+    """
+    상태별 지원서 수
+
+    Returns:
+        dict: total, pending, approved, rejected, completed
+    """
+    key = _stats_key(partner_id)
+    stats = cache.get(key)
+    if stats is None:
+        stats = Application.objects.filter(partner_id=partner_id).aggregate(
+            total=Count('id'),
+            **{
+                status: Count('id', filter=Q(status=status))
+                for status in APPLICATION_STATUSES
+            }
+        )
+        cache.set(key, stats, settings.PARTNER_STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def application_timeline(partner_id, today=None):
+    """
+    최근 승인/거절된 지원서와 다가오는 (승인된) 일정
+
+    Returns:
+        dict: recent_reviewed [{id, status, event_name, reviewed_at}],
+              upcoming [{event_id, name, date, location, status}]
+    """
+    today = today or date.today()
+    key = _timeline_key(partner_id, today)
+    timeline = cache.get(key)
+    if timeline is not None:
+        return timeline
+
+    applications = Application.objects.filter(partner_id=partner_id)
+    recent_reviewed = [
+        {
+            'id': app_id,
+            'status': app_status,
+            'event_name': event_name,
+            'reviewed_at': reviewed_at,
+        }
+        for app_id, app_status, event_name, reviewed_at in applications.filter(
+            status__in=['approved', 'rejected']
+        ).order_by('-reviewed_at').values_list(
+            'id', 'status', 'event__name', 'reviewed_at'
+        )[:RECENT_REVIEWED_LIMIT]
+    ]
+    upcoming = [
+        {
+            'event_id': event_id,
+            'name': name,
+            'date': start_date,
+            'location': location,
+            'status': app_status,
+        }
+        for event_id, name, start_date, location, app_status in applications.filter(
+            status='approved',
+            event__start_date__gte=today
+        ).order_by('event__start_date').values_list(
+            'event_id', 'event__name', 'event__start_date', 'event__location', 'status'
+        )[:UPCOMING_EVENTS_LIMIT]
+    ]
+
+    timeline = {'recent_reviewed': recent_reviewed, 'upcoming': upcoming}
+    cache.set(key, timeline, settings.PARTNER_STATS_CACHE_TIMEOUT)
+    return timeline
+
+
+def invalidate_partner_stats(partner_id):
+    """사업자의 지원서가 생성/변경/삭제되면 호출"""
+    cache.delete_many([_stats_key(partner_id), _timeline_key(partner_id, date.today())])
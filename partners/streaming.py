@@ -0,0 +1,354 @@
+"""
+알림/메시지 실시간 스트림 (SSE / long-poll)
+- 브로커는 "이 사용자에게 새 데이터가 있다"는 신호만 전달하고,
+  실제 알림/메시지는 스트림이 DB에서 커서(마지막 id) 이후 행을 읽어 보냄
+  -> Last-Event-ID로 재연결하면 끊긴 동안의 데이터도 그대로 이어받음
+- id는 커밋 순서가 아님 (먼저 id를 받은 트랜잭션이 나중에 커밋될 수 있음)
+  -> 커서 아래 NOTIFICATION_STREAM_RESCAN_WINDOW개 id 범위는 매번 다시 조회하고,
+     그 범위에서 이미 보낸 id는 커서에 같이 담아 중복 전송하지 않음
+- 브로커는 settings.NOTIFICATION_STREAM_BACKEND로 교체 가능
+    InProcessBroker: 같은 프로세스 안에서만 전달 (개발용 단일 프로세스)
+    DatabasePollingBroker (기본값): 프로세스당 폴러 하나가 새 행을 조회해 연결된 사용자만 깨움
+                                   (알림 워커가 다른 프로세스여도 동작, 추가 의존성 없음)
+    RedisBroker: Redis pub/sub로 프로세스/인스턴스 간 전달 (REDIS_URL, redis 패키지 필요)
+- EventSource는 헤더를 보낼 수 없으므로 URL에는 JWT 대신 짧게 유효한 일회용 스트림 티켓을 사용
+  (서명된 값이라 어느 인스턴스에서도 검증, 사용 여부는 DB에 기록 - 모든 워커/인스턴스가 공유)
+"""
+
+import asyncio
+import json
+import secrets
+import threading
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+from .badges import unread_badges
+from .models import Message, Notification, UsedStreamTicket
+from .serializers import MessageSerializer, NotificationSerializer
+
+
+STREAM_BATCH_SIZE = 100
+REDIS_CHANNEL = 'partners:stream'
+TICKET_SALT = 'partners.streaming.ticket'
+
+
+class InProcessBroker:
+    """같은 프로세스 안의 대기 중인 스트림을 깨우는 브로커"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = defaultdict(set)  # user_id -> {(loop, asyncio.Event)}
+
+    def publish(self, user_ids):
+        """새 데이터가 생긴 사용자 알림 (커밋 후 동기 코드에서 호출)"""
+        with self._lock:
+            waiters = [waiter for user_id in user_ids for waiter in self._waiters.get(user_id, ())]
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # 요청이 끝나 닫힌 이벤트 루프 (async_to_sync는 요청마다 루프를 새로 만듦)
+
+    @staticmethod
+    def _running_task(current, coroutine_function):
+        """
+        현재 이벤트 루프에서 도는 백그라운드 태스크 (loop, task)
+        - 태스크가 끝났거나 다른 루프(닫힌 루프 포함)에서 만든 것이면 이 루프에서 새로 시작
+          (WSGI/runserver에서는 async_to_sync가 요청마다 새 루프를 만들고 끝나면 닫음)
+        """
+        loop = asyncio.get_running_loop()
+        if current is None or current[0] is not loop or current[1].done():
+            current = (loop, loop.create_task(coroutine_function()))
+        return current
+
+    def subscribed_user_ids(self):
+        with self._lock:
+            return [user_id for user_id, waiters in self._waiters.items() if waiters]
+
+    async def wait(self, user_id, timeout):
+        """
+        새 데이터 신호를 timeout초까지 대기
+
+        Returns:
+            bool: 신호를 받았으면 True, 시간 초과면 False
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters[user_id].add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters[user_id].discard(waiter)
+                if not self._waiters[user_id]:
+                    del self._waiters[user_id]
+
+
+class DatabasePollingBroker(InProcessBroker):
+    """
+    프로세스당 폴러 하나가 NOTIFICATION_STREAM_POLL_INTERVAL초마다 새 알림/메시지를 조회
+    - 연결 수와 무관하게 주기당 PK 범위 쿼리 두 번 (연결이 없으면 조회하지 않음)
+    - 커서 아래 재조회 범위에서 늦게 커밋된 행도 찾고, 이미 본 id는 건너뜀
+    - 같은 프로세스에서 publish된 신호는 폴링을 기다리지 않고 바로 전달
+    """
+
+    def __init__(self, interval=None):
+        super().__init__()
+        self.interval = interval or settings.NOTIFICATION_STREAM_POLL_INTERVAL
+        self._poller = None  # (이벤트 루프, 폴러 태스크)
+        self._cursor = None  # ((마지막 알림 id, 본 id), (마지막 메시지 id, 본 id))
+
+    async def wait(self, user_id, timeout):
+        self._poller = self._running_task(self._poller, self._poll)
+        return await super().wait(user_id, timeout)
+
+    @staticmethod
+    def _scan(queryset, user_field, position, changed):
+        """
+        재조회 범위부터 새 행 조회
+
+        Args:
+            position: (마지막 id, 재조회 범위에서 이미 본 id set) 또는 처음이면 None
+            changed: 새 행을 받은 사용자 id를 더할 set
+
+        Returns:
+            새 position
+        """
+        if position is None:
+            latest = queryset.aggregate(latest=Max('id'))['latest'] or 0
+            position = (latest, set())
+            floor, collect = _rescan_floor(latest), False
+        else:
+            floor, collect = _rescan_floor(position[0]), True
+
+        high_water, seen = position
+        for row_id, user_id in queryset.filter(id__gt=floor).values_list('id', user_field):
+            if row_id in seen:
+                continue
+            seen.add(row_id)
+            high_water = max(high_water, row_id)
+            if collect:
+                changed.add(user_id)
+        return high_water, _prune_seen(seen, high_water)
+
+    def _new_user_ids(self):
+        """마지막 조회 이후 새 알림/메시지를 받은 사용자 (PK 범위 조회, 처음이면 현재 위치만 기록)"""
+        notifications, messages = self._cursor or (None, None)
+        changed = set()
+        self._cursor = (
+            self._scan(Notification.objects.all(), 'user_id', notifications, changed),
+            self._scan(Message.objects.all(), 'receiver_id', messages, changed),
+        )
+        return changed
+
+    def _poll_once(self):
+        try:
+            return self._new_user_ids()
+        finally:
+            close_old_connections()
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            user_ids = self.subscribed_user_ids()
+            if not user_ids:
+                self._cursor = None  # 연결이 다시 생기면 그 시점부터 조회
+                continue
+            changed = await sync_to_async(self._poll_once, thread_sensitive=False)()
+            changed.intersection_update(user_ids)
+            if changed:
+                super().publish(changed)
+
+
+class RedisBroker(InProcessBroker):
+    """Redis pub/sub 브로커 (프로세스마다 구독 태스크 하나)"""
+
+    def __init__(self, url=None):
+        super().__init__()
+        import redis
+
+        self.url = url or settings.REDIS_URL
+        self._client = redis.Redis.from_url(self.url)
+        self._listener = None  # (이벤트 루프, 구독 태스크)
+
+    def publish(self, user_ids):
+        self._client.publish(REDIS_CHANNEL, json.dumps(sorted(user_ids)))
+
+    async def wait(self, user_id, timeout):
+        self._listener = self._running_task(self._listener, self._listen)
+        return await super().wait(user_id, timeout)
+
+    async def _listen(self):
+        import redis.asyncio
+
+        pubsub = redis.asyncio.Redis.from_url(self.url).pubsub()
+        await pubsub.subscribe(REDIS_CHANNEL)
+        async for message in pubsub.listen():
+            if message['type'] == 'message':
+                super().publish(json.loads(message['data']))
+
+
+@lru_cache(maxsize=1)
+def get_broker():
+    return import_string(settings.NOTIFICATION_STREAM_BACKEND)()
+
+
+def publish(user_ids):
+    """새 알림/메시지가 커밋된 사용자의 스트림 깨우기"""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if user_ids:
+        get_broker().publish(user_ids)
+
+
+def issue_ticket(user_id):
+    """스트림 연결용 일회용 티켓 (NOTIFICATION_STREAM_TICKET_TTL초 동안 유효)"""
+    return signing.dumps({'user': user_id, 'nonce': secrets.token_urlsafe(12)}, salt=TICKET_SALT)
+
+
+def redeem_ticket(ticket):
+    """
+    티켓 검증 후 사용 처리
+
+    Returns:
+        사용자 id (만료/위조/이미 사용한 티켓이면 None)
+    """
+    ttl = settings.NOTIFICATION_STREAM_TICKET_TTL
+    try:
+        payload = signing.loads(ticket, salt=TICKET_SALT, max_age=ttl)
+    except signing.BadSignature:
+        return None
+    # nonce가 기본키 -> 같은 티켓은 어느 워커에서든 한 번만 INSERT 성공
+    try:
+        with transaction.atomic():
+            UsedStreamTicket.objects.create(nonce=payload['nonce'])
+    except IntegrityError:
+        return None
+    # 만료된 티켓은 서명 검증에서 걸러지므로 기록을 지워도 됨
+    UsedStreamTicket.objects.filter(used_at__lt=timezone.now() - timedelta(seconds=ttl * 2)).delete()
+    return payload['user']
+
+
+def _rescan_floor(high_water):
+    """재조회를 시작할 id (이 id 초과부터 다시 조회)"""
+    return max(high_water - settings.NOTIFICATION_STREAM_RESCAN_WINDOW, 0)
+
+
+def _prune_seen(seen, high_water):
+    """재조회 범위 밖으로 내려간 id는 더 조회하지 않으므로 버림"""
+    floor = _rescan_floor(high_water)
+    return {row_id for row_id in seen if row_id > floor}
+
+
+def parse_cursor(value):
+    """
+    Last-Event-ID -> ((마지막 알림 id, 보낸 알림 id), (마지막 메시지 id, 보낸 메시지 id))
+
+    이벤트 id는 '<알림 id>:<메시지 id>' 또는 재조회 범위에서 이미 보낸 id를 붙인
+    '<알림 id>:<메시지 id>:<알림 id.알림 id>:<메시지 id.메시지 id>' 형식
+    (형식이 다르면 None -> 현재 시점부터)
+    """
+    parts = (value or '').split(':')
+    if len(parts) == 2:
+        parts += ['', '']
+    if len(parts) != 4:
+        return None
+    try:
+        notification_id, message_id = int(parts[0]), int(parts[1])
+        seen = [{int(row_id) for row_id in part.split('.') if row_id} for part in parts[2:]]
+    except ValueError:
+        return None
+    return (notification_id, seen[0]), (message_id, seen[1])
+
+
+def format_cursor(cursor):
+    (notification_id, seen_notifications), (message_id, seen_messages) = cursor
+    value = f'{notification_id}:{message_id}'
+    if seen_notifications or seen_messages:
+        value += ':' + ':'.join(
+            '.'.join(str(row_id) for row_id in sorted(seen))
+            for seen in (seen_notifications, seen_messages)
+        )
+    return value
+
+
+def _latest_position(queryset):
+    latest = queryset.aggregate(latest=Max('id'))['latest'] or 0
+    seen = set(queryset.filter(id__gt=_rescan_floor(latest)).values_list('id', flat=True))
+    return latest, seen
+
+
+def latest_cursor(user_id):
+    """사용자의 현재 마지막 알림/받은 메시지 위치 (새 연결은 이 시점 이후만 전달)"""
+    return (
+        _latest_position(Notification.objects.filter(user_id=user_id)),
+        _latest_position(Message.objects.filter(receiver_id=user_id)),
+    )
+
+
+def _new_rows(queryset, position):
+    """재조회 범위부터 아직 보내지 않은 행 (id 순, 최대 STREAM_BATCH_SIZE개)"""
+    high_water, seen = position
+    return queryset.filter(
+        id__gt=_rescan_floor(high_water)
+    ).exclude(id__in=seen).order_by('id')[:STREAM_BATCH_SIZE]
+
+
+def _advance(position, row_id):
+    high_water, seen = position
+    high_water = max(high_water, row_id)
+    return high_water, _prune_seen(seen | {row_id}, high_water)
+
+
+def fetch_events(user_id, cursor):
+    """
+    커서 이후의 알림/받은 메시지 (재조회 범위에서 늦게 커밋된 행 포함, 최대 STREAM_BATCH_SIZE개씩)
+
+    Returns:
+        (events, 새 커서) - events: [(event 이름, data dict, 이벤트 id)]
+    """
+    notifications_at, messages_at = cursor
+    events = []
+    notifications = _new_rows(
+        Notification.objects.filter(user_id=user_id), notifications_at
+    ).select_related('application', 'application__event')
+    for notification in notifications:
+        notifications_at = _advance(notifications_at, notification.id)
+        events.append(('notification', NotificationSerializer(notification).data,
+                       format_cursor((notifications_at, messages_at))))
+
+    messages = _new_rows(
+        Message.objects.filter(receiver_id=user_id), messages_at
+    ).select_related(
+        'sender', 'receiver', 'application', 'application__event', 'application__partner'
+    )
+    for message in messages:
+        messages_at = _advance(messages_at, message.id)
+        events.append(('message', MessageSerializer(message).data,
+                       format_cursor((notifications_at, messages_at))))
+
+    cursor = (notifications_at, messages_at)
+    if events:
+        events.append(('badges', unread_badges(user_id), format_cursor(cursor)))
+    return events, cursor
+
+
+def format_sse(event, data, event_id=None):
+    lines = []
+    if event_id:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data, cls=JSONEncoder, ensure_ascii=False)}')
+    return '\n'.join(lines) + '\n\n'
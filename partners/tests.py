@@ -1,3 +1,1085 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from datetime import date, timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+import reportlab
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from openpyxl import load_workbook
+from rest_framework.test import APIClient
+
+from events.models import Event
+
+from . import exports, pdf_generator, streaming
+from .badges import unread_badges
+from .dashboard import get_dashboard
+from .models import (
+    AnalyticsData, AnalyticsReport, AnalyticsRollup, AnalyticsSample, Announcement, AnnouncementReceipt, Application, Conversation, DashboardSnapshot,
+    Message, Notification, NotificationOutbox, Partner,
+    UnreadCounter, UsedStreamTicket,
+)
+from .notifications import enqueue, process_outbox_batch
+from .rollups import analytics_summary, rebuild_rollup
+from .samples import refresh_sample_pool, sample_analytics_ids
+from .stats import application_stats, application_timeline
+from .timeseries import HourlyMatrix, decode_hourly, encode_hourly, moving_average
+from .reports import (
+    current_report, process_next_report, report_filename, request_report, stream_reports_zip,
+)
+
+
+User = get_user_model()
+
+
+def make_partner(username='partner'):
+    user = User.objects.create_user(
+        username=username, email=f'{username}@example.com', password='pass1234', user_type='partner'
+    )
+    return Partner.objects.create(
+        user=user,
+        business_name=f'{username} 상회',
+        business_number=f'{username}-000',
+        representative_name='홍길동',
+        business_type='음식점',
+        address='서울특별시 중구',
+        phone='010-0000-0000',
+        email=user.email,
+        brand_name=f'{username} 브랜드',
+        brand_intro='소개',
+        products='김밥',
+    )
+
+
+def make_event(name='봄 축제'):
+    return Event.objects.create(
+        name=name,
+        description=f'{name} 설명',
+        category='festival',
+        location='서울 중구',
+        address='서울특별시 중구 세종대로 110',
+        start_date=date(2026, 5, 1),
+        end_date=date(2026, 5, 3),
+        poster_image='https://example.com/poster.jpg',
+    )
+
+
+def make_application(partner, event, **fields):
+    return Application.objects.create(
+        partner=partner,
+        event=event,
+        booth_type='food',
+        products='김밥',
+        brand_intro='소개',
+        **fields,
+    )
+
+
+class ApplicationCounterTests(TestCase):
+    """승인/거절 시 Partner.total_approvals 조건부 증감"""
+
+    def setUp(self):
+        self.partner = make_partner()
+        self.application = make_application(self.partner, make_event())
+
+    def approvals(self):
+        self.partner.refresh_from_db()
+        return self.partner.total_approvals
+
+    def test_approving_twice_counts_once(self):
+        self.application.approve()
+        self.application.approve()
+        self.assertEqual(self.approvals(), 1)
+
+    def test_stale_instance_does_not_count_again(self):
+        stale = Application.objects.get(pk=self.application.pk)
+        self.application.approve()
+        stale.approve()  # 다른 요청이 먼저 승인한 뒤의 동시 승인
+        self.assertEqual(self.approvals(), 1)
+
+    def test_rejecting_approved_application_decrements(self):
+        self.application.approve()
+        self.application.reject('정원 초과')
+        self.assertEqual(self.approvals(), 0)
+        self.application.reject('정원 초과')
+        self.assertEqual(self.approvals(), 0)
+
+    def test_rejecting_pending_application_keeps_count(self):
+        self.application.reject()
+        self.assertEqual(self.approvals(), 0)
+        self.assertEqual(Application.objects.get(pk=self.application.pk).status, 'rejected')
+
+
+class ApplicationStatsCacheTests(TestCase):
+    """사업자 지원 통계 캐시와 커밋 후 무효화"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.partner = make_partner()
+        self.event = make_event()
+
+    def test_stats_are_served_from_cache(self):
+        make_application(self.partner, self.event)
+        expected = {'total': 1, 'pending': 1, 'approved': 0, 'rejected': 0, 'completed': 0}
+        self.assertEqual(application_stats(self.partner.id), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(application_stats(self.partner.id), expected)
+
+    def test_application_changes_invalidate_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            application = make_application(self.partner, self.event)
+        self.assertEqual(application_stats(self.partner.id)['pending'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.approve()
+        stats = application_stats(self.partner.id)
+        self.assertEqual((stats['pending'], stats['approved']), (0, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.delete()
+        self.assertEqual(application_stats(self.partner.id)['total'], 0)
+
+    def test_invalidation_waits_for_commit(self):
+        self.assertEqual(application_stats(self.partner.id)['total'], 0)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            make_application(self.partner, self.event)
+            self.assertEqual(application_stats(self.partner.id)['total'], 0)
+        self.assertTrue(callbacks)
+
+    def test_timeline_lists_upcoming_approved_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_application(self.partner, self.event).approve()
+            make_application(self.partner, make_event('다른 축제')).reject('정원 초과')
+        timeline = application_timeline(self.partner.id, today=date(2026, 4, 1))
+        self.assertEqual([item['name'] for item in timeline['upcoming']], ['봄 축제'])
+        self.assertEqual(
+            [item['status'] for item in timeline['recent_reviewed']], ['rejected', 'approved'],
+        )
+
+
+class DashboardSnapshotTests(TestCase):
+    """사업자 대시보드 스냅샷 (조회 시 한 건만 읽고, 변경은 커밋 후 재계산)"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.partner = make_partner()
+        self.user = self.partner.user
+        self.event = make_event()
+        soon = date.today() + timedelta(days=10)
+        Event.objects.filter(pk=self.event.pk).update(start_date=soon, end_date=soon)
+
+    def test_snapshot_is_built_once_then_read(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            make_application(self.partner, self.event)
+        data = get_dashboard(self.user)
+        self.assertEqual(data['stats']['pending'], 1)
+        self.assertTrue(DashboardSnapshot.objects.filter(partner=self.partner, stale=False).exists())
+        with self.assertNumQueries(1):
+            self.assertEqual(get_dashboard(self.user), data)
+
+    def test_changes_rebuild_snapshot_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            application = make_application(self.partner, self.event)
+        get_dashboard(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            application.approve()
+            sender = User.objects.create_user(username='sender', email='sender@example.com', password='pass1234')
+            Message.objects.create(sender=sender, receiver=self.user, subject='안녕하세요', content='내용')
+        snapshot = DashboardSnapshot.objects.get(partner=self.partner)
+        self.assertFalse(snapshot.stale)
+        self.assertEqual(snapshot.data['stats']['approved'], 1)
+        self.assertEqual(
+            [(item['name'], item['d_day']) for item in snapshot.data['upcoming_events']], [('봄 축제', 10)],
+        )
+        self.assertEqual(
+            {item['type'] for item in snapshot.data['notifications']}, {'message', 'approval'},
+        )
+
+    def test_rollback_keeps_snapshot_fresh(self):
+        get_dashboard(self.user)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                make_application(self.partner, self.event)
+                raise RuntimeError
+        self.assertEqual(callbacks, [])
+        self.assertFalse(DashboardSnapshot.objects.get(partner=self.partner).stale)
+
+    def test_dashboard_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get('/api/partners/dashboard/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['stats']['total'], 0)
+
+
+class LoadedStatusTests(TestCase):
+    """from_db 스냅샷으로 이전 상태 확인 (저장 직전 SELECT 없음)"""
+
+    def setUp(self):
+        application = make_application(make_partner(), make_event())
+        self.application = Application.objects.get(pk=application.pk)
+        NotificationOutbox.objects.all().delete()
+
+    def status_events(self):
+        return list(NotificationOutbox.objects.values_list('payload__status', flat=True))
+
+    def test_status_change_uses_loaded_snapshot(self):
+        self.assertEqual(self.application.get_loaded_value('status'), 'pending')
+        self.application.status = 'completed'
+        with CaptureQueriesContext(connection) as queries:
+            self.application.save()
+        self.assertFalse([
+            q['sql'] for q in queries if q['sql'].startswith('SELECT') and 'FROM "partners_application"' in q['sql']
+        ])
+        self.assertEqual(self.status_events(), ['completed'])
+
+        # 저장 후 스냅샷이 갱신되어 같은 상태로 다시 저장해도 알림 없음
+        self.assertEqual(self.application.get_loaded_value('status'), 'completed')
+        self.application.save()
+        self.assertEqual(self.status_events(), ['completed'])
+
+    def test_unchanged_status_records_nothing(self):
+        self.application.booth_location = 'A-3'
+        self.application.save()
+        self.assertEqual(self.status_events(), [])
+
+    def test_instance_without_snapshot_reads_status_once(self):
+        fields = Application.objects.filter(pk=self.application.pk).values().get()
+        unloaded = Application(**{**fields, 'status': 'rejected'})
+        self.assertFalse(unloaded.has_loaded_value('status'))
+        unloaded.save()
+        self.assertEqual(self.status_events(), ['rejected'])
+
+
+class NotificationOutboxTests(TestCase):
+    """알림 outbox 처리 (전달/재시도/실패)"""
+
+    def setUp(self):
+        self.sender = make_partner('sender').user
+        self.receiver = make_partner('receiver').user
+
+    def test_delivers_and_removes_message_event(self):
+        Message.objects.create(sender=self.sender, receiver=self.receiver, subject='안녕하세요', content='내용')
+        self.assertEqual(NotificationOutbox.objects.count(), 1)
+
+        processed, created, failed = process_outbox_batch()
+
+        self.assertEqual((processed, created, failed), (1, 1, 0))
+        self.assertFalse(NotificationOutbox.objects.exists())
+        notification = Notification.objects.get()
+        self.assertEqual(notification.user, self.receiver)
+        self.assertEqual(notification.notification_type, 'message_received')
+
+    def test_failed_event_backs_off_then_fails(self):
+        # subject가 없는 payload -> 알림 생성 실패
+        record = enqueue('message_received', message_id=1, sender_id=self.sender.id,
+                         receiver_id=self.receiver.id, application_id=None)
+        good = enqueue('message_received', message_id=2, sender_id=self.sender.id,
+                       receiver_id=self.receiver.id, application_id=None, subject='정상')
+
+        self.assertEqual(process_outbox_batch(max_attempts=2), (2, 1, 1))
+        self.assertFalse(NotificationOutbox.objects.filter(pk=good.pk).exists())
+        record.refresh_from_db()
+        self.assertEqual((record.status, record.attempts), ('pending', 1))
+        self.assertGreater(record.available_at, timezone.now())
+        self.assertIn('KeyError', record.last_error)
+
+        # backoff 동안은 처리하지 않음
+        self.assertEqual(process_outbox_batch(max_attempts=2), (0, 0, 0))
+
+        NotificationOutbox.objects.filter(pk=record.pk).update(available_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(process_outbox_batch(max_attempts=2), (1, 0, 1))
+        record.refresh_from_db()
+        self.assertEqual((record.status, record.attempts), ('failed', 2))
+        self.assertEqual(process_outbox_batch(max_attempts=2), (0, 0, 0))
+
+
+class OutboxTransactionTests(TransactionTestCase):
+    """outbox 행은 원본 변경과 같은 트랜잭션에 기록 (autocommit 저장도 허용)"""
+
+    class Rollback(Exception):
+        pass
+
+    def test_autocommit_save_records_event(self):
+        sender, receiver = make_partner('sender').user, make_partner('receiver').user
+        message = Message.objects.create(sender=sender, receiver=receiver, subject='제목', content='내용')
+        self.assertTrue(NotificationOutbox.objects.filter(payload__message_id=message.id).exists())
+
+    def test_event_rolls_back_with_source_row(self):
+        partner = make_partner()
+        event = make_event()
+
+        with self.assertRaises(self.Rollback):
+            with transaction.atomic():
+                make_application(partner, event)
+                raise self.Rollback
+        self.assertFalse(Application.objects.exists())
+        self.assertFalse(NotificationOutbox.objects.exists())
+
+
+@skipUnless(connection.vendor == 'postgresql', 'SKIP LOCKED는 PostgreSQL에서만 확인')
+class OutboxSkipLockedTests(TransactionTestCase):
+    """다른 워커가 잠근 이벤트는 건너뜀"""
+
+    def test_locked_event_is_skipped(self):
+        sender, receiver = make_partner('sender').user, make_partner('receiver').user
+        with transaction.atomic():
+            locked = Message.objects.create(sender=sender, receiver=receiver, subject='첫 메시지', content='내용')
+            Message.objects.create(sender=sender, receiver=receiver, subject='둘째 메시지', content='내용')
+        locked_record = NotificationOutbox.objects.get(payload__message_id=locked.id)
+
+        acquired, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            try:
+                with transaction.atomic():
+                    NotificationOutbox.objects.select_for_update().get(pk=locked_record.pk)
+                    acquired.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        try:
+            self.assertTrue(acquired.wait(10))
+            self.assertEqual(process_outbox_batch(), (1, 1, 0))
+        finally:
+            release.set()
+            worker.join()
+
+        self.assertEqual(list(NotificationOutbox.objects.values_list('pk', flat=True)), [locked_record.pk])
+        self.assertEqual(process_outbox_batch(), (1, 1, 0))
+        self.assertEqual(Notification.objects.filter(user=receiver).count(), 2)
+
+
+class NotificationBulkTests(TestCase):
+    """알림 일괄 읽음/정리 (UPDATE/DELETE 한 번)"""
+
+    def setUp(self):
+        self.user = make_partner().user
+        self.other = make_partner('other').user
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def notify(self, user, notification_type='system', **fields):
+        notification = Notification.objects.create(
+            user=user, notification_type=notification_type, title='알림', message='내용', **fields
+        )
+        if not notification.read:
+            UnreadCounter.bump(user.id, notifications=1)
+        return notification
+
+    def unread(self, user):
+        return list(Notification.objects.filter(user=user, read=False).values_list('id', flat=True))
+
+    def test_mark_all_read_is_one_update(self):
+        for _ in range(3):
+            self.notify(self.user)
+        other = self.notify(self.other)
+        with self.assertNumQueries(2):  # 알림 UPDATE + 카운터 UPDATE
+            count = Notification.objects.filter(user=self.user).mark_read()
+            UnreadCounter.bump(self.user.id, notifications=-count)
+        self.assertEqual(count, 3)
+        self.assertEqual(self.unread(self.other), [other.id])
+
+        self.notify(self.user)
+        response = self.client.post('/api/partners/notifications/mark_all_read/')
+        self.assertEqual(response.json()['count'], 1)
+        self.assertEqual(unread_badges(self.user.id)['notifications'], 0)
+        self.assertEqual(unread_badges(self.other.id)['notifications'], 1)
+
+    def test_mark_read_by_type_and_ids(self):
+        system = self.notify(self.user)
+        message = self.notify(self.user, 'message_received')
+        reminder = self.notify(self.user, 'event_reminder')
+        other = self.notify(self.other)
+
+        response = self.client.post('/api/partners/notifications/by-type/message_received/mark-read/')
+        self.assertEqual(response.json()['count'], 1)
+        self.assertCountEqual(self.unread(self.user), [system.id, reminder.id])
+
+        # 다른 사용자의 알림 id는 무시
+        response = self.client.post(
+            '/api/partners/notifications/mark-read/', {'ids': [system.id, message.id, other.id]}, format='json'
+        )
+        self.assertEqual(response.json()['count'], 1)
+        self.assertEqual(self.unread(self.user), [reminder.id])
+        self.assertEqual(self.unread(self.other), [other.id])
+        self.assertEqual(unread_badges(self.user.id)['notifications'], 1)
+
+        response = self.client.post('/api/partners/notifications/mark-read/', {'ids': []}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_clear_read_deletes_only_old_read_notifications(self):
+        long_ago = timezone.now() - timedelta(days=40)
+        old = self.notify(self.user, read=True, read_at=long_ago)
+        recent = self.notify(self.user, read=True, read_at=timezone.now())
+        unread = self.notify(self.user)
+        others = self.notify(self.other, read=True, read_at=long_ago)
+
+        response = self.client.post('/api/partners/notifications/clear-read/', {}, format='json')
+        self.assertEqual(response.json()['count'], 1)
+        self.assertFalse(Notification.objects.filter(pk=old.pk).exists())
+        self.assertEqual(
+            set(Notification.objects.values_list('pk', flat=True)), {recent.pk, unread.pk, others.pk},
+        )
+
+        response = self.client.post('/api/partners/notifications/clear-read/', {'days': 0}, format='json')
+        self.assertEqual(response.json()['count'], 1)
+
+
+class UnreadBadgeTests(TestCase):
+    """읽지 않은 메시지/알림/공지 카운터 (UnreadCounter)"""
+
+    def setUp(self):
+        self.partner = make_partner()
+        self.user = self.partner.user
+        self.event = make_event()
+        self.organizer = User.objects.create_user(
+            username='organizer', email='organizer@example.com', password='pass1234', is_staff=True
+        )
+
+    def announce(self, audience='approved'):
+        return Announcement.objects.create(
+            event=self.event, audience=audience, sender=self.organizer, subject='공지', content='내용'
+        )
+
+    def test_badges_read_one_row_without_counting(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(unread_badges(self.user.id), {'messages': 0, 'notifications': 0})
+        self.assertFalse(UnreadCounter.objects.exists())
+
+    def test_first_message_creates_counter_row(self):
+        sender = make_partner('sender').user
+        message = Message.objects.create(sender=sender, receiver=self.user, subject='제목', content='내용')
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+
+        message.mark_as_read()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 0)
+
+    def test_announcements_are_counted_on_fan_out_and_read(self):
+        application = make_application(self.partner, self.event)
+        self.announce('applicants')
+        approved_only = self.announce('approved')
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+
+        # 승인되면 승인 대상 공지도 받음, 거절되면 다시 빠짐
+        application.approve()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 2)
+        Announcement.objects.filter(pk=approved_only.pk).mark_read(self.user.id)
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+        application.reject()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+
+        Announcement.objects.for_user(self.user.id).mark_read(self.user.id)
+        self.assertEqual(unread_badges(self.user.id)['messages'], 0)
+
+    def test_deleting_announcement_or_application_releases_count(self):
+        application = make_application(self.partner, self.event, status='approved')
+        announcement = self.announce()
+        self.announce()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 2)
+
+        announcement.delete()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+        application.delete()
+        self.assertEqual(unread_badges(self.user.id)['messages'], 0)
+
+    def test_reconcile_restores_drifted_and_missing_counters(self):
+        make_application(self.partner, self.event, status='approved')
+        self.announce()
+        Notification.objects.create(user=self.user, notification_type='message_received', title='알림', message='내용')
+        UnreadCounter.objects.all().delete()
+
+        call_command('reconcile_unread_counters', stdout=io.StringIO())
+
+        counter = UnreadCounter.objects.get(user=self.user)
+        self.assertEqual((counter.messages, counter.notifications, counter.announcements), (0, 1, 1))
+
+    def test_badges_endpoint(self):
+        self.announce('applicants')
+        make_application(self.partner, self.event)
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get('/api/partners/badges/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'messages': 1, 'notifications': 0})
+
+
+class StreamTicketTests(TestCase):
+    """알림 스트림 일회용 티켓 인증"""
+
+    def setUp(self):
+        self.user = make_partner().user
+
+    def test_ticket_can_be_redeemed_once(self):
+        ticket = streaming.issue_ticket(self.user.id)
+        self.assertEqual(streaming.redeem_ticket(ticket), self.user.id)
+        self.assertIsNone(streaming.redeem_ticket(ticket))
+        self.assertEqual(UsedStreamTicket.objects.count(), 1)
+
+    def test_tampered_ticket_is_rejected(self):
+        ticket = streaming.issue_ticket(self.user.id)
+        self.assertIsNone(streaming.redeem_ticket(ticket[:-1] + ('A' if ticket[-1] != 'A' else 'B')))
+        self.assertIsNone(streaming.redeem_ticket('not-a-ticket'))
+
+    def test_stream_requires_valid_ticket(self):
+        url = '/api/partners/notifications/stream/'
+        self.assertEqual(self.client.get(url).status_code, 401)
+
+        Notification.objects.create(
+            user=self.user, notification_type='message_received', title='새 메시지', message='내용'
+        )
+        ticket = streaming.issue_ticket(self.user.id)
+        response = self.client.get(url, {'ticket': ticket, 'mode': 'poll', 'last_event_id': '0:0'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event['event'] for event in response.json()['events']], ['notification', 'badges'])
+
+        # 같은 티켓으로 다시 연결할 수 없음
+        response = self.client.get(url, {'ticket': ticket, 'mode': 'poll', 'last_event_id': '0:0'})
+        self.assertEqual(response.status_code, 401)
+
+
+class StreamCursorTests(TestCase):
+    """스트림 커서 (늦게 커밋된 행 재조회)"""
+
+    def setUp(self):
+        self.user = make_partner().user
+
+    def notify(self, pk):
+        return Notification.objects.create(
+            pk=pk, user=self.user, notification_type='message_received', title='새 메시지', message='내용'
+        )
+
+    def notification_ids(self, events):
+        return [data['id'] for event, data, _event_id in events if event == 'notification']
+
+    def test_late_committed_row_is_delivered_once(self):
+        self.notify(10)
+        events, cursor = streaming.fetch_events(self.user.id, ((0, set()), (0, set())))
+        self.assertEqual(self.notification_ids(events), [10])
+
+        # 먼저 id를 받았지만 나중에 커밋된 알림
+        self.notify(7)
+        events, cursor = streaming.fetch_events(self.user.id, cursor)
+        self.assertEqual(self.notification_ids(events), [7])
+
+        # 커서를 문자열로 주고받아도 보낸 id가 유지됨
+        cursor = streaming.parse_cursor(streaming.format_cursor(cursor))
+        events, cursor = streaming.fetch_events(self.user.id, cursor)
+        self.assertEqual(events, [])
+
+
+class StreamBrokerTests(TestCase):
+    """요청마다 새 이벤트 루프를 쓰는 환경(WSGI/runserver)의 브로커"""
+
+    def test_poller_restarts_on_a_new_event_loop(self):
+        broker = streaming.DatabasePollingBroker(interval=60)
+
+        async def wait():
+            await broker.wait(self.id(), 0.01)
+            return broker._poller[0] is asyncio.get_running_loop() and not broker._poller[1].done()
+
+        # async_to_sync는 호출마다 새 루프를 만들고 끝나면 닫음
+        self.assertTrue(async_to_sync(wait)())
+        self.assertTrue(async_to_sync(wait)())
+
+    def test_publish_skips_waiters_on_closed_loops(self):
+        broker = streaming.InProcessBroker()
+        loop = asyncio.new_event_loop()
+        loop.close()
+        broker._waiters[1].add((loop, asyncio.Event()))
+        broker.publish([1])
+
+
+def make_analytics(partner, event, **fields):
+    application = make_application(partner, event, status='completed')
+    return AnalyticsData.objects.create(
+        partner=partner, event=event, application=application, **{'visitor_count': 800, **fields}
+    )
+
+
+class AnnouncementTests(TestCase):
+    """축제 공지 (한 번만 저장하고 조회 시점에 대상 계산)"""
+
+    def setUp(self):
+        self.event = make_event()
+        self.approved = make_partner('approved')
+        self.applicant = make_partner('applicant')
+        self.outsider = make_partner('outsider')
+        make_application(self.approved, self.event, status='approved')
+        make_application(self.applicant, self.event)
+        make_application(self.outsider, make_event('다른 축제'), status='approved')
+        self.organizer = User.objects.create_user(
+            username='organizer', email='organizer@example.com', password='pass1234', is_staff=True
+        )
+
+    def client_for(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client
+
+    def announce(self, audience):
+        response = self.client_for(self.organizer).post('/api/partners/announcements/', {
+            'event': self.event.id, 'audience': audience, 'subject': f'{audience} 공지', 'content': '내용',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return response.json()['id']
+
+    def subjects(self, partner):
+        return set(Announcement.objects.for_user(partner.user_id).values_list('subject', flat=True))
+
+    def test_broadcast_is_one_row_resolved_per_reader(self):
+        self.announce('approved')
+        self.announce('applicants')
+        self.assertEqual(Announcement.objects.count(), 2)
+        self.assertFalse(AnnouncementReceipt.objects.exists())
+
+        self.assertEqual(self.subjects(self.approved), {'approved 공지', 'applicants 공지'})
+        self.assertEqual(self.subjects(self.applicant), {'applicants 공지'})
+        self.assertEqual(self.subjects(self.outsider), set())
+
+        # 승인되면 승인 대상 공지도 보임
+        Application.objects.get(partner=self.applicant).approve()
+        self.assertEqual(self.subjects(self.applicant), {'approved 공지', 'applicants 공지'})
+
+    def test_only_staff_can_announce(self):
+        response = self.client_for(self.approved.user).post('/api/partners/announcements/', {
+            'event': self.event.id, 'audience': 'approved', 'subject': '공지', 'content': '내용',
+        }, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Announcement.objects.exists())
+
+    def test_read_receipts_are_per_user(self):
+        announcement_id = self.announce('applicants')
+        client = self.client_for(self.applicant.user)
+        response = client.post(f'/api/partners/announcements/{announcement_id}/mark_read/')
+        self.assertTrue(response.json()['read'])
+        self.assertEqual(AnnouncementReceipt.objects.count(), 1)
+
+        listed = self.client_for(self.approved.user).get('/api/partners/announcements/').json()['results']
+        self.assertEqual([(item['id'], item['read']) for item in listed], [(announcement_id, False)])
+        self.assertEqual(client.post('/api/partners/announcements/mark_all_read/').json()['count'], 0)
+        self.assertEqual(
+            self.client_for(self.outsider.user).get(f'/api/partners/announcements/{announcement_id}/').status_code,
+            404,
+        )
+
+    def test_inbox_includes_announcements(self):
+        self.announce('approved')
+        Message.objects.create(
+            sender=self.organizer, receiver=self.approved.user, subject='안녕하세요', content='내용'
+        )
+        results = self.client_for(self.approved.user).get('/api/partners/messages/inbox/').json()['results']
+        self.assertEqual(
+            [(item['message_type'], item['subject']) for item in results],
+            [('direct', '안녕하세요'), ('announcement', 'approved 공지')],
+        )
+
+
+class ConversationTests(TestCase):
+    """대화 스레드와 keyset 페이지네이션"""
+
+    def setUp(self):
+        self.user = make_partner().user
+        self.alice = User.objects.create_user(username='alice', email='alice@example.com', password='pass1234')
+        self.bob = User.objects.create_user(username='bob', email='bob@example.com', password='pass1234')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.clock = timezone.now() - timedelta(hours=1)
+
+    def send(self, sender, receiver, subject):
+        message = Message.objects.create(sender=sender, receiver=receiver, subject=subject, content='내용')
+        # created_at이 겹치지 않도록 1분 간격으로 고정
+        self.clock += timedelta(minutes=1)
+        Message.objects.filter(pk=message.pk).update(created_at=self.clock)
+        return message
+
+    def walk(self, url):
+        items = []
+        while url:
+            page = self.client.get(url).json()
+            items.extend(page['results'])
+            url = page['next']
+        return items
+
+    def test_messages_are_grouped_into_threads(self):
+        self.send(self.alice, self.user, '1')
+        self.send(self.user, self.alice, '2')
+        self.send(self.alice, self.user, '3')
+        self.send(self.bob, self.user, '4')
+
+        self.assertEqual(Conversation.objects.count(), 2)
+        threads = self.client.get('/api/partners/conversations/').json()['results']
+        self.assertEqual([thread['other_user']['username'] for thread in threads], ['bob', 'alice'])
+        self.assertEqual([thread['unread_count'] for thread in threads], [1, 2])
+
+        response = self.client.post(f"/api/partners/conversations/{threads[1]['id']}/mark_read/")
+        self.assertEqual(response.json()['count'], 2)
+        self.assertEqual(unread_badges(self.user.id)['messages'], 1)
+
+    def test_thread_pages_walk_newest_first(self):
+        for number in range(5):
+            self.send(self.alice, self.user, str(number))
+        conversation = Conversation.objects.get()
+        items = self.walk(f'/api/partners/conversations/{conversation.id}/messages/?page_size=2')
+        self.assertEqual([item['subject'] for item in items], ['4', '3', '2', '1', '0'])
+
+    def test_inbox_merges_messages_and_announcements_by_time(self):
+        event = make_event()
+        make_application(Partner.objects.get(user=self.user), event)
+        expected = []
+        for number in range(3):
+            expected.append(self.send(self.alice, self.user, f'메시지 {number}').subject)
+            announcement = Announcement.objects.create(
+                event=event, audience='applicants', sender=self.bob, subject=f'공지 {number}', content='내용'
+            )
+            self.clock += timedelta(minutes=1)
+            Announcement.objects.filter(pk=announcement.pk).update(created_at=self.clock)
+            expected.append(announcement.subject)
+        self.send(self.alice, self.bob, '다른 사람 메시지')
+
+        items = self.walk('/api/partners/messages/inbox/?page_size=2')
+        self.assertEqual([item['subject'] for item in items], expected[::-1])
+
+        response = self.client.get('/api/partners/messages/inbox/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+
+
+class AnalyticsSampleTests(TestCase):
+    """자기 성과 데이터가 없는 사업자용 샘플 풀"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        event = make_event()
+        self.analytics_ids = {make_analytics(make_partner(f'owner{n}'), event).id for n in range(8)}
+        self.partner = make_partner()
+
+    def test_pool_is_filled_on_first_use_and_sample_is_stable(self):
+        with CaptureQueriesContext(connection) as queries:
+            sample = sample_analytics_ids(self.partner.id)
+        self.assertEqual(AnalyticsSample.objects.count(), 8)
+        self.assertEqual(len(sample), 5)
+        self.assertLessEqual(set(sample), self.analytics_ids)
+        self.assertFalse([q['sql'] for q in queries if 'RANDOM()' in q['sql'].upper()])
+
+        cache.clear()
+        self.assertEqual(sample_analytics_ids(self.partner.id), sample)
+        with self.assertNumQueries(0):
+            sample_analytics_ids(self.partner.id)
+
+    def test_refresh_redraws_pool(self):
+        self.assertEqual(refresh_sample_pool(size=3, seed=1), 3)
+        pool = set(AnalyticsSample.objects.values_list('analytics_id', flat=True))
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(set(sample_analytics_ids(self.partner.id)), pool)
+
+        call_command('refresh_analytics_samples', size=100, stdout=io.StringIO())
+        self.assertEqual(AnalyticsSample.objects.count(), 8)
+
+    def test_partner_without_data_sees_sample(self):
+        client = APIClient()
+        client.force_authenticate(self.partner.user)
+        results = client.get('/api/partners/analytics/').json()['results']
+        self.assertEqual([item['id'] for item in results], sorted(sample_analytics_ids(self.partner.id)))
+
+        summary = client.get('/api/partners/analytics/summary/').json()
+        self.assertTrue(summary['is_sample_data'])
+        self.assertEqual((summary['total_events'], summary['total_visitors']), (5, 4000))
+
+
+class AnalyticsRollupTests(TestCase):
+    """사업자 성과 요약 행 (생성 시 증분 반영, 수정/삭제 시 재계산)"""
+
+    FIELDS = [
+        'event_count', 'total_visitors', 'total_sales', 'total_reviews', 'rating_sum', 'sentiment_sum',
+        'best_visitor_count', 'best_analytics_id', 'recent_analytics_ids',
+    ]
+
+    def setUp(self):
+        self.partner = make_partner()
+        self.analytics = [
+            make_analytics(
+                self.partner, make_event(f'축제 {n}'), visitor_count=visitors,
+                estimated_sales=visitors * 1000, average_rating=rating, review_count=n, sentiment_score=0.5,
+            )
+            for n, (visitors, rating) in enumerate([(800, 4.5), (1500, 3.0), (1200, 4.0), (900, 5.0)])
+        ]
+
+    def rollup(self):
+        return AnalyticsRollup.objects.filter(partner=self.partner).values(*self.FIELDS).get()
+
+    def test_incremental_adds_match_rebuild(self):
+        added = self.rollup()
+        self.assertEqual(added['event_count'], 4)
+        self.assertEqual(added['best_analytics_id'], self.analytics[1].id)
+        self.assertEqual(added['recent_analytics_ids'], [a.id for a in self.analytics[:0:-1]])
+
+        rebuild_rollup(self.partner.id)
+        self.assertEqual(self.rollup(), added)
+
+    def test_update_and_delete_rebuild(self):
+        best = self.analytics[1]
+        best.visitor_count = 100
+        best.save()
+        self.assertEqual(self.rollup()['best_analytics_id'], self.analytics[2].id)
+        self.assertEqual(self.rollup()['total_visitors'], 800 + 100 + 1200 + 900)
+
+        self.analytics[2].delete()
+        rollup = self.rollup()
+        self.assertEqual((rollup['event_count'], rollup['best_analytics_id']), (3, self.analytics[3].id))
+        self.assertNotIn(self.analytics[2].id, rollup['recent_analytics_ids'])
+
+    def test_summary_reads_rollup_with_current_names(self):
+        Event.objects.filter(pk=self.analytics[1].event_id).update(name='바뀐 이름')
+        AnalyticsRollup.objects.all().delete()  # 요약 행이 없으면 처음 조회할 때 계산
+
+        summary = analytics_summary(self.partner.id)
+        self.assertEqual(summary['total_visitors'], 4400)
+        self.assertEqual(summary['avg_rating'], 4.125)
+        self.assertEqual(summary['best_event']['name'], '바뀐 이름')
+        self.assertEqual(len(summary['recent_events']), 3)
+        with self.assertNumQueries(2):  # 요약 행 + 최고/최근 성과 데이터
+            analytics_summary(self.partner.id)
+
+        self.assertIsNone(analytics_summary(make_partner('empty').id))
+
+
+class HourlySeriesTests(TestCase):
+    """시간대별 방문객 고정 길이 시계열과 행렬 연산"""
+
+    def test_encode_decode_round_trip(self):
+        data = encode_hourly({'10': 120, 11: '80', '23': 5, '24': 99, 'x': 1, '9': -3, '12': None})
+        self.assertEqual(len(data), 96)
+        series = decode_hourly(data)
+        self.assertEqual(series.tolist(), [0] * 10 + [120, 80] + [0] * 11 + [5])
+        self.assertEqual(decode_hourly(None).tolist(), [0] * 24)
+        self.assertEqual(decode_hourly(memoryview(encode_hourly({}))).tolist(), [0] * 24)
+
+    def test_save_keeps_series_in_sync(self):
+        analytics = make_analytics(make_partner(), make_event(), hourly_visitors={'10': 50})
+        analytics.hourly_visitors = {'14': 70}
+        analytics.save(update_fields=['hourly_visitors'])
+        stored = AnalyticsData.objects.values_list('hourly_series', flat=True).get(pk=analytics.pk)
+        self.assertEqual(decode_hourly(stored)[[10, 14]].tolist(), [0, 70])
+
+    def test_matrix_peaks_percentiles_and_moving_average(self):
+        matrix = HourlyMatrix([1, 2, 3], [
+            encode_hourly({'10': 10, '11': 30, '12': 60}),
+            encode_hourly({'18': 40}),
+            None,
+        ])
+        self.assertEqual(matrix.totals().tolist(), [100, 40, 0])
+        self.assertEqual(matrix.peak_hours().tolist(), [12, 18, -1])
+        self.assertEqual(matrix.percentile_hours(50).tolist(), [12, 18, -1])
+        self.assertEqual(matrix.percentile_hours(40).tolist(), [11, 18, -1])
+        self.assertEqual(matrix.moving_average(3)[0, 10].item(), 100 / 3)
+        self.assertEqual(moving_average(list(range(24)), 24).tolist(), [11.5])
+        self.assertEqual(matrix.similarity(matrix.counts[1]).round(6).tolist(), [0.0, 1.0, 0.0])
+        self.assertAlmostEqual(matrix.compare(matrix)['similarity'], 1.0)
+
+    def test_matrix_from_queryset(self):
+        partner, event = make_partner(), make_event()
+        analytics = make_analytics(partner, event, hourly_visitors={'13': 7})
+        matrix = HourlyMatrix.from_queryset(AnalyticsData.objects.filter(pk=analytics.pk))
+        self.assertEqual((matrix.ids.tolist(), matrix.peak_hours().tolist()), ([analytics.pk], [13]))
+
+
+class ReportQueueTests(TestCase):
+    """성과 리포트 PDF 생성 대기열"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.analytics = make_analytics(make_partner(), make_event())
+
+    def test_failed_build_backs_off_before_retry(self):
+        report = request_report(self.analytics)
+        with mock.patch('partners.reports.generate_analytics_pdf', side_effect=OSError('font missing')):
+            process_next_report(max_attempts=2)
+            report.refresh_from_db()
+            self.assertEqual((report.status, report.attempts), ('pending', 1))
+            self.assertGreater(report.available_at, timezone.now())
+
+            # backoff 동안은 가져가지 않음
+            self.assertIsNone(process_next_report(max_attempts=2))
+
+            AnalyticsReport.objects.filter(pk=report.pk).update(available_at=timezone.now())
+            process_next_report(max_attempts=2)
+            report.refresh_from_db()
+            self.assertEqual((report.status, report.attempts), ('failed', 2))
+
+        # 다시 요청하면 바로 대기열로 돌아가 생성됨
+        report = request_report(self.analytics)
+        self.assertEqual(process_next_report().pk, report.pk)
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'ready')
+        self.assertTrue(report.file.storage.exists(report.file.name))
+        self.assertEqual(current_report(self.analytics).pk, report.pk)
+
+
+class PdfFontTests(TestCase):
+    """PDF 리포트 폰트/스타일 (프로세스당 한 번 등록)"""
+
+    def setUp(self):
+        self.reset_fonts()
+        self.addCleanup(self.reset_fonts)
+
+    def reset_fonts(self):
+        pdf_generator.get_fonts.cache_clear()
+        pdf_generator.get_korean_style.cache_clear()
+
+    def test_fonts_and_styles_are_registered_once(self):
+        analytics = make_analytics(make_partner(), make_event())
+        with mock.patch.object(
+            pdf_generator.pdfmetrics, 'registerFont', wraps=pdf_generator.pdfmetrics.registerFont
+        ) as register:
+            first = pdf_generator.generate_analytics_pdf(analytics, '브랜드', '봄 축제')
+            registered = register.call_count
+            second = pdf_generator.generate_analytics_pdf(analytics, '브랜드', '봄 축제')
+        self.assertGreaterEqual(registered, 1)
+        self.assertEqual(register.call_count, registered)
+        self.assertIs(pdf_generator.get_korean_style(), pdf_generator.get_korean_style())
+        self.assertEqual(first.getvalue()[:4], b'%PDF')
+        self.assertEqual(second.getvalue()[:4], b'%PDF')
+
+    def test_fonts_without_hangul_fall_back_to_cid_font(self):
+        latin_only = os.path.join(os.path.dirname(reportlab.__file__), 'fonts', 'Vera.ttf')
+        with override_settings(PDF_FONT_PATHS=['/nonexistent/font.ttf', latin_only]), \
+                self.assertLogs('partners.pdf_generator', 'WARNING') as logs:
+            fonts = pdf_generator.get_fonts()
+        self.assertEqual(fonts['regular'], pdf_generator.FALLBACK_CID_FONT)
+        self.assertFalse(fonts['embedded'])
+        self.assertIn('한글 글리프', '\n'.join(logs.output))
+
+        out = io.StringIO()
+        call_command('check_pdf_fonts', stdout=out)
+        self.assertIn(pdf_generator.FALLBACK_CID_FONT, out.getvalue())
+
+
+class AnalyticsExportTests(TestCase):
+    """성과 리포트 전체 ZIP 다운로드"""
+
+    def setUp(self):
+        self.partner = make_partner()
+        self.analytics = [make_analytics(self.partner, make_event(f'축제 {i}')) for i in range(3)]
+        self.client = APIClient()
+        self.client.force_authenticate(self.partner.user)
+
+    def download(self):
+        response = self.client.get('/api/partners/analytics/export-all/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+
+    def test_wsgi_export_streams_every_report(self):
+        archive = self.download()
+        self.assertEqual(
+            sorted(archive.namelist()),
+            sorted(report_filename(analytics) for analytics in self.analytics),
+        )
+        self.assertTrue(all(archive.read(name).startswith(b'%PDF') for name in archive.namelist()))
+
+    def test_failed_report_is_listed_in_errors(self):
+        failing_id = self.analytics[0].id
+
+        def report_content(analytics, file_name=None):
+            if analytics.id == failing_id:
+                raise OSError('storage unavailable')
+            return b'%PDF-1.4'
+
+        with mock.patch('partners.reports._report_content', side_effect=report_content), \
+                self.assertLogs('partners.reports', 'ERROR'):
+            archive = self.download()
+        self.assertEqual(len(archive.namelist()), 3)
+        self.assertIn(report_filename(self.analytics[0]), archive.read('errors.txt').decode())
+
+    def test_async_stream_matches_sync_stream(self):
+        async def collect(stream):
+            return b''.join([chunk async for chunk in stream])
+
+        with mock.patch('partners.reports._report_content', return_value=b'%PDF-1.4'):
+            content = async_to_sync(collect)(stream_reports_zip(self.analytics, workers=2))
+        self.assertEqual(
+            sorted(zipfile.ZipFile(io.BytesIO(content)).namelist()),
+            sorted(report_filename(analytics) for analytics in self.analytics),
+        )
+
+
+class ApplicationExportTests(TestCase):
+    """지원서 엑셀/CSV 스트리밍 내보내기"""
+
+    def setUp(self):
+        self.partner = make_partner()
+        self.client = APIClient()
+        self.client.force_authenticate(self.partner.user)
+        self.approved = make_application(
+            self.partner, make_event('봄 축제'), booth_size='6x3', price_range='3,000원', participation_fee=150000,
+        )
+        self.approved.approve()
+        self.pending = make_application(self.partner, make_event('여름 축제'))
+        make_application(make_partner('other'), make_event('다른 축제'))
+
+    def download(self, query=''):
+        async def collect(stream):
+            return b''.join([chunk async for chunk in stream])
+
+        response = self.client.get(f'/api/partners/applications/export-excel/{query}')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return response, async_to_sync(collect)(response.streaming_content)
+
+    def expected_rows(self):
+        applied = {
+            app.id: app.applied_at.strftime('%Y-%m-%d') for app in (self.approved, self.pending)
+        }
+        return [
+            [self.pending.id, '여름 축제', '검토중', '음식 부스', '3x3m (기본형)', '김밥', '',
+             applied[self.pending.id], '', 0.0, '미결제', ''],
+            [self.approved.id, '봄 축제', '승인됨', '음식 부스', '6x3m (대형)', '김밥', '3,000원',
+             applied[self.approved.id], self.approved.reviewed_at.strftime('%Y-%m-%d'), 150000.0, '미결제', ''],
+        ]
+
+    def test_csv_has_bom_header_and_display_values(self):
+        response, content = self.download('?format=csv')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertTrue(response['Content-Disposition'].endswith('.csv"'))
+        self.assertTrue(content.startswith('\ufeff'.encode('utf-8')))
+
+        rows = list(csv.reader(io.StringIO(content.decode('utf-8-sig'))))
+        self.assertEqual(rows[0], exports.HEADERS)
+        self.assertEqual(rows[1:], [[str(value) for value in row] for row in self.expected_rows()])
+
+    def test_xlsx_has_styled_header_and_same_rows(self):
+        response, content = self.download()
+        self.assertEqual(int(response['Content-Length']), len(content))
+        self.assertTrue(response['Content-Disposition'].endswith('.xlsx"'))
+
+        sheet = load_workbook(io.BytesIO(content))['Applications']
+        rows = [list(row) for row in sheet.iter_rows(values_only=True)]
+        self.assertEqual(rows[0], exports.HEADERS)
+        self.assertEqual(
+            rows[1:], [[value if value != '' else None for value in row] for row in self.expected_rows()],
+        )
+        self.assertTrue(sheet['A1'].font.bold)
+        self.assertEqual(sheet.column_dimensions['L'].width, exports.COLUMN_WIDTH)
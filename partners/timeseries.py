@@ -0,0 +1,160 @@
+"""
+시간대별 방문객 시계열 (AnalyticsData.hourly_series)
+- hourly_visitors JSON({"10": 120, ...})을 0~23시 고정 길이 uint32 배열(96바이트)로 저장
+  (AnalyticsData.save()에서 갱신) -> 조회 시 문자열 키 파싱/정렬 없음
+- HourlyMatrix: 여러 성과 데이터의 시계열을 (이벤트 수, 24) 행렬 하나로 읽어
+  최고 시간대, 누적 백분위 시간, 이동 평균, 이벤트 간 비교를 벡터 연산으로 계산
+- 데이터가 없는 시간대는 0
+
+Django 설정 없이 import 가능 (models에서 사용)
+"""
+
+import numpy as np
+
+
+HOURS = 24
+SERIES_DTYPE = np.dtype('<u4')
+EMPTY_SERIES = bytes(HOURS * SERIES_DTYPE.itemsize)
+
+
+def encode_hourly(hourly_visitors):
+    """
+    {"시": 방문객 수} -> 고정 길이 바이트열
+
+    0~23 범위 밖이거나 숫자가 아닌 키는 무시, 음수는 0으로 저장
+    """
+    series = np.zeros(HOURS, dtype=SERIES_DTYPE)
+    for hour, count in (hourly_visitors or {}).items():
+        try:
+            hour, count = int(hour), int(count)
+        except (TypeError, ValueError):
+            continue
+        if 0 <= hour < HOURS:
+            series[hour] = max(count, 0)
+    return series.tobytes()
+
+
+def decode_hourly(data):
+    """바이트열 -> 길이 24 배열 (비어 있으면 0 배열)"""
+    if not data:
+        return np.zeros(HOURS, dtype=np.int64)
+    return np.frombuffer(bytes(data), dtype=SERIES_DTYPE).astype(np.int64)
+
+
+def active_hours(series):
+    """
+    방문객이 있는 첫 시간~마지막 시간 [(시, 방문객 수)] (리포트 표 출력용)
+    """
+    nonzero = np.flatnonzero(series)
+    if not nonzero.size:
+        return []
+    hours = range(nonzero[0], nonzero[-1] + 1)
+    return [(hour, int(series[hour])) for hour in hours]
+
+
+def moving_average(values, window=3):
+    """
+    마지막 축(시간) 기준 이동 평균 (..., 24 - window + 1)
+
+    i번째 값은 i시~(i + window - 1)시 평균
+    """
+    window = min(max(int(window), 1), HOURS)
+    values = np.asarray(values, dtype=float)
+    padding = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    cumulative = np.cumsum(np.pad(values, padding), axis=-1)
+    return (cumulative[..., window:] - cumulative[..., :-window]) / window
+
+
+class HourlyMatrix:
+    """
+    성과 데이터 여러 건의 시간대별 방문객 행렬
+
+    Attributes:
+        ids: 성과 데이터 id 배열 (n,)
+        counts: 방문객 수 행렬 (n, 24)
+    """
+
+    def __init__(self, ids, series_list):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        blob = b''.join(bytes(series) if series else EMPTY_SERIES for series in series_list)
+        self.counts = np.frombuffer(blob, dtype=SERIES_DTYPE).reshape(-1, HOURS).astype(np.int64)
+
+    @classmethod
+    def from_queryset(cls, queryset):
+        """AnalyticsData queryset -> 행렬 (id/hourly_series 두 컬럼만 조회)"""
+        rows = list(queryset.values_list('id', 'hourly_series'))
+        return cls([row[0] for row in rows], [row[1] for row in rows])
+
+    def __len__(self):
+        return len(self.ids)
+
+    def totals(self):
+        """이벤트별 시간대 방문객 합계 (n,)"""
+        return self.counts.sum(axis=1)
+
+    def peak_hours(self):
+        """이벤트별 방문객이 가장 많은 시간 (n,), 데이터가 없으면 -1"""
+        peaks = self.counts.argmax(axis=1)
+        return np.where(self.totals() > 0, peaks, -1)
+
+    def peak_counts(self):
+        return self.counts.max(axis=1, initial=0)
+
+    def profiles(self):
+        """이벤트별 시간대 비율 (행 합계 1, 데이터가 없는 행은 0)"""
+        totals = self.totals()[:, None]
+        return np.divide(self.counts, totals, out=np.zeros(self.counts.shape), where=totals > 0)
+
+    def percentile_hours(self, q):
+        """
+        이벤트별 누적 방문객이 q%에 도달한 시간 (n,), 데이터가 없으면 -1
+
+        예: q=50 -> 하루 방문객의 절반이 들어온 시각
+        """
+        cumulative = np.cumsum(self.counts, axis=1)
+        totals = cumulative[:, -1]
+        hours = (cumulative * 100 >= totals[:, None] * q).argmax(axis=1)
+        return np.where(totals > 0, hours, -1)
+
+    def hourly_percentiles(self, q):
+        """
+        시간대별 이벤트 간 방문객 백분위 (len(q), 24) - 비교 구간(예: 25/50/75%) 계산용
+        """
+        if not len(self):
+            return np.zeros((len(np.atleast_1d(q)), HOURS))
+        return np.atleast_2d(np.percentile(self.counts, q, axis=0))
+
+    def moving_average(self, window=3):
+        """이벤트별 이동 평균 (n, 24 - window + 1)"""
+        return moving_average(self.counts, window)
+
+    def mean_counts(self):
+        """시간대별 이벤트 평균 방문객 (24,)"""
+        return self.counts.mean(axis=0) if len(self) else np.zeros(HOURS)
+
+    def mean_profile(self):
+        """데이터가 있는 이벤트들의 평균 시간대 비율 (24,)"""
+        profiles = self.profiles()[self.totals() > 0]
+        return profiles.mean(axis=0) if len(profiles) else np.zeros(HOURS)
+
+    def similarity(self, profile):
+        """
+        이벤트별 시간대 분포와 기준 분포의 코사인 유사도 (n,), 데이터가 없으면 0
+        """
+        profile = np.asarray(profile, dtype=float)
+        norms = np.linalg.norm(self.counts, axis=1) * np.linalg.norm(profile)
+        return np.divide(self.counts @ profile, norms, out=np.zeros(len(self)), where=norms > 0)
+
+    def compare(self, other):
+        """
+        다른 이벤트 묶음과 평균 시간대 분포 비교
+
+        Returns:
+            dict: difference (시간대별 비율 차이, 24), similarity (코사인 유사도)
+        """
+        mine, theirs = self.mean_profile(), other.mean_profile()
+        norm = np.linalg.norm(mine) * np.linalg.norm(theirs)
+        return {
+            'difference': mine - theirs,
+            'similarity': float(mine @ theirs / norm) if norm else 0.0,
+        }
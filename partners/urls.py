@@ -6,6 +6,8 @@ router = DefaultRouter()
 router.register('partners', views.PartnerViewSet, basename='partner')
 router.register('applications', views.ApplicationViewSet, basename='application')
 router.register('messages', views.MessageViewSet, basename='message')
+router.register('conversations', views.ConversationViewSet, basename='conversation')
+router.register('announcements', views.AnnouncementViewSet, basename='announcement')
 router.register('analytics', views.AnalyticsViewSet, basename='analytics')
 router.register('uploads', views.ImageUploadViewSet, basename='upload')
 router.register('notifications', views.NotificationViewSet, basename='notification')
@@ -13,8 +15,11 @@ router.register('drafts', views.ApplicationDraftViewSet, basename='draft')
 router.register('bookmarks', views.FestivalBookmarkViewSet, basename='bookmark')
 
 urlpatterns = [
+    # 라우터의 notifications/<pk>/ 보다 먼저 매칭되도록 위에 둠
+    path('notifications/stream/', views.NotificationStreamView.as_view(), name='notification-stream'),
     path('', include(router.urls)),
     path('signup/', views.PartnerSignupView.as_view(), name='partner-signup'),
     path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
+    path('badges/', views.BadgeView.as_view(), name='badges'),
     path('festivals/', views.PartnerFestivalListView.as_view(), name='festivals'),
 ]
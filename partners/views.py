@@ -1,23 +1,53 @@
-from rest_framework import viewsets, status, permissions
+from rest_framework import mixins, viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.db.models import Q, Sum, Avg
-from django.http import HttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from django.utils.http import parse_etags
+from django.views import View
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+import asyncio
+import base64
+import heapq
+import json
+import os
 import random
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
-from .models import Partner, Application, Message, AnalyticsData, ImageUpload, Notification, ApplicationDraft, FestivalBookmark
+from itertools import islice
+from .models import Partner, Application, Conversation, Message, Announcement, AnalyticsData, ImageUpload, Notification, ApplicationDraft, FestivalBookmark, UnreadCounter
+from . import streaming
+from .badges import unread_badges
+from .conversations import mark_conversation_read
+from .reports import (
+    current_report, iter_reports_zip, ready_report_files, report_filename, request_report, stream_reports_zip
+)
+from .rollups import analytics_summary
+from .samples import sample_analytics_ids, sample_summary
+from .timeseries import HOURS, HourlyMatrix, moving_average
+from .dashboard import get_dashboard
+from .exports import CSVRenderer, applications_xlsx_file, stream_applications_csv, stream_file
+from .stats import application_stats
 from events.models import Event
 
 
+@transaction.atomic
 def generate_mock_data_for_partner(partner):
     """
-    새 파트너에게 mock 데이터 생성
+    새 파트너에게 mock 데이터 생성 (한 트랜잭션 - 알림 outbox 기록 포함)
     - 2-3개의 완료된 지원서
     - 각 지원서에 대한 성과 데이터
     """
@@ -38,15 +68,12 @@ def generate_mock_data_for_partner(partner):
     booth_types = ['food', 'goods', 'experience', 'promotion']
     booth_sizes = ['3x3', '6x3']
 
-    total_applications = 0
-    total_approvals = 0
-
     for event in selected_events:
         # 이미 이 이벤트에 지원서가 있으면 건너뛰기
         if Application.objects.filter(partner=partner, event=event).exists():
             continue
 
-        # 지원서 생성 (완료 상태)
+        # 지원서 생성 (완료 상태) + 통계 카운터 원자적 증가 (승인 수에 포함되는 상태)
         application = Application.objects.create(
             partner=partner,
             event=event,
@@ -63,9 +90,7 @@ def generate_mock_data_for_partner(partner):
             booth_location=f'{random.choice(["A", "B", "C"])}-{random.randint(1, 20)}',
             reviewed_at=event.start_date - timedelta(days=random.randint(7, 14)),
         )
-
-        total_applications += 1
-        total_approvals += 1
+        partner.adjust_counters(applications=1, approvals=1)
 
         # 성과 데이터 생성
         visitor_count = random.randint(500, 1500)
@@ -119,11 +144,9 @@ def generate_mock_data_for_partner(partner):
             sentiment_score=random.randint(70, 95),
         )
 
-    # 파트너 통계 업데이트
-    partner.total_applications = total_applications
-    partner.total_approvals = total_approvals
+    # 파트너 평점 업데이트 (카운터는 위에서 원자적으로 반영했으므로 다시 쓰지 않음)
     partner.average_rating = round(random.uniform(4.0, 4.7), 1)
-    partner.save()
+    partner.save(update_fields=['average_rating', 'updated_at'])
 
 
 from .serializers import (
@@ -133,14 +156,18 @@ from .serializers import (
     ApplicationSerializer,
     ApplicationCreateSerializer,
     MessageSerializer,
+    ConversationSerializer,
+    AnnouncementSerializer,
     AnalyticsDataSerializer,
+    AnalyticsReportSerializer,
     ImageUploadSerializer,
     NotificationSerializer,
+    NotificationIdsSerializer,
+    NotificationPurgeSerializer,
     ApplicationDraftSerializer,
     FestivalBookmarkSerializer
 )
 from .utils import resize_image
-from .pdf_generator import generate_analytics_pdf
 
 
 class IsPartner(permissions.BasePermission):
@@ -223,6 +250,11 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             partner__user=self.request.user
         ).select_related('partner', 'event')
 
+    @transaction.atomic
+    def perform_update(self, serializer):
+        # 상태 변경 알림(outbox)이 지원서 변경과 같은 트랜잭션에 기록되도록
+        serializer.save()
+
     @action(detail=True, methods=['post'])
     def approve(self, request, pk=None):
         """지원서 승인"""
@@ -245,81 +277,40 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     def stats(self, request):
         """지원 내역 통계"""
         partner = request.user.partner_profile
-        applications = partner.applications.all()
-
-        stats = {
-            'total': applications.count(),
-            'pending': applications.filter(status='pending').count(),
-            'approved': applications.filter(status='approved').count(),
-            'rejected': applications.filter(status='rejected').count(),
-            'completed': applications.filter(status='completed').count(),
-        }
-        return Response(stats)
-
-    @action(detail=False, methods=['get'], url_path='export-excel')
+        return Response(application_stats(partner.id))
+
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='export-excel',
+        renderer_classes=[*api_settings.DEFAULT_RENDERER_CLASSES, CSVRenderer]
+    )
     def export_excel(self, request):
-        """지원서 엑셀 다운로드"""
+        """
+        지원서 엑셀 다운로드 (partners.exports)
+        - ?format=csv: CSV로 바로 스트리밍 (행을 읽는 대로 전달)
+        - 기본: write_only 워크북을 임시 파일에 만든 뒤 청크 단위로 전달
+        """
         partner = request.user.partner_profile
-        applications = self.get_queryset().select_related('event')
-
-        # 워크북 생성
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Applications"
-
-        # 헤더 스타일
-        header_fill = PatternFill(start_color="4CAF50", end_color="4CAF50", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF")
-        header_alignment = Alignment(horizontal="center", vertical="center")
-
-        # 헤더 작성
-        headers = [
-            'ID', 'Event Name', 'Status', 'Booth Type', 'Booth Size',
-            'Products', 'Price Range', 'Applied Date', 'Reviewed Date',
-            'Participation Fee', 'Payment Status', 'Booth Location'
-        ]
+        applications = self.get_queryset()
+        filename = f"applications_{partner.id}_{datetime.now().strftime('%Y%m%d')}"
 
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_num, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-
-        # 데이터 작성
-        for row_num, app in enumerate(applications, 2):
-            ws.cell(row=row_num, column=1, value=app.id)
-            ws.cell(row=row_num, column=2, value=app.event.name)
-            ws.cell(row=row_num, column=3, value=app.get_status_display())
-            ws.cell(row=row_num, column=4, value=app.get_booth_type_display())
-            ws.cell(row=row_num, column=5, value=app.get_booth_size_display())
-            ws.cell(row=row_num, column=6, value=app.products)
-            ws.cell(row=row_num, column=7, value=app.price_range)
-            ws.cell(row=row_num, column=8, value=app.applied_at.strftime('%Y-%m-%d'))
-            ws.cell(row=row_num, column=9, value=app.reviewed_at.strftime('%Y-%m-%d') if app.reviewed_at else '')
-            ws.cell(row=row_num, column=10, value=float(app.participation_fee))
-            ws.cell(row=row_num, column=11, value=app.get_payment_status_display())
-            ws.cell(row=row_num, column=12, value=app.booth_location)
-
-        # 열 너비 자동 조정
-        for col_num in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col_num)].width = 15
-
-        # 파일 생성
-        from io import BytesIO
-        excel_buffer = BytesIO()
-        wb.save(excel_buffer)
-        excel_buffer.seek(0)
-
-        # 파일명 생성
-        filename = f"applications_{partner.id}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-
-        # HTTP Response
-        response = HttpResponse(
-            excel_buffer.getvalue(),
+        if request.query_params.get('format') == 'csv':
+            response = StreamingHttpResponse(
+                stream_applications_csv(applications),
+                content_type='text/csv; charset=utf-8'
+            )
+            response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+            response['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 방지
+            return response
+
+        excel_file = applications_xlsx_file(applications)
+        response = StreamingHttpResponse(
+            stream_file(excel_file),
             content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
         )
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
-
+        response['Content-Length'] = os.fstat(excel_file.fileno()).st_size
+        response['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
         return response
 
 
@@ -333,9 +324,13 @@ class MessageViewSet(viewsets.ModelViewSet):
         user = self.request.user
         return Message.objects.filter(
             Q(sender=user) | Q(receiver=user)
-        ).select_related('sender', 'receiver', 'application')
+        ).select_related(
+            'sender', 'receiver', 'application', 'application__event', 'application__partner'
+        )
 
+    @transaction.atomic
     def perform_create(self, serializer):
+        # 새 메시지 알림(outbox)/카운터/스레드 갱신이 메시지와 같은 트랜잭션에 기록되도록
         serializer.save(sender=self.request.user)
 
     @action(detail=True, methods=['post'])
@@ -348,26 +343,224 @@ class MessageViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def inbox(self, request):
-        """받은편지함"""
+        """받은편지함 (1:1 메시지 + 지원한 축제의 공지, 최신순, keyset 페이지네이션)"""
         messages = self.get_queryset().filter(receiver=request.user)
-        serializer = self.get_serializer(messages, many=True)
-        return Response(serializer.data)
+        announcements = Announcement.objects.for_user(
+            request.user.id
+        ).with_read_at(request.user.id).select_related('sender', 'event')
+
+        paginator = InboxPagination()
+        page = paginator.paginate_sources(
+            {'message': messages, 'announcement': announcements}, request
+        )
+        context = self.get_serializer_context()
+        data = [
+            (MessageSerializer if source == 'message' else AnnouncementSerializer)(
+                item, context=context
+            ).data
+            for source, item in page
+        ]
+        return paginator.get_paginated_response(data)
 
     @action(detail=False, methods=['get'])
     def sent(self, request):
-        """보낸편지함"""
+        """보낸편지함 (keyset 페이지네이션)"""
         messages = self.get_queryset().filter(sender=request.user)
-        serializer = self.get_serializer(messages, many=True)
-        return Response(serializer.data)
+        paginator = MessageListPagination()
+        page = paginator.paginate_queryset(messages, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
-        """읽지 않은 메시지 개수"""
-        count = self.get_queryset().filter(
-            receiver=request.user,
-            read=False
-        ).count()
-        return Response({'unread_count': count})
+        """읽지 않은 메시지 개수 (1:1 메시지 카운터 + 읽지 않은 공지)"""
+        return Response({'unread_count': unread_badges(request.user.id)['messages']})
+
+
+class MessageListPagination(CursorPagination):
+    """보낸편지함 keyset 페이지네이션 (최신 메시지부터)"""
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = ('-created_at', '-id')
+
+
+class InboxPagination(BasePagination):
+    """
+    받은편지함 keyset 페이지네이션 (1:1 메시지 + 공지를 created_at 역순으로 병합)
+    - 소스마다 마지막으로 보낸 (created_at, id) 이후만 page_size + 1개 조회 -> 병합 후 page_size개
+    - 커서에 소스별 위치를 담음 (CursorPagination과 같은 next/previous/results 형식, 앞으로만 이동)
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '유효하지 않은 커서입니다.'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def decode_cursor(self, request):
+        """커서 -> {소스 이름: (created_at, id)}"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return {}
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            positions = {}
+            for source, (created_at, pk) in raw.items():
+                created_at = parse_datetime(created_at)
+                if created_at is None:
+                    raise ValueError(created_at)
+                positions[source] = (created_at, int(pk))
+            return positions
+        except (TypeError, ValueError, AttributeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, positions):
+        raw = json.dumps({
+            source: [created_at.isoformat(), pk] for source, (created_at, pk) in positions.items()
+        })
+        encoded = base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
+
+    def paginate_sources(self, sources, request):
+        """
+        Args:
+            sources: {소스 이름: queryset}
+
+        Returns:
+            [(소스 이름, 항목)] - 이번 페이지 (created_at 역순)
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        positions = self.decode_cursor(request)
+
+        streams = []
+        for source, queryset in sources.items():
+            if source in positions:
+                created_at, pk = positions[source]
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+                )
+            items = queryset.order_by('-created_at', '-pk')[:page_size + 1]
+            streams.append([(source, item) for item in items])
+
+        merged = list(islice(
+            heapq.merge(*streams, key=lambda entry: (entry[1].created_at, entry[1].pk), reverse=True),
+            page_size + 1,
+        ))
+        page = merged[:page_size]
+
+        self.next_link = None
+        if len(merged) > page_size:
+            for source, item in page:
+                positions[source] = (item.created_at, item.pk)
+            self.next_link = self.encode_cursor(positions)
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.next_link,
+            'previous': None,
+            'results': data,
+        })
+
+
+class ConversationPagination(CursorPagination):
+    """대화 스레드 목록 keyset 페이지네이션 (최근 메시지 순)"""
+    page_size = 30
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-last_message_at', '-id')
+
+
+class ThreadMessagePagination(CursorPagination):
+    """스레드 메시지 keyset 페이지네이션 (최신 메시지부터)"""
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+    ordering = '-id'
+
+
+class ConversationViewSet(viewsets.ReadOnlyModelViewSet):
+    """대화 스레드 ViewSet (참여한 스레드만)"""
+    queryset = Conversation.objects.all()
+    serializer_class = ConversationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ConversationPagination
+
+    def get_queryset(self):
+        user = self.request.user
+        return Conversation.objects.filter(
+            Q(participant_low=user) | Q(participant_high=user),
+            last_message_at__isnull=False,
+        ).select_related(
+            'participant_low', 'participant_high', 'last_message',
+            'application', 'application__event', 'application__partner'
+        )
+
+    @action(detail=True, methods=['get'])
+    def messages(self, request, pk=None):
+        """스레드 메시지 목록 (keyset 페이지네이션)"""
+        conversation = self.get_object()
+        messages = conversation.messages.select_related(
+            'sender', 'receiver', 'application', 'application__event', 'application__partner'
+        )
+        paginator = ThreadMessagePagination()
+        page = paginator.paginate_queryset(messages, request, view=self)
+        serializer = MessageSerializer(page, many=True, context=self.get_serializer_context())
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=True, methods=['post'])
+    def mark_read(self, request, pk=None):
+        """스레드에서 받은 메시지 모두 읽음 처리"""
+        count = mark_conversation_read(self.get_object(), request.user.id)
+        return Response({
+            'message': f'{count}개의 메시지를 읽음 처리했습니다.',
+            'count': count
+        })
+
+
+class AnnouncementViewSet(mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet):
+    """축제 공지 ViewSet (작성은 관리자만, 사업자는 대상 공지만 조회)"""
+    queryset = Announcement.objects.all()
+    serializer_class = AnnouncementSerializer
+
+    def get_permissions(self):
+        if self.action == 'create':
+            return [permissions.IsAdminUser()]
+        return [permissions.IsAuthenticated()]
+
+    def get_queryset(self):
+        user = self.request.user
+        announcements = Announcement.objects.all() if user.is_staff else Announcement.objects.for_user(user.id)
+        return announcements.with_read_at(user.id).select_related('sender', 'event')
+
+    def perform_create(self, serializer):
+        serializer.save(sender=self.request.user)
+
+    @action(detail=True, methods=['post'])
+    def mark_read(self, request, pk=None):
+        """공지 읽음 처리"""
+        announcement = self.get_object()
+        Announcement.objects.filter(pk=announcement.pk).mark_read(request.user.id)
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def mark_all_read(self, request):
+        """받은 공지 모두 읽음 처리"""
+        count = Announcement.objects.for_user(request.user.id).mark_read(request.user.id)
+        return Response({
+            'message': f'{count}개의 공지를 읽음 처리했습니다.',
+            'count': count
+        })
 
 
 class AnalyticsViewSet(viewsets.ReadOnlyModelViewSet):
@@ -379,7 +572,7 @@ class AnalyticsViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         """
         현재 파트너의 성과 데이터를 반환
-        데이터가 없으면 다른 파트너의 데이터를 랜덤하게 반환 (mock data)
+        데이터가 없으면 샘플 풀에서 사업자별로 고정된 다른 파트너의 데이터를 반환 (mock data)
         """
         try:
             partner = self.request.user.partner_profile
@@ -395,76 +588,162 @@ class AnalyticsViewSet(viewsets.ReadOnlyModelViewSet):
         if own_data.exists():
             return own_data
 
-        # 데이터가 없으면 다른 파트너의 데이터를 랜덤하게 가져옴 (mock data)
+        # 데이터가 없으면 샘플 풀에서 사업자별로 고정된 데이터를 가져옴 (mock data)
         # 최대 5개
-        mock_data = AnalyticsData.objects.exclude(
-            partner=partner
-        ).select_related('partner', 'event', 'application').order_by('?')[:5]
+        return AnalyticsData.objects.filter(
+            id__in=sample_analytics_ids(partner.id)
+        ).select_related('partner', 'event', 'application').order_by('id')
 
-        return mock_data
+    def get_permissions(self):
+        # 전체 다운로드는 주최측(관리자)도 축제 단위로 사용
+        if self.action == 'export_all':
+            return [(IsPartner | permissions.IsAdminUser)()]
+        return super().get_permissions()
+
+    @action(detail=False, methods=['get'], url_path='export-all')
+    def export_all(self, request):
+        """
+        성과 리포트 전체를 ZIP 하나로 다운로드 (partners.reports.stream_reports_zip)
+        - 사업자: 자기 성과 데이터 (없으면 샘플 데이터), ?event=<id>로 축제 지정 가능
+        - 관리자(주최측): ?event=<id> 축제에 참여한 모든 사업자의 성과 데이터
+        - 리포트가 만들어지는 대로 응답에 바로 씀
+          (ASGI는 async generator, WSGI는 sync iterator - WSGI는 async iterator를 전부 읽은 뒤 보냄)
+        """
+        event_id = request.query_params.get('event')
+        if event_id is not None and not event_id.isdigit():
+            return Response({'error': 'event는 축제 id여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.user.user_type == 'partner':
+            queryset = self.get_queryset()
+        elif event_id is not None:
+            queryset = AnalyticsData.objects.select_related('partner', 'event')
+        else:
+            return Response({'error': '축제를 지정해 주세요. (?event=<id>)'}, status=status.HTTP_400_BAD_REQUEST)
+        if event_id is not None:
+            queryset = queryset.filter(event_id=event_id)
+
+        analytics_list = list(queryset.order_by('id'))
+        if not analytics_list:
+            return Response({'error': '내보낼 성과 데이터가 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+        stream = stream_reports_zip if isinstance(request._request, ASGIRequest) else iter_reports_zip
+        response = StreamingHttpResponse(
+            stream(
+                analytics_list,
+                ready_report_files(analytics_list),
+                workers=settings.ANALYTICS_EXPORT_WORKERS
+            ),
+            content_type='application/zip'
+        )
+        response['Content-Disposition'] = f'attachment; filename="analytics_reports_{date.today().strftime("%Y%m%d")}.zip"'
+        response['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 방지
+        return response
 
     @action(detail=True, methods=['get'], url_path='export-pdf')
     def export_pdf(self, request, pk=None):
-        """PDF 리포트 다운로드"""
+        """
+        PDF 리포트 다운로드 (partners.reports)
+        - 현재 데이터/템플릿으로 생성된 파일이 있으면 그대로 전달 (ETag, If-None-Match 일치 시 304)
+        - 없으면 생성 대기열에 넣고 202 + 상태 조회 URL 반환 (생성은 process_report_queue 워커)
+        """
         analytics = self.get_object()
-        partner_name = analytics.partner.brand_name
-        event_name = analytics.event.name
+        report = request_report(analytics)
 
-        # PDF 생성
-        pdf_buffer = generate_analytics_pdf(analytics, partner_name, event_name)
+        if report.status != 'ready':
+            data = AnalyticsReportSerializer(report, context={'request': request}).data
+            return Response(data, status=status.HTTP_202_ACCEPTED, headers={'Location': data['status_url']})
 
-        # 파일명 생성
-        filename = f"analytics_{analytics.partner.id}_{analytics.event.id}_{analytics.generated_at.strftime('%Y%m%d')}.pdf"
+        etag = f'"{report.etag}"'
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(
+                report.file.open('rb'),
+                as_attachment=True,
+                filename=report_filename(analytics),
+                content_type='application/pdf'
+            )
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
 
-        # HTTP Response
-        response = HttpResponse(pdf_buffer.getvalue(), content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    @action(detail=True, methods=['get'], url_path='export-pdf/status')
+    def export_pdf_status(self, request, pk=None):
+        """PDF 리포트 생성 상태 (export-pdf 요청 후 ready가 될 때까지 폴링)"""
+        report = current_report(self.get_object())
+        if report is None:
+            return Response(
+                {'detail': '요청된 리포트가 없습니다. export-pdf를 먼저 요청해 주세요.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(AnalyticsReportSerializer(report, context={'request': request}).data)
 
-        return response
+    @action(detail=False, methods=['get'])
+    def hourly(self, request):
+        """
+        이벤트별 시간대 방문객 비교 (partners.timeseries)
+        - events: 이벤트별 최고 시간대, 방문객 절반이 들어온 시각, 평균 분포와의 유사도
+        - hourly: 시간대별 이벤트 간 25/50/75% 구간, 평균 분포
+        - moving_average: 평균 방문객의 이동 평균 (?window=3)
+        """
+        try:
+            window = min(max(int(request.query_params.get('window', 3)), 1), HOURS)
+        except ValueError:
+            window = 3
+
+        rows = list(self.get_queryset().order_by('id').values_list(
+            'id', 'event_id', 'event__name', 'hourly_series'
+        ))
+        matrix = HourlyMatrix([row[0] for row in rows], [row[3] for row in rows])
+        mean_profile = matrix.mean_profile()
+        totals = matrix.totals()
+        peak_hours = matrix.peak_hours()
+        half_hours = matrix.percentile_hours(50)
+        similarity = matrix.similarity(mean_profile)
+        bands = matrix.hourly_percentiles([25, 50, 75])
+        moving = moving_average(matrix.mean_counts(), window)
+
+        return Response({
+            'events': [
+                {
+                    'id': analytics_id,
+                    'event': {'id': event_id, 'name': event_name},
+                    'total_visitors': int(totals[index]),
+                    'peak_hour': int(peak_hours[index]),
+                    'half_visitors_hour': int(half_hours[index]),
+                    'similarity': round(float(similarity[index]), 3),
+                }
+                for index, (analytics_id, event_id, event_name, _) in enumerate(rows)
+            ],
+            'hourly': [
+                {
+                    'hour': hour,
+                    'p25': float(bands[0][hour]),
+                    'median': float(bands[1][hour]),
+                    'p75': float(bands[2][hour]),
+                    'share': round(float(mean_profile[hour]), 4),
+                }
+                for hour in range(HOURS)
+            ],
+            'moving_average': {
+                'window': window,
+                'values': [round(float(value), 1) for value in moving],
+            },
+        })
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
-        """전체 성과 데이터 요약"""
+        """전체 성과 데이터 요약 (미리 계산된 요약 행 조회)"""
         try:
             partner = request.user.partner_profile
         except Partner.DoesNotExist:
             return Response({'error': '파트너 프로필이 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
 
-        # 현재 파트너의 실제 데이터 확인
-        own_data = AnalyticsData.objects.filter(partner=partner)
-        is_mock_data = not own_data.exists()
-
-        # get_queryset()이 mock data를 반환할 수 있음
-        analytics_qs = self.get_queryset()
-
-        # 집계 데이터
-        summary_data = analytics_qs.aggregate(
-            total_visitors=Sum('visitor_count'),
-            total_sales=Sum('estimated_sales'),
-            avg_rating=Avg('average_rating'),
-            total_reviews=Sum('review_count'),
-            avg_sentiment=Avg('sentiment_score'),
-        )
-
-        # 이벤트 수
-        summary_data['total_events'] = analytics_qs.count()
-
-        # mock data 여부 표시
-        summary_data['is_sample_data'] = is_mock_data
-
-        # 최고 성과 이벤트
-        best_event = analytics_qs.order_by('-visitor_count').first()
-        if best_event:
-            summary_data['best_event'] = {
-                'id': best_event.event.id,
-                'name': best_event.event.name,
-                'visitor_count': best_event.visitor_count,
-                'sales': float(best_event.estimated_sales),
-            }
-
-        # 최근 3개 이벤트
-        recent_analytics = analytics_qs.order_by('-generated_at')[:3]
-        summary_data['recent_events'] = AnalyticsDataSerializer(recent_analytics, many=True).data
+        summary_data = analytics_summary(partner.id)
+        if summary_data is None:
+            # 자기 데이터가 없으면 샘플 데이터 요약 (mock data, 캐시)
+            summary_data = sample_summary(partner.id)
 
         return Response(summary_data)
 
@@ -474,76 +753,113 @@ class DashboardView(APIView):
     permission_classes = [IsPartner]
 
     def get(self, request):
-        try:
-            partner = request.user.partner_profile
-        except Partner.DoesNotExist:
+        # 미리 계산된 스냅샷 조회 (partners.dashboard)
+        data = get_dashboard(request.user)
+        if data is None:
             return Response(
                 {'detail': '사업자 프로필이 없습니다.'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 통계
-        applications = partner.applications.all()
-        stats = {
-            'pending': applications.filter(status='pending').count(),
-            'approved': applications.filter(status='approved').count(),
-            'completed': applications.filter(status='completed').count(),
-            'total': applications.count(),
-        }
+        return Response(data)
 
-        # 최근 알림
-        notifications = []
-        recent_messages = Message.objects.filter(
-            receiver=request.user,
-            read=False
-        ).order_by('-created_at')[:5]
-
-        for msg in recent_messages:
-            notifications.append({
-                'id': msg.id,
-                'type': 'message',
-                'message': msg.subject,
-                'created_at': msg.created_at,
-            })
-
-        # 최근 승인/거절된 지원서
-        recent_applications = applications.filter(
-            status__in=['approved', 'rejected']
-        ).order_by('-reviewed_at')[:3]
-
-        for app in recent_applications:
-            notifications.append({
-                'id': app.id,
-                'type': 'approval' if app.status == 'approved' else 'rejection',
-                'message': f"{app.event.name} 지원이 {'승인' if app.status == 'approved' else '거절'}되었습니다.",
-                'created_at': app.reviewed_at,
-            })
-
-        # 다가오는 일정
-        upcoming_events = []
-        approved_apps = applications.filter(
-            status='approved',
-            event__start_date__gte=date.today()
-        ).select_related('event').order_by('event__start_date')[:5]
-
-        for app in approved_apps:
-            d_day = (app.event.start_date - date.today()).days
-            upcoming_events.append({
-                'id': app.event.id,
-                'name': app.event.name,
-                'date': app.event.start_date,
-                'd_day': d_day,
-                'location': app.event.location,
-                'status': app.status,
-            })
-
-        data = {
-            'stats': stats,
-            'notifications': sorted(notifications, key=lambda x: x['created_at'], reverse=True)[:5],
-            'upcoming_events': upcoming_events,
-        }
 
-        return Response(data)
+class BadgeView(APIView):
+    """읽지 않은 메시지/알림 수 (헤더 배지 폴링용, 한 번에 조회)"""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response(unread_badges(request.user.id))
+
+
+def _stream_user_id(request):
+    """
+    스트림 요청의 사용자 id (Authorization 헤더의 JWT 또는 ?ticket=)
+    EventSource는 헤더를 보낼 수 없으므로 일회용 스트림 티켓을 쿼리 파라미터로 받음
+    (JWT를 URL에 넣으면 접근 로그에 남음)
+    """
+    authenticator = JWTAuthentication()
+    header = authenticator.get_header(request)
+    if not header:
+        ticket = request.GET.get('ticket')
+        return streaming.redeem_ticket(ticket) if ticket else None
+    raw_token = authenticator.get_raw_token(header)
+    if not raw_token:
+        return None
+    try:
+        return authenticator.get_user(authenticator.get_validated_token(raw_token)).id
+    except (InvalidToken, AuthenticationFailed):
+        return None
+
+
+class NotificationStreamView(View):
+    """
+    새 알림/받은 메시지 실시간 전달 (unread/unread_count/inbox 폴링 대체)
+    - 기본: Server-Sent Events (Last-Event-ID로 이어받기, 주기적 heartbeat)
+    - ?mode=poll: long-poll (새 데이터가 생기거나 시간 초과까지 대기 후 JSON 응답)
+    - 연결은 NOTIFICATION_STREAM_MAX_DURATION초 후 닫히고 클라이언트가 자동 재연결
+    - 인증: Authorization 헤더 또는 ?ticket= (POST notifications/stream-ticket/으로 발급한 일회용 티켓)
+    """
+
+    async def get(self, request):
+        user_id = await sync_to_async(_stream_user_id)(request)
+        if user_id is None:
+            return JsonResponse(
+                {'detail': '인증 정보가 없거나 유효하지 않습니다.'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        cursor = streaming.parse_cursor(
+            request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        )
+        if cursor is None:
+            cursor = await sync_to_async(streaming.latest_cursor)(user_id)
+
+        if request.GET.get('mode') == 'poll':
+            return await self._long_poll(user_id, cursor)
+
+        response = StreamingHttpResponse(
+            self._event_stream(user_id, cursor),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 방지
+        return response
+
+    async def _long_poll(self, user_id, cursor):
+        fetch_events = sync_to_async(streaming.fetch_events)
+        events, cursor = await fetch_events(user_id, cursor)
+        if not events:
+            await streaming.get_broker().wait(user_id, settings.NOTIFICATION_STREAM_LONG_POLL_TIMEOUT)
+            events, cursor = await fetch_events(user_id, cursor)
+        return JsonResponse({
+            'events': [
+                {'id': event_id, 'event': event, 'data': data}
+                for event, data, event_id in events
+            ],
+            'last_event_id': streaming.format_cursor(cursor),
+        })
+
+    async def _event_stream(self, user_id, cursor):
+        broker = streaming.get_broker()
+        fetch_events = sync_to_async(streaming.fetch_events)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.NOTIFICATION_STREAM_MAX_DURATION
+
+        yield f'retry: {settings.NOTIFICATION_STREAM_RETRY_MS}\n\n'
+        while True:
+            events, cursor = await fetch_events(user_id, cursor)
+            for event, data, event_id in events:
+                yield streaming.format_sse(event, data, event_id)
+            if events:
+                continue  # 남은 데이터가 있으면 기다리지 않고 이어서 전송
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            # 신호가 없어도 heartbeat마다 한 번 조회 (놓친 신호 보정)
+            if not await broker.wait(user_id, min(settings.NOTIFICATION_STREAM_HEARTBEAT, remaining)):
+                yield ': heartbeat\n\n'
 
 
 class PartnerFestivalListView(APIView):
@@ -709,23 +1025,75 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         serializer = self.get_serializer(notification)
         return Response(serializer.data)
 
+    def _user_notifications(self):
+        """일괄 처리용 현재 사용자 알림 (select_related 없이)"""
+        return Notification.objects.filter(user=self.request.user)
+
+    def _mark_read(self, notifications):
+        """읽음 처리 후 읽지 않은 알림 카운터 감소"""
+        count = notifications.mark_read()
+        UnreadCounter.bump(self.request.user.id, notifications=-count)
+        return count
+
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
-        """모든 알림 읽음 처리"""
-        notifications = self.get_queryset().filter(read=False)
-        count = notifications.count()
-        for notification in notifications:
-            notification.mark_as_read()
+        """모든 알림 읽음 처리 (UPDATE 한 번)"""
+        count = self._mark_read(self._user_notifications())
+        return Response({
+            'message': f'{count}개의 알림을 읽음 처리했습니다.',
+            'count': count
+        })
+
+    @action(detail=False, methods=['post'], url_path='by-type/(?P<notification_type>[^/.]+)/mark-read')
+    def mark_type_read(self, request, notification_type=None):
+        """타입별 알림 읽음 처리"""
+        count = self._mark_read(self._user_notifications().filter(
+            notification_type=notification_type
+        ))
+        return Response({
+            'message': f'{count}개의 알림을 읽음 처리했습니다.',
+            'count': count
+        })
+
+    @action(detail=False, methods=['post'], url_path='mark-read')
+    def mark_selected_read(self, request):
+        """선택한 알림 읽음 처리 (body: {"ids": [...]})"""
+        serializer = NotificationIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = self._mark_read(self._user_notifications().filter(
+            id__in=serializer.validated_data['ids']
+        ))
         return Response({
             'message': f'{count}개의 알림을 읽음 처리했습니다.',
             'count': count
         })
 
+    @action(detail=False, methods=['post'], url_path='stream-ticket')
+    def stream_ticket(self, request):
+        """
+        알림 스트림 연결용 일회용 티켓 발급
+        EventSource('/api/partners/notifications/stream/?ticket=...')로 사용, 재연결할 때마다 새로 발급
+        """
+        return Response({
+            'ticket': streaming.issue_ticket(request.user.id),
+            'expires_in': settings.NOTIFICATION_STREAM_TICKET_TTL,
+        })
+
+    @action(detail=False, methods=['post'], url_path='clear-read')
+    def clear_read(self, request):
+        """읽은 지 N일(기본 30일)이 지난 알림 삭제 (body: {"days": N})"""
+        serializer = NotificationPurgeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = self._user_notifications().purge_read(serializer.validated_data['days'])
+        return Response({
+            'message': f'{count}개의 알림을 삭제했습니다.',
+            'count': count
+        })
+
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
-        """읽지 않은 알림 개수"""
-        count = self.get_queryset().filter(read=False).count()
-        return Response({'unread_count': count})
+        """읽지 않은 알림 개수 (카운터 조회)"""
+        return Response({'unread_count': unread_badges(request.user.id)['notifications']})
 
     @action(detail=False, methods=['get'])
     def unread(self, request):
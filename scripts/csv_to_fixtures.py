@@ -1,11 +1,16 @@
 #!/usr/bin/env python
 """
 CSV 파일을 Django fixtures JSON으로 변환하는 스크립트
+- 행 단위로 읽고 바로 기록 (전체 목록을 메모리에 만들지 않음)
+- 출력 형식: compact JSON 배열(loaddata 호환) 또는 NDJSON
 
 사용법:
     python scripts/csv_to_fixtures.py
+    python scripts/csv_to_fixtures.py --input events.csv --output fixtures/events.ndjson --format ndjson
+    python manage.py load_events fixtures/events.ndjson  # 스트리밍 로더로 배치 저장
 """
 
+import argparse
 import csv
 import json
 from datetime import datetime, timedelta, timezone as dt_timezone
@@ -31,7 +36,61 @@ def excel_date_to_iso(excel_date):
         return str(excel_date)
 
 
-def csv_to_fixtures(csv_file_path, output_json_path, start_pk=1):
+def iter_fixtures(reader, start_pk, now):
+    """CSV 행을 Django fixtures 객체로 하나씩 변환"""
+    for idx, row in enumerate(reader, start=start_pk):
+        yield {
+            "model": "events.Event",
+            "pk": idx,
+            "fields": {
+                "name": row['title'].strip(),
+                "description": row['description'].strip(),
+                "category": row['category'].strip(),
+                "location": row['location'].strip(),
+                "address": row['address'].strip(),
+                "latitude": float(row['latitude']) if row['latitude'] else None,
+                "longitude": float(row['longitude']) if row['longitude'] else None,
+                "start_date": excel_date_to_iso(row['start_date']),
+                "end_date": excel_date_to_iso(row['end_date']),
+                "poster_image": row['poster_image'].strip(),
+                "website_url": row['website_url'].strip() if row['website_url'] else "",
+                "created_at": now,
+                "updated_at": now,
+            }
+        }
+
+
+def write_fixtures(fixtures, jsonfile, output_format='json'):
+    """
+    fixtures를 하나씩 파일에 기록
+
+    Args:
+        fixtures: fixture 객체 iterable
+        jsonfile: 쓰기용 파일 객체
+        output_format: 'json' (compact JSON 배열) 또는 'ndjson' (한 줄에 객체 하나)
+
+    Returns:
+        int: 기록한 객체 수
+    """
+    count = 0
+    if output_format == 'json':
+        jsonfile.write('[')
+
+    for fixture in fixtures:
+        line = json.dumps(fixture, ensure_ascii=False, separators=(',', ':'))
+        if output_format == 'json':
+            jsonfile.write(',\n' if count else '\n')
+            jsonfile.write(line)
+        else:
+            jsonfile.write(line + '\n')
+        count += 1
+
+    if output_format == 'json':
+        jsonfile.write('\n]\n')
+    return count
+
+
+def csv_to_fixtures(csv_file_path, output_json_path, start_pk=1, output_format='json'):
     """
     CSV 파일을 Django fixtures JSON으로 변환
 
@@ -39,55 +98,36 @@ def csv_to_fixtures(csv_file_path, output_json_path, start_pk=1):
         csv_file_path: 입력 CSV 파일 경로
         output_json_path: 출력 JSON 파일 경로
         start_pk: 시작 Primary Key (기본값: 1)
+        output_format: 'json' 또는 'ndjson' (기본값: 'json')
     """
-    fixtures = []
-
     # 현재 시간 (ISO 8601 형식, timezone-aware)
     now = datetime.now(dt_timezone.utc).isoformat()
 
-    # CSV 파일 읽기
-    with open(csv_file_path, 'r', encoding='utf-8-sig') as csvfile:
+    # CSV 파일을 읽으면서 바로 JSON 파일에 기록
+    with open(csv_file_path, 'r', encoding='utf-8-sig') as csvfile, \
+            open(output_json_path, 'w', encoding='utf-8') as jsonfile:
         reader = csv.DictReader(csvfile)
-
-        for idx, row in enumerate(reader, start=start_pk):
-            # Django fixtures 형식으로 변환
-            fixture = {
-                "model": "events.Event",
-                "pk": idx,
-                "fields": {
-                    "name": row['title'].strip(),
-                    "description": row['description'].strip(),
-                    "category": row['category'].strip(),
-                    "location": row['location'].strip(),
-                    "address": row['address'].strip(),
-                    "latitude": float(row['latitude']) if row['latitude'] else None,
-                    "longitude": float(row['longitude']) if row['longitude'] else None,
-                    "start_date": excel_date_to_iso(row['start_date']),
-                    "end_date": excel_date_to_iso(row['end_date']),
-                    "poster_image": row['poster_image'].strip(),
-                    "website_url": row['website_url'].strip() if row['website_url'] else "",
-                    "created_at": now,
-                    "updated_at": now,
-                }
-            }
-
-            fixtures.append(fixture)
-
-    # JSON 파일로 저장
-    with open(output_json_path, 'w', encoding='utf-8') as jsonfile:
-        json.dump(fixtures, jsonfile, ensure_ascii=False, indent=2)
+        count = write_fixtures(iter_fixtures(reader, start_pk, now), jsonfile, output_format)
 
     print(f"Conversion completed!")
     print(f"Input file: {csv_file_path}")
-    print(f"Output file: {output_json_path}")
-    print(f"Total events: {len(fixtures)}")
-    print(f"PK range: {start_pk} ~ {start_pk + len(fixtures) - 1}")
+    print(f"Output file: {output_json_path} ({output_format})")
+    print(f"Total events: {count}")
+    print(f"PK range: {start_pk} ~ {start_pk + count - 1}")
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='CSV -> Django fixtures 변환')
+    parser.add_argument('--input', default='scripts/Mokkoji_events_1.csv', help='입력 CSV 파일 경로')
+    parser.add_argument('--output', default='fixtures/mokkoji_events.json', help='출력 파일 경로')
+    parser.add_argument('--start-pk', type=int, default=1, help='시작 Primary Key')
+    parser.add_argument('--format', choices=['json', 'ndjson'], default='json', help='출력 형식')
+    args = parser.parse_args()
+
     # CSV → JSON 변환
     csv_to_fixtures(
-        csv_file_path='scripts/Mokkoji_events_1.csv',
-        output_json_path='fixtures/mokkoji_events.json',
-        start_pk=1
+        csv_file_path=args.input,
+        output_json_path=args.output,
+        start_pk=args.start_pk,
+        output_format=args.format,
     )
@@ -6,11 +6,23 @@ python manage.py fix_duplicate_emails || echo "No duplicates or command not avai
 echo "Running migrations..."
 python manage.py migrate
 
-echo "Clearing existing events..."
-python manage.py shell -c "from events.models import Event; Event.objects.all().delete(); print('Events cleared')" 2>/dev/null || echo "No events to clear"
+echo "Seeding event catalog (skipped if fixture unchanged)..."
+python manage.py seed_events fixtures/mokkoji_events.json
 
-echo "Loading event fixtures..."
-python manage.py loaddata fixtures/mokkoji_events.json --verbosity 2
+# 워커와 Gunicorn 중 하나라도 종료되면 나머지를 정리하고 실패로 종료 -> 플랫폼이 컨테이너를 재시작
+# (워커가 죽은 채로 웹만 살아 있으면 알림/PDF 리포트 대기열이 조용히 쌓임)
+trap 'kill $(jobs -p) 2>/dev/null' EXIT
+
+echo "Starting notification worker..."
+python manage.py process_notification_outbox &
+
+echo "Starting report worker..."
+python manage.py process_report_queue &
 
 echo "Starting Gunicorn..."
-gunicorn config.wsgi:application --bind 0.0.0.0:$PORT --workers 2
+gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:$PORT --workers 2 &
+
+wait -n
+status=$?
+echo "A process exited (status $status), stopping the container..."
+exit $(( status == 0 ? 1 : status ))